@@ -24,17 +24,15 @@ from missing_file_check.config.models import (
 )
 from missing_file_check.scanner.checker import MissingFileChecker
 from missing_file_check.analyzers.pipeline import create_default_pipeline
-from missing_file_check.storage.database import init_db, session_scope
-from missing_file_check.storage.repository import MissingFileRepository
 from missing_file_check.storage.report_generator import ReportGenerator
 from missing_file_check.storage.object_storage import PlaceholderObjectStorage
 
-# Load environment variables
-load_dotenv()
-
 
 def main():
     """Run complete Phase 3 workflow."""
+    # Load environment variables
+    load_dotenv()
+
     print("=" * 70)
     print("Missing File Check - Phase 3 Complete Example")
     print("=" * 70)
@@ -114,8 +112,9 @@ def main():
 
     pipeline.run(result, analysis_context)
     print(f"   ✓ Analysis completed")
-    print(f"   Ownership filled: {sum(1 for f in result.missing_files if f.ownership)}")
-    print(f"   Reasons filled: {sum(1 for f in result.missing_files if f.miss_reason)}")
+    counts = result.counts()
+    print(f"   Ownership filled: {counts['ownership_filled']}")
+    print(f"   Reasons filled: {counts['reason_filled']}")
 
     # Step 4: Generate reports
     print("\n📄 Step 4: Generate Reports")
@@ -128,12 +127,13 @@ def main():
     html_path = reports_dir / f"{config.task_id}_report.html"
     json_path = reports_dir / f"{config.task_id}_report.json"
 
-    html_content, json_content = generator.generate_both(result, html_path, json_path)
+    html_size = generator.generate_html_stream(result, html_path)
+    json_size = generator.generate_json_stream(result, json_path)
 
     print(f"   ✓ HTML report: {html_path}")
     print(f"   ✓ JSON report: {json_path}")
-    print(f"   HTML size: {len(html_content) // 1024} KB")
-    print(f"   JSON size: {len(json_content) // 1024} KB")
+    print(f"   HTML size: {html_size // 1024} KB")
+    print(f"   JSON size: {json_size // 1024} KB")
 
     # Step 5: Upload to object storage (placeholder)
     print("\n☁️  Step 5: Upload to Object Storage (Placeholder)")
@@ -151,6 +151,9 @@ def main():
     # Step 6: Save to database (optional, if DB configured)
     if os.getenv("DB_HOST"):
         print("\n💾 Step 6: Save to Database")
+        from missing_file_check.storage.database import init_db, session_scope
+        from missing_file_check.storage.repository import MissingFileRepository
+
         try:
             # Initialize database
             init_db()
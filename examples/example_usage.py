@@ -39,6 +39,7 @@ class MockAdapter(ProjectAdapter):
         project_id = self.project_config.project_id
 
         # Mock build info
+        now = datetime.now()
         build_info = BuildInfo(
             build_no="BUILD-001",
             build_status="success",
@@ -46,8 +47,8 @@ class MockAdapter(ProjectAdapter):
             commit_id=commit_id or "abc123",
             b_version=b_version or "1.0.0",
             build_url="https://example.com/build/001",
-            start_time=datetime.now(),
-            end_time=datetime.now(),
+            start_time=now,
+            end_time=now,
         )
 
         # Mock file lists based on project type
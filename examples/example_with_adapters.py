@@ -113,10 +113,11 @@ def main():
     print(f"      └─ Baseline: {result.statistics.baseline_file_count}")
 
     # Group files by status
-    missed_files = [f for f in result.missing_files if f.status == "missed"]
-    shielded_files = [f for f in result.missing_files if f.status == "shielded"]
-    remapped_files = [f for f in result.missing_files if f.status == "remapped"]
-    failed_files = [f for f in result.missing_files if f.status == "failed"]
+    buckets = result.by_status()
+    missed_files = buckets["missed"]
+    shielded_files = buckets["shielded"]
+    remapped_files = buckets["remapped"]
+    failed_files = buckets["failed"]
 
     # Display missed files
     if missed_files:
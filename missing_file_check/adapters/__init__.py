@@ -7,10 +7,8 @@ from missing_file_check.adapters.base import (
     ProjectScanResult,
 )
 
-# Import adapters to trigger auto-registration
-from missing_file_check.adapters import api_adapter
-from missing_file_check.adapters import local_adapter
-from missing_file_check.adapters import ftp_adapter
+# Concrete adapters (API, FTP, Local) are imported by AdapterFactory the
+# first time their project type is requested
 
 __all__ = [
     "ProjectAdapter",
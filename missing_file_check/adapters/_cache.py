@@ -0,0 +1,131 @@
+"""
+Caches shared by the adapters.
+
+Scan results of file-backed adapters are keyed by the package version and
+project ID plus the path, mtime and size of every source file, so any change
+to the underlying files or an upgrade invalidates the entry. HTTP responses
+of the API adapter are stored with their ETag / Last-Modified validators for
+conditional requests.
+
+Entries are kept in memory for the lifetime of the process and, when
+MISSING_FILE_CACHE_DIR is set, pickled to disk so repeat runs can skip
+parsing unchanged baselines altogether.
+"""
+
+import os
+from dataclasses import replace
+from pathlib import Path
+from typing import Optional
+
+from missing_file_check import __version__
+from missing_file_check.adapters.base import ProjectScanResult
+from missing_file_check.utils.cache import LRUCache, load_pickle, save_pickle
+
+# Maximum number of scan results / HTTP responses kept in memory
+MEMORY_CACHE_SIZE = 64
+RESPONSE_CACHE_SIZE = 256
+
+_memory = LRUCache(MEMORY_CACHE_SIZE)
+_responses = LRUCache(RESPONSE_CACHE_SIZE)
+
+
+def cache_key(project_id: str, *paths: Path) -> Optional[tuple]:
+    """
+    Build a cache key from the package version, project ID and source file
+    metadata.
+
+    Args:
+        project_id: Configured project ID
+        *paths: Source files the scan result is read from
+
+    Returns:
+        Hashable key, or None if any file cannot be stat'ed
+    """
+    # The package version guards against unpickling stale model layouts
+    parts = [__version__, project_id]
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        parts.append((os.path.abspath(path), st.st_mtime_ns, st.st_size))
+    return tuple(parts)
+
+
+def load_cached(key: Optional[tuple]) -> Optional[ProjectScanResult]:
+    """
+    Look up a cached scan result.
+
+    Args:
+        key: Key from cache_key(); None always misses
+
+    Returns:
+        A copy of the cached result, or None on a miss
+    """
+    if key is None:
+        return None
+
+    result = _memory.get(key)
+    if result is None:
+        result = load_pickle(key)
+        if result is None:
+            return None
+        _memory.put(key, result)
+
+    # Hand out a fresh list so callers cannot corrupt the cached entry
+    return replace(result, files=list(result.files))
+
+
+def store_cached(key: Optional[tuple], result: ProjectScanResult):
+    """
+    Store a scan result in the memory cache and, if enabled, on disk.
+
+    Args:
+        key: Key from cache_key(); None disables caching
+        result: Scan result to cache
+    """
+    if key is None:
+        return
+
+    result = replace(result, files=list(result.files))
+    _memory.put(key, result)
+    save_pickle(key, result)
+
+
+def load_response(key: tuple) -> Optional[dict]:
+    """
+    Look up a cached HTTP response.
+
+    Args:
+        key: Hashable request key (method, URL, params, credentials)
+
+    Returns:
+        Dict with "etag", "last_modified" and "body", or None on a miss
+    """
+    key = ("response",) + key
+    entry = _responses.get(key)
+    if entry is None:
+        entry = load_pickle(key)
+        if entry is None:
+            return None
+        _responses.put(key, entry)
+    return entry
+
+
+def store_response(key: tuple, entry: dict):
+    """
+    Store an HTTP response in the memory cache and, if enabled, on disk.
+
+    Args:
+        key: Hashable request key (method, URL, params, credentials)
+        entry: Dict with "etag", "last_modified" and "body"
+    """
+    key = ("response",) + key
+    _responses.put(key, entry)
+    save_pickle(key, entry)
+
+
+def clear_cache():
+    """Drop all in-memory cache entries."""
+    _memory.clear()
+    _responses.clear()
@@ -4,14 +4,20 @@ API adapter for fetching project scan data from REST API endpoints.
 Supports both TARGET_PROJECT_API and BASELINE_PROJECT_API types.
 """
 
-import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
+from missing_file_check.adapters._cache import load_response, store_response
 from missing_file_check.adapters.base import (
+    parse_datetime,
     ProjectAdapter,
     BuildInfo,
     FileEntry,
@@ -20,6 +26,12 @@ from missing_file_check.adapters.base import (
 )
 from missing_file_check.config.models import ProjectType
 
+# Headers shared by every request; the session adds them to each call
+DEFAULT_HEADERS = {"Content-Type": "application/json"}
+
+# Server errors worth retrying; 429/503 replies may carry Retry-After
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
 
 class APIProjectAdapter(ProjectAdapter):
     """
@@ -28,10 +40,13 @@ class APIProjectAdapter(ProjectAdapter):
     Fetches scan results from REST API endpoints with support for:
     - Latest successful build queries
     - commit_id and b_version filtering
-    - Pagination for large file lists
+    - Concurrent pagination for large file lists
     - Retry logic for transient failures
     """
 
+    # Files requested per page of /api/v1/scan-files
+    FILE_PAGE_SIZE = 1000
+
     def __init__(self, project_config):
         """
         Initialize API adapter.
@@ -51,12 +66,62 @@ class APIProjectAdapter(ProjectAdapter):
         self.timeout = conn.get("timeout", 30)
         self.max_retries = conn.get("max_retries", 3)
         self.retry_delay = conn.get("retry_delay", 1)
+        # Upper bound on concurrent page requests when fetching file lists
+        self.page_workers = conn.get("page_workers", 8)
+        # Server can embed the first file list page in the build query
+        self.supports_include_files = conn.get("supports_include_files", False)
+
+        # Identifies the credentials in response cache keys without storing
+        # the token itself
+        self._token_digest = hashlib.sha256(self.token.encode("utf-8")).hexdigest()
+
+        # Persistent session so builds, pages and retries reuse keep-alive
+        # connections instead of paying a TCP/TLS handshake per request.
+        # Its default Accept-Encoding already requests gzip, and also br
+        # once brotli is installed (the "compression" extra)
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        self.session.headers["Authorization"] = f"Bearer {self.token}"
+        http_adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(10, self.page_workers),
+            max_retries=self._build_retry(),
+        )
+        self.session.mount("http://", http_adapter)
+        self.session.mount("https://", http_adapter)
 
-        # Prepare headers
-        self.headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-        }
+    def _build_retry(self) -> Retry:
+        """
+        Build the retry policy mounted on the session.
+
+        max_retries counts attempts, as before, so it maps to one fewer
+        urllib3 retry. Backoff is exponential in retry_delay with jitter,
+        and a server-supplied Retry-After header takes precedence. Once
+        retries are exhausted the last response is returned so
+        raise_for_status() reports the real HTTP error.
+
+        Returns:
+            urllib3 Retry configuration
+        """
+        return Retry(
+            total=max(0, self.max_retries - 1),
+            backoff_factor=self.retry_delay,
+            backoff_jitter=0.2,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+
+    def close(self):
+        """Close pooled HTTP connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
     def fetch_files(
         self, commit_id: Optional[str] = None, b_version: Optional[str] = None
@@ -75,11 +140,11 @@ class APIProjectAdapter(ProjectAdapter):
             AdapterError: If API request fails or data is invalid
         """
         try:
-            # Step 1: Query for build task
-            build_info = self._fetch_build_info(commit_id, b_version)
+            # Step 1: Query for build task (and first file page, if supported)
+            build_info, first_page = self._fetch_build_info(commit_id, b_version)
 
             # Step 2: Fetch file list for the build
-            files = self._fetch_file_list(build_info.build_no)
+            files = self._fetch_file_list(build_info.build_no, first_page)
 
             return ProjectScanResult(
                 project_id=self.project_config.project_id,
@@ -96,6 +161,11 @@ class APIProjectAdapter(ProjectAdapter):
                 f"Invalid API response format for project {self.project_config.project_id}: "
                 f"missing field {e}"
             )
+        except orjson.JSONDecodeError as e:
+            raise AdapterError(
+                f"Invalid API response format for project {self.project_config.project_id}: "
+                f"{e}"
+            )
         except Exception as e:
             raise AdapterError(
                 f"Unexpected error fetching project {self.project_config.project_id}: {e}"
@@ -103,18 +173,21 @@ class APIProjectAdapter(ProjectAdapter):
 
     def _fetch_build_info(
         self, commit_id: Optional[str], b_version: Optional[str]
-    ) -> BuildInfo:
+    ) -> Tuple[BuildInfo, Optional[Dict]]:
         """
         Fetch build information from API.
 
-        Query for latest successful build matching filters.
+        Query for latest successful build matching filters. With
+        supports_include_files the same request also asks for the first
+        file list page (include=files), saving one round trip.
 
         Args:
             commit_id: Optional commit ID filter
             b_version: Optional version filter
 
         Returns:
-            BuildInfo for the selected build
+            Tuple of (BuildInfo for the selected build, embedded first file
+            page in /api/v1/scan-files response format or None)
 
         Raises:
             AdapterError: If no matching build found
@@ -132,6 +205,9 @@ class APIProjectAdapter(ProjectAdapter):
             params["commit_id"] = commit_id
         if b_version:
             params["b_version"] = b_version
+        if self.supports_include_files:
+            params["include"] = "files"
+            params["files_page_size"] = self.FILE_PAGE_SIZE
 
         # Make API request
         url = urljoin(self.api_endpoint, "/api/v1/builds")
@@ -154,7 +230,7 @@ class APIProjectAdapter(ProjectAdapter):
         build_data = builds[0]
 
         # Parse build info
-        return BuildInfo(
+        build_info = BuildInfo(
             build_no=build_data["build_no"],
             build_status=build_data["build_status"],
             branch=build_data["branch"],
@@ -165,14 +241,22 @@ class APIProjectAdapter(ProjectAdapter):
             end_time=self._parse_datetime(build_data["end_time"]),
         )
 
-    def _fetch_file_list(self, build_no: str) -> List[FileEntry]:
+        first_page = build_data.get("files") if self.supports_include_files else None
+        return build_info, first_page
+
+    def _fetch_file_list(
+        self, build_no: str, first_page: Optional[Dict] = None
+    ) -> List[FileEntry]:
         """
         Fetch file list for a build.
 
-        Handles pagination for large file lists.
+        Handles pagination for large file lists: the first page reports the
+        total page count, then the remaining pages are requested concurrently
+        (at most page_workers at a time) and concatenated in page order.
 
         Args:
             build_no: Build number
+            first_page: Page 1 already returned by the build query, if any
 
         Returns:
             List of FileEntry objects
@@ -180,25 +264,31 @@ class APIProjectAdapter(ProjectAdapter):
         Raises:
             AdapterError: If API request fails
         """
-        all_files = []
-        page = 1
-        page_size = 1000
+        url = urljoin(self.api_endpoint, "/api/v1/scan-files")
 
-        while True:
-            # Build query parameters
+        def fetch_page(page: int) -> Dict:
             params = {
                 "build_no": build_no,
                 "page": page,
-                "page_size": page_size,
+                "page_size": self.FILE_PAGE_SIZE,
             }
+            return self._make_request("GET", url, params=params)
+
+        first = first_page if first_page is not None else fetch_page(1)
+        responses = [first]
 
-            # Make API request
-            url = urljoin(self.api_endpoint, "/api/v1/scan-files")
-            response = self._make_request("GET", url, params=params)
+        # Check if there are more pages
+        total_pages = first.get("pagination", {}).get("total_pages", 1)
+        if total_pages > 1:
+            remaining = range(2, total_pages + 1)
+            workers = max(1, min(self.page_workers, len(remaining)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                responses.extend(executor.map(fetch_page, remaining))
 
-            # Parse files
-            files_data = response.get("data", [])
-            for file_data in files_data:
+        # Parse files
+        all_files = []
+        for response in responses:
+            for file_data in response.get("data", []):
                 all_files.append(
                     FileEntry(
                         path=file_data["file_path"],
@@ -206,15 +296,6 @@ class APIProjectAdapter(ProjectAdapter):
                     )
                 )
 
-            # Check if there are more pages
-            pagination = response.get("pagination", {})
-            total_pages = pagination.get("total_pages", 1)
-
-            if page >= total_pages:
-                break
-
-            page += 1
-
         return all_files
 
     def _make_request(
@@ -227,6 +308,10 @@ class APIProjectAdapter(ProjectAdapter):
         """
         Make HTTP request with retry logic.
 
+        GET responses carrying an ETag or Last-Modified header are cached;
+        repeated requests are sent as conditional GETs and a 304 Not
+        Modified reply is served from the cache without a body transfer.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             url: Request URL
@@ -237,48 +322,58 @@ class APIProjectAdapter(ProjectAdapter):
             Parsed JSON response
 
         Raises:
-            requests.RequestException: If all retries fail
+            requests.RequestException: If the request fails after retries
         """
-        last_exception = None
-
-        for attempt in range(self.max_retries):
-            try:
-                response = requests.request(
-                    method=method,
-                    url=url,
-                    headers=self.headers,
-                    params=params,
-                    json=json,
-                    timeout=self.timeout,
-                )
-
-                # Check for HTTP errors
-                response.raise_for_status()
+        cache_key = None
+        cached = None
+        headers = {}
+        if method == "GET":
+            cache_key = (
+                url,
+                tuple(sorted((params or {}).items())),
+                self._token_digest,
+            )
+            cached = load_response(cache_key)
+            if cached is not None:
+                if cached["etag"]:
+                    headers["If-None-Match"] = cached["etag"]
+                if cached["last_modified"]:
+                    headers["If-Modified-Since"] = cached["last_modified"]
+
+        # Transient failures are retried by the session's urllib3 policy
+        response = self.session.request(
+            method=method,
+            url=url,
+            headers=headers,
+            params=params,
+            json=json,
+            timeout=self.timeout,
+        )
 
-                # Parse JSON
-                return response.json()
+        if response.status_code == 304 and cached is not None:
+            return cached["body"]
 
-            except requests.RequestException as e:
-                last_exception = e
+        # Check for HTTP errors
+        response.raise_for_status()
 
-                # Don't retry on client errors (4xx)
-                if hasattr(e, "response") and e.response is not None:
-                    if 400 <= e.response.status_code < 500:
-                        raise
+        # Parse JSON straight from the raw bytes
+        body = orjson.loads(response.content)
 
-                # Retry on server errors (5xx) and network errors
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))
-                    continue
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if cache_key is not None and (etag or last_modified):
+            store_response(
+                cache_key,
+                {"etag": etag, "last_modified": last_modified, "body": body},
+            )
 
-        # All retries exhausted
-        raise last_exception
+        return body
 
     def _parse_datetime(self, dt_str: str) -> datetime:
         """
         Parse datetime string from API response.
 
-        Supports multiple formats.
+        Supports ISO 8601, the common non-ISO layouts and Unix timestamps.
 
         Args:
             dt_str: Datetime string
@@ -286,17 +381,10 @@ class APIProjectAdapter(ProjectAdapter):
         Returns:
             Parsed datetime object
         """
-        # Try ISO format first
-        for fmt in [
-            "%Y-%m-%dT%H:%M:%S.%fZ",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d %H:%M:%S.%f",
-        ]:
-            try:
-                return datetime.strptime(dt_str, fmt)
-            except ValueError:
-                continue
+        try:
+            return parse_datetime(dt_str)
+        except ValueError:
+            pass
 
         # Fallback: try parsing as timestamp
         try:
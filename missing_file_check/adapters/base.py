@@ -6,11 +6,52 @@ Defines the unified interface for fetching project scan data from various source
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional
 
+# Non-ISO layouts still accepted after the datetime.fromisoformat fast path
+DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S",
+)
 
-@dataclass
+
+def parse_datetime(dt_str: str) -> datetime:
+    """
+    Parse a build timestamp shared by all adapters.
+
+    ISO 8601 strings go through the C-implemented datetime.fromisoformat.
+    A trailing "Z" is dropped and explicit offsets are converted to UTC, so
+    the result is always a naive datetime comparable with the others.
+
+    Args:
+        dt_str: Datetime string
+
+    Returns:
+        Parsed naive datetime
+
+    Raises:
+        ValueError: If the string matches no supported format
+    """
+    if not isinstance(dt_str, str):
+        raise ValueError(f"Unable to parse datetime: {dt_str!r}")
+
+    try:
+        parsed = datetime.fromisoformat(dt_str.removesuffix("Z"))
+    except ValueError:
+        for fmt in DATETIME_FORMATS:
+            try:
+                return datetime.strptime(dt_str, fmt)
+            except ValueError:
+                continue
+        raise ValueError(f"Unable to parse datetime: {dt_str}")
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+@dataclass(slots=True, frozen=True)
 class BuildInfo:
     """Build task information containing metadata about the scan execution."""
 
@@ -24,7 +65,7 @@ class BuildInfo:
     end_time: datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FileEntry:
     """Individual file entry in a scan result."""
 
@@ -32,7 +73,7 @@ class FileEntry:
     status: str  # "success" / "failed"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProjectScanResult:
     """Complete scan result for a project including build info and file list."""
 
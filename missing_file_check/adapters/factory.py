@@ -4,17 +4,48 @@ Adapter factory for creating appropriate adapters based on project type.
 Uses registry pattern to support extensibility.
 """
 
-from typing import Dict, Type
-
-from missing_file_check.adapters.base import ProjectAdapter, AdapterError
+import importlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Hashable, List, Optional, Type, Union
+
+from missing_file_check.adapters.base import (
+    ProjectAdapter,
+    ProjectScanResult,
+    AdapterError,
+)
 from missing_file_check.config.models import ProjectConfig, ProjectType
 
+# Modules providing the built-in adapters; imported on first use so that
+# e.g. local-only runs never load the HTTP or FTP client stacks
+_BUILTIN_ADAPTER_MODULES: Dict[ProjectType, str] = {
+    ProjectType.TARGET_PROJECT_API: "missing_file_check.adapters.api_adapter",
+    ProjectType.BASELINE_PROJECT_API: "missing_file_check.adapters.api_adapter",
+    ProjectType.FTP: "missing_file_check.adapters.ftp_adapter",
+    ProjectType.LOCAL: "missing_file_check.adapters.local_adapter",
+}
+
+
+def _freeze(value: Any) -> Hashable:
+    """Recursively convert dicts/lists into hashable tuples for cache keys."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
 
 class AdapterFactory:
     """Factory for creating project adapters based on configuration."""
 
     _registry: Dict[ProjectType, Type[ProjectAdapter]] = {}
 
+    # LRU cache of adapter instances keyed by configuration content
+    _cache: "OrderedDict[Hashable, ProjectAdapter]" = OrderedDict()
+    _cache_lock = threading.Lock()
+    cache_size = 256
+
     @classmethod
     def register(cls, project_type: ProjectType, adapter_class: Type[ProjectAdapter]):
         """
@@ -25,12 +56,17 @@ class AdapterFactory:
             adapter_class: Adapter class to register
         """
         cls._registry[project_type] = adapter_class
+        cls.clear_cache()
 
     @classmethod
     def create(cls, project_config: ProjectConfig) -> ProjectAdapter:
         """
         Create an adapter instance based on project configuration.
 
+        Adapters are cached by configuration content, so repeated scans of
+        the same project reuse one instance instead of re-parsing the
+        connection details.
+
         Args:
             project_config: Project configuration
 
@@ -40,15 +76,115 @@ class AdapterFactory:
         Raises:
             AdapterError: If project type is not supported
         """
-        adapter_class = cls._registry.get(project_config.project_type)
+        try:
+            adapter_class = cls._registry[project_config.project_type]
+        except KeyError:
+            adapter_class = cls._lazy_register(project_config.project_type)
+            if adapter_class is None:
+                raise AdapterError(
+                    "No adapter registered for project type: "
+                    f"{project_config.project_type}"
+                ) from None
+
+        key = cls._cache_key(project_config)
+        if key is None:
+            # Connection contains unhashable values, skip caching
+            return adapter_class(project_config)
+
+        with cls._cache_lock:
+            adapter = cls._cache.get(key)
+            if adapter is not None:
+                cls._cache.move_to_end(key)
+                return adapter
+
+        adapter = adapter_class(project_config)
+
+        with cls._cache_lock:
+            cls._cache[key] = adapter
+            if len(cls._cache) > cls.cache_size:
+                cls._cache.popitem(last=False)
+
+        return adapter
+
+    @classmethod
+    def fetch_all(
+        cls,
+        project_configs: List[ProjectConfig],
+        commit_id: Optional[str] = None,
+        b_version: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        parallel: bool = True,
+    ) -> List[Union[ProjectScanResult, AdapterError]]:
+        """
+        Create adapters and fetch all projects, concurrently by default.
 
-        if adapter_class is None:
-            raise AdapterError(
-                f"No adapter registered for project type: {project_config.project_type}"
-            )
+        Fetching is I/O-bound, so this is the preferred entry point whenever
+        several projects are needed at once. A failing project does not
+        cancel the others; its AdapterError is returned in its slot instead.
+
+        Args:
+            project_configs: Projects to fetch
+            commit_id: Optional commit ID filter passed to every adapter
+            b_version: Optional version filter passed to every adapter
+            max_workers: Maximum worker threads (None = executor default)
+            parallel: Fetch sequentially when False
+
+        Returns:
+            One ProjectScanResult or AdapterError per config, in input order
+        """
 
-        return adapter_class(project_config)
+        def fetch(project_config):
+            try:
+                return cls.create(project_config).fetch_files(commit_id, b_version)
+            except AdapterError as e:
+                return e
 
+        if not parallel or len(project_configs) <= 1:
+            return [fetch(config) for config in project_configs]
 
-# Note: Concrete adapters (API, FTP, Local) will register themselves
-# when imported in Phase 2
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fetch, project_configs))
+
+    @classmethod
+    def _lazy_register(
+        cls, project_type: ProjectType
+    ) -> Optional[Type[ProjectAdapter]]:
+        """
+        Import the built-in adapter module for a project type.
+
+        Adapter modules register themselves on import, so after importing
+        the registry lookup is retried.
+
+        Args:
+            project_type: ProjectType enum value
+
+        Returns:
+            Registered adapter class, or None if there is no built-in adapter
+        """
+        module_name = _BUILTIN_ADAPTER_MODULES.get(project_type)
+        if module_name is None:
+            return None
+
+        importlib.import_module(module_name)
+        return cls._registry.get(project_type)
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop all cached adapter instances."""
+        with cls._cache_lock:
+            cls._cache.clear()
+
+    @staticmethod
+    def _cache_key(project_config: ProjectConfig) -> Optional[Hashable]:
+        """Build a hashable cache key from the project configuration."""
+        key = (
+            project_config.project_type,
+            project_config.project_id,
+            project_config.project_name,
+            _freeze(project_config.connection),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
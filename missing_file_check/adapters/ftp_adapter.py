@@ -4,13 +4,17 @@ FTP adapter for downloading and parsing project scan data from FTP servers.
 Supports downloading scan result files from FTP servers and parsing them.
 """
 
-import io
+import fnmatch
 import json
+import tempfile
 from datetime import datetime
 from ftplib import FTP, error_perm
-from typing import List, Optional
+from typing import IO, Iterable, List, Optional, Tuple
+
+import orjson
 
 from missing_file_check.adapters.base import (
+    parse_datetime,
     ProjectAdapter,
     BuildInfo,
     FileEntry,
@@ -19,6 +23,17 @@ from missing_file_check.adapters.base import (
 )
 from missing_file_check.config.models import ProjectType
 
+try:
+    import ijson
+except ImportError:  # Optional dependency: pip install missing-file-cc[stream]
+    ijson = None
+
+# Downloads larger than this are spooled to a temporary file instead of memory
+DOWNLOAD_SPOOL_MAX_BYTES = 8 << 20
+
+# Parse errors that mark a downloaded scan file as invalid
+JSON_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson else ())
+
 
 class FTPProjectAdapter(ProjectAdapter):
     """
@@ -46,6 +61,8 @@ class FTPProjectAdapter(ProjectAdapter):
         self.port = conn.get("port", 21)
         self.timeout = conn.get("timeout", 30)
         self.file_pattern = conn.get("file_pattern", "*.json")
+        # Optional index listing {"filename", "commit_id", "b_version"} entries
+        self.index_file = conn.get("index_file", "index.json")
 
     def fetch_files(
         self, commit_id: Optional[str] = None, b_version: Optional[str] = None
@@ -64,18 +81,19 @@ class FTPProjectAdapter(ProjectAdapter):
             AdapterError: If FTP connection fails or file not found
         """
         ftp = None
+        scan_file = None
         try:
             # Connect to FTP server
             ftp = self._connect_ftp()
 
             # Find and download scan file
-            scan_file_content = self._download_scan_file(ftp, commit_id, b_version)
+            scan_file = self._download_scan_file(ftp, commit_id, b_version)
 
             # Parse scan result
-            data = json.loads(scan_file_content)
+            build_data, files_data = self._parse_scan_file(scan_file)
 
-            # Parse build info
-            build_data = data.get("build_info", {})
+            # Shared default for missing timestamps
+            now = datetime.now().isoformat()
             build_info = BuildInfo(
                 build_no=build_data.get("build_no", "unknown"),
                 build_status=build_data.get("build_status", "success"),
@@ -83,12 +101,8 @@ class FTPProjectAdapter(ProjectAdapter):
                 commit_id=build_data.get("commit_id", ""),
                 b_version=build_data.get("b_version", ""),
                 build_url=build_data.get("build_url", ""),
-                start_time=self._parse_datetime(
-                    build_data.get("start_time", datetime.now().isoformat())
-                ),
-                end_time=self._parse_datetime(
-                    build_data.get("end_time", datetime.now().isoformat())
-                ),
+                start_time=self._parse_datetime(build_data.get("start_time", now)),
+                end_time=self._parse_datetime(build_data.get("end_time", now)),
             )
 
             # Apply filters if specified
@@ -103,16 +117,12 @@ class FTPProjectAdapter(ProjectAdapter):
                     f"{self.project_config.project_id}"
                 )
 
-            # Parse file list
-            files_data = data.get("files", [])
+            # Parse file list (one type check per item, positional init)
             files = [
-                FileEntry(
-                    path=file_data["path"] if isinstance(file_data, dict) else file_data,
-                    status=file_data.get("status", "success")
-                    if isinstance(file_data, dict)
-                    else "success",
-                )
-                for file_data in files_data
+                FileEntry(item["path"], item.get("status", "success"))
+                if isinstance(item, dict)
+                else FileEntry(item, "success")
+                for item in files_data
             ]
 
             return ProjectScanResult(
@@ -125,7 +135,7 @@ class FTPProjectAdapter(ProjectAdapter):
             raise AdapterError(
                 f"FTP permission error for project {self.project_config.project_id}: {e}"
             )
-        except json.JSONDecodeError as e:
+        except JSON_ERRORS as e:
             raise AdapterError(
                 f"Invalid JSON in FTP file for project {self.project_config.project_id}: {e}"
             )
@@ -134,6 +144,8 @@ class FTPProjectAdapter(ProjectAdapter):
                 f"FTP error for project {self.project_config.project_id}: {e}"
             )
         finally:
+            if scan_file is not None:
+                scan_file.close()
             if ftp:
                 try:
                     ftp.quit()
@@ -160,7 +172,7 @@ class FTPProjectAdapter(ProjectAdapter):
 
     def _download_scan_file(
         self, ftp: FTP, commit_id: Optional[str], b_version: Optional[str]
-    ) -> str:
+    ) -> IO[bytes]:
         """
         Download scan file from FTP server.
 
@@ -170,7 +182,8 @@ class FTPProjectAdapter(ProjectAdapter):
             b_version: Optional version filter
 
         Returns:
-            File content as string
+            Binary file object positioned at the start of the scan file;
+            the caller is responsible for closing it
 
         Raises:
             AdapterError: If file not found or download fails
@@ -179,6 +192,13 @@ class FTPProjectAdapter(ProjectAdapter):
             # Change to base directory
             ftp.cwd(self.base_path)
 
+            # Without filters a single MLSD listing is enough to find the
+            # most recent file, saving the per-file MDTM round trips below
+            if not commit_id and not b_version:
+                newest = self._newest_by_mlsd(ftp)
+                if newest:
+                    return self._download_file(ftp, newest)
+
             # List files matching pattern
             files = []
             try:
@@ -189,6 +209,8 @@ class FTPProjectAdapter(ProjectAdapter):
                     f"No scan files found in {self.base_path} matching {self.file_pattern}"
                 )
 
+            # The index matches the default pattern but is not a scan file
+            files = [f for f in files if f != self.index_file]
             if not files:
                 raise AdapterError(
                     f"No scan files found in {self.base_path}"
@@ -213,22 +235,29 @@ class FTPProjectAdapter(ProjectAdapter):
                     file_info.sort(key=lambda x: x[1], reverse=True)
                     return self._download_file(ftp, file_info[0][0])
 
-            # If filters specified, search for matching file
-            for filename in files:
-                content = self._download_file(ftp, filename)
+            # If filters specified, search for matching file, trying the
+            # candidates named by the index or naming convention first
+            for filename in self._order_candidates(ftp, files, commit_id, b_version):
+                try:
+                    scan_file = self._download_file(ftp, filename)
+                except error_perm:
+                    # Removed or unreadable since the listing, try the next
+                    continue
                 try:
-                    data = json.loads(content)
-                    build_info = data.get("build_info", {})
+                    build_info = self._read_build_data(scan_file)
+                    scan_file.seek(0)
 
                     # Check filters
                     if commit_id and build_info.get("commit_id") == commit_id:
-                        return content
+                        return scan_file
                     if b_version and build_info.get("b_version") == b_version:
-                        return content
+                        return scan_file
 
-                except (json.JSONDecodeError, KeyError):
+                except JSON_ERRORS + (KeyError,):
                     # Skip invalid files
-                    continue
+                    pass
+
+                scan_file.close()
 
             # No matching file found
             filters = []
@@ -243,21 +272,180 @@ class FTPProjectAdapter(ProjectAdapter):
         except error_perm as e:
             raise AdapterError(f"FTP permission error accessing {self.base_path}: {e}")
 
-    def _download_file(self, ftp: FTP, filename: str) -> str:
+    def _newest_by_mlsd(self, ftp: FTP) -> Optional[str]:
+        """
+        Find the most recently modified scan file with one MLSD listing.
+
+        Args:
+            ftp: Connected FTP client, already in the base directory
+
+        Returns:
+            Name of the newest file matching file_pattern, or None if the
+            server does not support MLSD or reports no matching file
+        """
+        try:
+            entries = [
+                (name, facts["modify"])
+                for name, facts in ftp.mlsd(facts=["type", "modify"])
+                if facts.get("type", "file") == "file"
+                and "modify" in facts
+                and fnmatch.fnmatch(name, self.file_pattern)
+                and name != self.index_file
+            ]
+        except error_perm:
+            # MLSD not supported (500/502), fall back to NLST + MDTM
+            return None
+
+        if not entries:
+            return None
+
+        # MLSD modify facts are YYYYMMDDHHMMSS[.sss], so they sort as strings
+        return max(entries, key=lambda e: e[1])[0]
+
+    def _order_candidates(
+        self,
+        ftp: FTP,
+        files: List[str],
+        commit_id: Optional[str],
+        b_version: Optional[str],
+    ) -> List[str]:
+        """
+        Order scan files so the likely matches for the filters come first.
+
+        Candidates are resolved without downloading every scan file, from
+        the index file if present, otherwise from the naming convention
+        scan_<commit_id>_<b_version>_<timestamp>.json. All remaining files
+        follow, so servers using neither still find their match.
+
+        Args:
+            ftp: Connected FTP client
+            files: Scan files matching file_pattern
+            commit_id: Optional commit ID filter
+            b_version: Optional version filter
+
+        Returns:
+            Filenames to try in order, without duplicates or the index file
+        """
+        preferred = self._lookup_index(ftp, commit_id, b_version)
+
+        if not preferred:
+            patterns = []
+            if commit_id:
+                patterns.append(f"scan_{commit_id}_*.json")
+            if b_version:
+                patterns.append(f"scan_*_{b_version}_*.json")
+            for pattern in patterns:
+                try:
+                    preferred.extend(ftp.nlst(pattern))
+                except error_perm:
+                    # No files match this convention
+                    continue
+
+        # A stale index may name files that no longer exist; only files in
+        # the current listing are tried
+        listed = set(files)
+        preferred = [name for name in preferred if name in listed]
+        ordered = dict.fromkeys(preferred + list(files))
+        ordered.pop(self.index_file, None)
+        return list(ordered)
+
+    def _lookup_index(
+        self, ftp: FTP, commit_id: Optional[str], b_version: Optional[str]
+    ) -> List[str]:
+        """
+        Resolve filenames matching the filters from the index file.
+
+        Args:
+            ftp: Connected FTP client
+            commit_id: Optional commit ID filter
+            b_version: Optional version filter
+
+        Returns:
+            Matching filenames (empty if there is no usable index)
+        """
+        try:
+            with self._download_file(ftp, self.index_file) as index_file:
+                index = orjson.loads(index_file.read())
+        except (error_perm, json.JSONDecodeError):
+            return []
+
+        entries = index.get("scans") if isinstance(index, dict) else index
+        if not isinstance(entries, list):
+            return []
+
+        return [
+            entry["filename"]
+            for entry in entries
+            if isinstance(entry, dict)
+            and entry.get("filename")
+            and (
+                (commit_id and entry.get("commit_id") == commit_id)
+                or (b_version and entry.get("b_version") == b_version)
+            )
+        ]
+
+    def _download_file(self, ftp: FTP, filename: str) -> IO[bytes]:
         """
         Download a single file from FTP.
 
+        The body is kept in memory up to DOWNLOAD_SPOOL_MAX_BYTES and spooled
+        to a temporary file beyond that, so large scan files are never held
+        as both raw bytes and a decoded string.
+
         Args:
             ftp: Connected FTP client
             filename: File to download
 
         Returns:
-            File content as string
+            Binary file object positioned at the start of the content
         """
-        buffer = io.BytesIO()
-        ftp.retrbinary(f"RETR {filename}", buffer.write)
+        buffer = tempfile.SpooledTemporaryFile(max_size=DOWNLOAD_SPOOL_MAX_BYTES)
+        try:
+            ftp.retrbinary(f"RETR {filename}", buffer.write)
+        except BaseException:
+            buffer.close()
+            raise
         buffer.seek(0)
-        return buffer.read().decode("utf-8")
+        return buffer
+
+    @staticmethod
+    def _read_build_data(scan_file: IO[bytes]) -> dict:
+        """
+        Read only the build_info object of a scan file.
+
+        With ijson installed parsing stops right after build_info, so the
+        (usually much larger) file list is not parsed at all.
+
+        Args:
+            scan_file: Binary scan file object
+
+        Returns:
+            build_info dictionary (empty if absent)
+        """
+        if ijson is None:
+            return orjson.loads(scan_file.read()).get("build_info", {})
+        return next(ijson.items(scan_file, "build_info"), {})
+
+    def _parse_scan_file(self, scan_file: IO[bytes]) -> Tuple[dict, Iterable]:
+        """
+        Parse a scan file into build info and file list items.
+
+        With ijson installed the file list is returned as a lazy iterator
+        over "files.item", so no intermediate list of dicts is built.
+
+        Args:
+            scan_file: Binary scan file object positioned at the start
+
+        Returns:
+            Tuple of (build_info dict, iterable of file list items)
+        """
+        if ijson is None:
+            data = orjson.loads(scan_file.read())
+            return data.get("build_info", {}), data.get("files", [])
+
+        build_data = self._read_build_data(scan_file)
+        scan_file.seek(0)
+        return build_data, ijson.items(scan_file, "files.item")
 
     def _parse_datetime(self, dt_str: str) -> datetime:
         """
@@ -269,20 +457,11 @@ class FTPProjectAdapter(ProjectAdapter):
         Returns:
             Parsed datetime object
         """
-        # Try ISO format first
-        for fmt in [
-            "%Y-%m-%dT%H:%M:%S.%fZ",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d %H:%M:%S.%f",
-        ]:
-            try:
-                return datetime.strptime(dt_str, fmt)
-            except ValueError:
-                continue
-
-        # Fallback to current time
-        return datetime.now()
+        try:
+            return parse_datetime(dt_str)
+        except ValueError:
+            # Fallback to current time
+            return datetime.now()
 
 
 # Auto-register adapter with factory
@@ -7,12 +7,21 @@ Simplified design: Uses two separate files:
 """
 
 import csv
+import fnmatch
+import glob
 import json
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+import orjson
+
+from missing_file_check.adapters._cache import cache_key, load_cached, store_cached
 from missing_file_check.adapters.base import (
+    parse_datetime,
     ProjectAdapter,
     BuildInfo,
     FileEntry,
@@ -21,6 +30,95 @@ from missing_file_check.adapters.base import (
 )
 from missing_file_check.config.models import ProjectType
 
+try:
+    import ijson
+except ImportError:  # Optional dependency: pip install missing-file-cc[stream]
+    ijson = None
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # Optional dependency: pip install missing-file-cc[arrow]
+    pa = None
+    pa_csv = None
+
+# CSV file lists larger than this are parsed with pyarrow when available
+CSV_FAST_PATH_MIN_BYTES = 1 << 20
+
+# Accepted MISSING_FILE_CSV_ENGINE values; "auto" applies the size threshold
+CSV_ENGINES = ("auto", "pyarrow", "stdlib")
+
+# Parse errors reported as invalid JSON
+JSON_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson else ())
+
+# JSON file lists larger than this are stream-parsed with ijson when available
+JSON_STREAM_MIN_BYTES = 64 << 20
+
+# JSON files at least this large are decoded straight from a memory map
+JSON_MMAP_MIN_BYTES = 64 << 20
+
+# Accepted column names, in lookup priority order
+CSV_PATH_COLUMNS = ("file_path", "path", "Path")
+CSV_STATUS_COLUMNS = ("status", "Status")
+
+# Canonical instances of the status strings seen so far. File lists hold
+# only a handful of distinct statuses, so sharing one string object per
+# value instead of one per parsed row noticeably shrinks large scans.
+_status_cache: Dict[str, str] = {"success": "success", "failed": "failed"}
+
+
+def _load_json(path) -> Any:
+    """
+    Read and decode a JSON file in one shot.
+
+    The file is opened unbuffered and read with a single sized read, so
+    there is no text decoding or buffered layer. Files of at least
+    JSON_MMAP_MIN_BYTES are memory-mapped and decoded without an
+    intermediate bytes copy.
+
+    Args:
+        path: JSON file path
+
+    Returns:
+        Decoded JSON document
+
+    Raises:
+        orjson.JSONDecodeError: If the file is not valid JSON
+    """
+    with open(path, "rb", buffering=0) as f:
+        if os.fstat(f.fileno()).st_size >= JSON_MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        return orjson.loads(f.read())
+
+
+def _column_getter(
+    header: List[str], candidates: Tuple[str, ...]
+) -> Callable[[List[str]], Optional[str]]:
+    """
+    Build a row accessor for the first non-empty of several CSV columns.
+
+    Args:
+        header: CSV header row
+        candidates: Accepted column names, in lookup priority order
+
+    Returns:
+        Function mapping a csv.reader row to the column value, or None
+    """
+    indices = [header.index(name) for name in candidates if name in header]
+
+    if not indices:
+        return lambda row: None
+
+    if len(indices) == 1:
+        (index,) = indices
+        return lambda row: row[index] if index < len(row) else None
+
+    return lambda row: next(
+        (row[i] for i in indices if i < len(row) and row[i]), None
+    )
+
 
 class LocalProjectAdapter(ProjectAdapter):
     """
@@ -75,8 +173,9 @@ class LocalProjectAdapter(ProjectAdapter):
         if "build_info_file" in conn and "file_list_file" in conn:
             # New simplified two-file format
             self.use_new_format = True
-            self.build_info_file = Path(conn["build_info_file"])
-            self.file_list_file = Path(conn["file_list_file"])
+            # Kept as plain strings: they are only passed to os/open calls
+            self.build_info_file = os.fspath(conn["build_info_file"])
+            self.file_list_file = os.fspath(conn["file_list_file"])
         elif "base_path" in conn:
             # Old format with base_path and file_pattern
             self.use_new_format = False
@@ -114,7 +213,7 @@ class LocalProjectAdapter(ProjectAdapter):
             raise AdapterError(
                 f"File not found for project {self.project_config.project_id}: {e}"
             )
-        except json.JSONDecodeError as e:
+        except JSON_ERRORS as e:
             raise AdapterError(
                 f"Invalid JSON for project {self.project_config.project_id}: {e}"
             )
@@ -131,22 +230,43 @@ class LocalProjectAdapter(ProjectAdapter):
         self, commit_id: Optional[str] = None, b_version: Optional[str] = None
     ) -> ProjectScanResult:
         """Fetch using new two-file format."""
-        # Step 1: Load build info
-        build_info, project_id = self._load_build_info()
-
-        # Step 2: Validate filters
-        if commit_id and build_info.commit_id != commit_id:
-            raise AdapterError(
-                f"Build commit_id '{build_info.commit_id}' does not match "
-                f"requested '{commit_id}' for project {project_id}"
+        # Reuse a previous parse while both source files are unchanged
+        key = cache_key(
+            self.project_config.project_id, self.build_info_file, self.file_list_file
+        )
+        cached = load_cached(key)
+        if cached is not None:
+            self._validate_filters(
+                cached.build_info, cached.project_id, commit_id, b_version
             )
-        if b_version and build_info.b_version != b_version:
-            raise AdapterError(
-                f"Build b_version '{build_info.b_version}' does not match "
-                f"requested '{b_version}' for project {project_id}"
+            return cached
+
+        result = self._load_new_format(commit_id, b_version)
+        store_cached(key, result)
+        return result
+
+    def _load_new_format(
+        self, commit_id: Optional[str] = None, b_version: Optional[str] = None
+    ) -> ProjectScanResult:
+        """Read and parse both files of the two-file format."""
+        if not commit_id and not b_version:
+            # No filter can reject this build, so read the file list in a
+            # background thread while the build info is loaded and parsed
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                files_future = executor.submit(self._load_file_list)
+                build_info, project_id = self._load_build_info()
+                files = files_future.result()
+
+            return ProjectScanResult(
+                project_id=project_id,
+                build_info=build_info,
+                files=files,
             )
 
-        # Step 3: Load file list
+        # Selectors probe one commit ID at a time and most probes miss, so
+        # validate the build info before paying for the file list
+        build_info, project_id = self._load_build_info()
+        self._validate_filters(build_info, project_id, commit_id, b_version)
         files = self._load_file_list()
 
         return ProjectScanResult(
@@ -159,42 +279,188 @@ class LocalProjectAdapter(ProjectAdapter):
         self, commit_id: Optional[str] = None, b_version: Optional[str] = None
     ) -> ProjectScanResult:
         """Fetch using old single-file format with base_path."""
-        # Find matching file
-        import glob
+        # Find the newest matching file, or the newest one passing the filters
+        file_path = self._select_scan_file(commit_id, b_version)
 
-        pattern = str(self.base_path / self.file_pattern)
-        matching_files = glob.glob(pattern)
-
-        if not matching_files:
-            raise FileNotFoundError(f"No files matching pattern: {pattern}")
+        # Reuse a previous parse while the selected file is unchanged
+        key = cache_key(self.project_config.project_id, file_path)
+        result = load_cached(key)
+        if result is None:
+            result = self._load_scan_file(file_path)
+            store_cached(key, result)
 
-        # Use the first matching file
-        file_path = Path(matching_files[0])
+        # Validate filters
+        self._validate_filters(
+            result.build_info, result.project_id, commit_id, b_version
+        )
+        return result
 
+    def _load_scan_file(self, file_path: Path) -> ProjectScanResult:
+        """Read and parse a single-file scan result."""
         # Load JSON data
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _load_json(file_path)
 
         # Parse old format
         project_id = data.get("project_id", self.project_config.project_id)
         build_data = data.get("build_info", {})
 
-        build_info = BuildInfo(
-            build_no=build_data.get("build_no", "unknown"),
-            build_status=build_data.get("build_status", "success"),
-            branch=build_data.get("branch", "main"),
-            commit_id=build_data.get("commit_id", ""),
-            b_version=build_data.get("b_version", ""),
-            build_url=build_data.get("build_url", ""),
-            start_time=self._parse_datetime(
-                build_data.get("start_time", datetime.now().isoformat())
-            ),
-            end_time=self._parse_datetime(
-                build_data.get("end_time", datetime.now().isoformat())
-            ),
+        build_info = self._build_info_from_dict(build_data)
+
+        # Parse file list
+        files = self._to_file_entries(data.get("files", []))
+
+        return ProjectScanResult(
+            project_id=project_id,
+            build_info=build_info,
+            files=files,
         )
 
-        # Validate filters
+    def _find_scan_files(self, file_pattern: str) -> List[Path]:
+        """
+        Find the files in base_path matching a pattern, newest first.
+
+        Plain patterns are matched in a single os.scandir pass that reuses
+        each DirEntry's cached stat; patterns spanning subdirectories fall
+        back to glob.
+
+        Args:
+            file_pattern: Glob pattern relative to base_path
+
+        Returns:
+            Matching paths ordered by modification time, newest first
+
+        Raises:
+            FileNotFoundError: If no file matches
+        """
+        if "/" in file_pattern or os.sep in file_pattern:
+            candidates = [
+                (os.stat(path).st_mtime_ns, path)
+                for path in glob.glob(str(self.base_path / file_pattern))
+            ]
+        else:
+            # glob's "*" does not match dotfiles, keep that behaviour
+            skip_hidden = not file_pattern.startswith(".")
+            with os.scandir(self.base_path) as it:
+                candidates = [
+                    (entry.stat().st_mtime_ns, entry.path)
+                    for entry in it
+                    if not (skip_hidden and entry.name.startswith("."))
+                    and fnmatch.fnmatch(entry.name, file_pattern)
+                    and entry.is_file()
+                ]
+
+        if not candidates:
+            pattern = self.base_path / file_pattern
+            raise FileNotFoundError(f"No files matching pattern: {pattern}")
+
+        candidates.sort(reverse=True)
+        return [Path(path) for _, path in candidates]
+
+    def _select_scan_file(
+        self, commit_id: Optional[str], b_version: Optional[str]
+    ) -> Path:
+        """
+        Select the scan file to load for the requested filters.
+
+        Without filters the newest file is used. With filters the
+        candidates are searched newest first, reading only their
+        build_info, and the first one matching every filter wins. If none
+        matches, the newest file is returned so the usual filter
+        validation reports the mismatch.
+
+        file_pattern may name files by convention with {commit_id} and
+        {b_version} placeholders, e.g. "scan_{commit_id}_*.json". The
+        placeholders are filled with the filter values to narrow the
+        search first, and with "*" for the full candidate list.
+
+        Args:
+            commit_id: Optional commit ID filter
+            b_version: Optional version filter
+
+        Returns:
+            Path of the selected scan file
+        """
+        any_pattern = self._expand_pattern(None, None)
+
+        if commit_id or b_version:
+            narrowed = self._expand_pattern(commit_id, b_version)
+            if narrowed != any_pattern:
+                try:
+                    matching = self._find_scan_files(narrowed)
+                except FileNotFoundError:
+                    matching = []
+                file_path = self._first_matching(matching, commit_id, b_version)
+                if file_path is not None:
+                    return file_path
+
+        files = self._find_scan_files(any_pattern)
+        if not commit_id and not b_version:
+            return files[0]
+
+        return self._first_matching(files, commit_id, b_version) or files[0]
+
+    def _expand_pattern(
+        self, commit_id: Optional[str], b_version: Optional[str]
+    ) -> str:
+        """Fill the file_pattern placeholders, "*" for unset filters."""
+        return self.file_pattern.replace(
+            "{commit_id}", glob.escape(commit_id) if commit_id else "*"
+        ).replace("{b_version}", glob.escape(b_version) if b_version else "*")
+
+    def _first_matching(
+        self,
+        files: List[Path],
+        commit_id: Optional[str],
+        b_version: Optional[str],
+    ) -> Optional[Path]:
+        """Return the first file whose build_info passes every filter."""
+        for file_path in files:
+            try:
+                build_data = self._read_build_data(file_path)
+            except JSON_ERRORS:
+                continue  # Skip files that are not valid scan results
+
+            if (not commit_id or build_data.get("commit_id") == commit_id) and (
+                not b_version or build_data.get("b_version") == b_version
+            ):
+                return file_path
+
+        return None
+
+    @staticmethod
+    def _read_build_data(file_path: Path) -> dict:
+        """
+        Read only the build_info object of a single-file scan result.
+
+        With ijson installed parsing stops right after build_info, so the
+        file list of non-matching candidates is never parsed.
+
+        Args:
+            file_path: Scan result JSON file
+
+        Returns:
+            build_info dictionary (empty if absent)
+        """
+        if ijson is not None:
+            with open(file_path, "rb") as f:
+                return next(ijson.items(f, "build_info"), {})
+
+        data = _load_json(file_path)
+        return data.get("build_info", {}) if isinstance(data, dict) else {}
+
+    @staticmethod
+    def _validate_filters(
+        build_info: BuildInfo,
+        project_id: str,
+        commit_id: Optional[str],
+        b_version: Optional[str],
+    ):
+        """
+        Check the build against the requested commit_id / b_version.
+
+        Raises:
+            AdapterError: If a filter is given and does not match
+        """
         if commit_id and build_info.commit_id != commit_id:
             raise AdapterError(
                 f"Build commit_id '{build_info.commit_id}' does not match "
@@ -206,25 +472,6 @@ class LocalProjectAdapter(ProjectAdapter):
                 f"requested '{b_version}' for project {project_id}"
             )
 
-        # Parse file list
-        files = []
-        files_data = data.get("files", [])
-
-        for item in files_data:
-            if isinstance(item, str):
-                files.append(FileEntry(path=item, status="success"))
-            elif isinstance(item, dict):
-                path = item.get("path") or item.get("file_path")
-                status = item.get("status", "success")
-                if path:
-                    files.append(FileEntry(path=path, status=status))
-
-        return ProjectScanResult(
-            project_id=project_id,
-            build_info=build_info,
-            files=files,
-        )
-
     def _load_build_info(self) -> tuple:
         """
         Load build info from JSON file.
@@ -237,11 +484,10 @@ class LocalProjectAdapter(ProjectAdapter):
             json.JSONDecodeError: If invalid JSON
             KeyError: If required fields missing
         """
-        if not self.build_info_file.exists():
+        if not os.path.exists(self.build_info_file):
             raise FileNotFoundError(f"Build info file not found: {self.build_info_file}")
 
-        with open(self.build_info_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _load_json(self.build_info_file)
 
         # Extract project_id
         project_id = data.get("project_id", self.project_config.project_id)
@@ -249,23 +495,39 @@ class LocalProjectAdapter(ProjectAdapter):
         # Extract build_info
         build_data = data.get("build_info", data)  # Support both formats
 
-        build_info = BuildInfo(
+        build_info = self._build_info_from_dict(build_data)
+
+        return build_info, project_id
+
+    def _build_info_from_dict(self, build_data: dict) -> BuildInfo:
+        """
+        Build a BuildInfo from the build_info object of a scan file.
+
+        Only the known scalar fields are read. Missing timestamps default
+        to the current time directly instead of formatting and re-parsing
+        it.
+
+        Args:
+            build_data: Parsed build_info dictionary
+
+        Returns:
+            BuildInfo with defaults for missing fields
+        """
+        start_time = build_data.get("start_time")
+        end_time = build_data.get("end_time")
+        now = datetime.now() if start_time is None or end_time is None else None
+
+        return BuildInfo(
             build_no=build_data.get("build_no", "unknown"),
             build_status=build_data.get("build_status", "success"),
             branch=build_data.get("branch", "main"),
             commit_id=build_data.get("commit_id", ""),
             b_version=build_data.get("b_version", ""),
             build_url=build_data.get("build_url", ""),
-            start_time=self._parse_datetime(
-                build_data.get("start_time", datetime.now().isoformat())
-            ),
-            end_time=self._parse_datetime(
-                build_data.get("end_time", datetime.now().isoformat())
-            ),
+            start_time=now if start_time is None else self._parse_datetime(start_time),
+            end_time=now if end_time is None else self._parse_datetime(end_time),
         )
 
-        return build_info, project_id
-
     def _load_file_list(self) -> List[FileEntry]:
         """
         Load file list from CSV or JSON file.
@@ -277,71 +539,203 @@ class LocalProjectAdapter(ProjectAdapter):
             FileNotFoundError: If file not found
             ValueError: If file format not supported
         """
-        if not self.file_list_file.exists():
+        if not os.path.exists(self.file_list_file):
             raise FileNotFoundError(f"File list file not found: {self.file_list_file}")
 
         # Detect file format by extension
-        if self.file_list_file.suffix.lower() == ".csv":
+        suffix = os.path.splitext(self.file_list_file)[1]
+        if suffix.lower() == ".csv":
             return self._load_file_list_csv()
-        elif self.file_list_file.suffix.lower() == ".json":
+        elif suffix.lower() == ".json":
             return self._load_file_list_json()
         else:
             raise ValueError(
-                f"Unsupported file format: {self.file_list_file.suffix}. "
+                f"Unsupported file format: {suffix}. "
                 "Supported formats: .csv, .json"
             )
 
     def _load_file_list_csv(self) -> List[FileEntry]:
         """Load file list from CSV file."""
+        if self._use_arrow_csv():
+            return self._load_file_list_csv_arrow()
+
         files = []
 
         with open(self.file_list_file, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
+                return files
 
-            # Support both column names
-            for row in reader:
-                # Try different column name variations
-                path = row.get("file_path") or row.get("path") or row.get("Path")
-                status = row.get("status") or row.get("Status") or "success"
+            # Resolve column positions once instead of building a dict per row
+            get_path = _column_getter(header, CSV_PATH_COLUMNS)
+            get_status = _column_getter(header, CSV_STATUS_COLUMNS)
 
+            intern_status = _status_cache.setdefault
+            for row in reader:
+                path = get_path(row)
                 if not path:
                     continue  # Skip rows without path
 
-                files.append(FileEntry(path=path.strip(), status=status.strip()))
+                status = (get_status(row) or "success").strip()
+                files.append(
+                    FileEntry(path=path.strip(), status=intern_status(status, status))
+                )
 
         return files
 
+    def _use_arrow_csv(self) -> bool:
+        """
+        Decide whether the CSV file list is parsed with pyarrow.
+
+        MISSING_FILE_CSV_ENGINE selects the parser: "pyarrow" forces the
+        fast path, "stdlib" disables it and "auto" (default) uses pyarrow
+        for files of at least CSV_FAST_PATH_MIN_BYTES.
+
+        Returns:
+            True if pyarrow is installed and selected
+
+        Raises:
+            ValueError: If MISSING_FILE_CSV_ENGINE has an unknown value
+        """
+        engine = os.getenv("MISSING_FILE_CSV_ENGINE", "auto").strip().lower()
+        if engine not in CSV_ENGINES:
+            raise ValueError(
+                f"Invalid MISSING_FILE_CSV_ENGINE: {engine!r}. "
+                f"Supported values: {', '.join(CSV_ENGINES)}"
+            )
+
+        if pa_csv is None or engine == "stdlib":
+            return False
+        if engine == "pyarrow":
+            return True
+        return os.path.getsize(self.file_list_file) >= CSV_FAST_PATH_MIN_BYTES
+
+    def _load_file_list_csv_arrow(self) -> List[FileEntry]:
+        """
+        Load file list from CSV file using pyarrow's multithreaded C++ parser.
+
+        Mirrors _load_file_list_csv: the first non-empty path/status column
+        wins per row, values are stripped and rows without a path are skipped.
+        """
+        table = pa_csv.read_csv(
+            self.file_list_file,
+            read_options=pa_csv.ReadOptions(block_size=1 << 20),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={
+                    name: pa.string()
+                    for name in CSV_PATH_COLUMNS + CSV_STATUS_COLUMNS
+                },
+            ),
+        )
+
+        def first_non_empty(candidates):
+            columns = [
+                table.column(name).to_pylist()
+                for name in candidates
+                if name in table.column_names
+            ]
+            if not columns:
+                return [None] * table.num_rows
+            if len(columns) == 1:
+                return columns[0]
+            return [next(filter(None, values), None) for values in zip(*columns)]
+
+        paths = first_non_empty(CSV_PATH_COLUMNS)
+        statuses = first_non_empty(CSV_STATUS_COLUMNS)
+
+        intern_status = _status_cache.setdefault
+        return [
+            FileEntry(path=path.strip(), status=intern_status(status, status))
+            for path, status in zip(
+                paths, ((s or "success").strip() for s in statuses)
+            )
+            if path
+        ]
+
     def _load_file_list_json(self) -> List[FileEntry]:
         """Load file list from JSON file."""
-        with open(self.file_list_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if (
+            ijson is not None
+            and os.path.getsize(self.file_list_file) >= JSON_STREAM_MIN_BYTES
+        ):
+            return self._load_file_list_json_stream()
 
-        files = []
+        data = _load_json(self.file_list_file)
 
         # Support both list and dict formats
         if isinstance(data, list):
-            for item in data:
-                if isinstance(item, str):
-                    # Simple string list
-                    files.append(FileEntry(path=item, status="success"))
-                elif isinstance(item, dict):
-                    # List of objects
-                    path = item.get("path") or item.get("file_path")
-                    status = item.get("status", "success")
-                    if path:
-                        files.append(FileEntry(path=path, status=status))
+            return self._to_file_entries(data)
         elif isinstance(data, dict):
             # Dict format with "files" key
-            files_data = data.get("files", [])
-            for item in files_data:
-                if isinstance(item, str):
-                    files.append(FileEntry(path=item, status="success"))
-                elif isinstance(item, dict):
+            return self._to_file_entries(data.get("files", []))
+        return []
+
+    def _load_file_list_json_stream(self) -> List[FileEntry]:
+        """
+        Load file list from JSON file without materializing the document.
+
+        Items are converted to FileEntry as ijson yields them, so only one
+        item dict is alive at a time instead of the whole parsed array.
+        """
+        with open(self.file_list_file, "rb") as f:
+            # Peek the first significant byte to pick the list or dict layout
+            head = f.read(4096).lstrip()
+            while not head:
+                chunk = f.read(4096)
+                if not chunk:
+                    return []
+                head = chunk.lstrip()
+            f.seek(0)
+
+            prefix = "files.item" if head[:1] == b"{" else "item"
+            return self._to_file_entries(ijson.items(f, prefix))
+
+    @staticmethod
+    def _to_file_entries(items: Iterable) -> List[FileEntry]:
+        """
+        Convert file list items (plain paths or objects) to FileEntry.
+
+        Args:
+            items: Iterable of path strings or dicts with path/file_path
+                and optional status
+
+        Returns:
+            List of FileEntry objects; items without a path are skipped
+        """
+        intern_status = _status_cache.setdefault
+
+        # A file list comes from one producer, so its items almost always
+        # share one shape; a single C-level pass over the item types lets
+        # the conversion loops below skip per-item isinstance checks
+        if isinstance(items, list):
+            shapes = set(map(type, items))
+            if shapes == {str}:
+                return [FileEntry(path=item, status="success") for item in items]
+            if shapes == {dict}:
+                files = []
+                for item in items:
                     path = item.get("path") or item.get("file_path")
-                    status = item.get("status", "success")
                     if path:
-                        files.append(FileEntry(path=path, status=status))
+                        status = item.get("status", "success")
+                        files.append(
+                            FileEntry(path=path, status=intern_status(status, status))
+                        )
+                return files
 
+        files = []
+        for item in items:
+            if isinstance(item, str):
+                # Simple string list
+                files.append(FileEntry(path=item, status="success"))
+            elif isinstance(item, dict):
+                # List of objects
+                path = item.get("path") or item.get("file_path")
+                status = item.get("status", "success")
+                if path:
+                    files.append(
+                        FileEntry(path=path, status=intern_status(status, status))
+                    )
         return files
 
     def _parse_datetime(self, dt_str: str) -> datetime:
@@ -354,20 +748,11 @@ class LocalProjectAdapter(ProjectAdapter):
         Returns:
             Parsed datetime object
         """
-        # Try ISO format first
-        for fmt in [
-            "%Y-%m-%dT%H:%M:%S.%fZ",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d %H:%M:%S.%f",
-        ]:
-            try:
-                return datetime.strptime(dt_str, fmt)
-            except ValueError:
-                continue
-
-        # Fallback to current time
-        return datetime.now()
+        try:
+            return parse_datetime(dt_str)
+        except ValueError:
+            # Fallback to current time
+            return datetime.now()
 
 
 # Auto-register adapter with factory
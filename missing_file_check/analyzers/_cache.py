@@ -0,0 +1,152 @@
+"""
+Caches shared by the analyzers.
+
+Lookups that are expensive to repeat (e.g. ownership API calls) are kept
+per namespace - the analyzer name plus whatever scopes the answer, such as
+the API endpoint - in an in-memory LRU. Entries expire after a TTL so
+long-running processes pick up ownership changes; nothing is persisted
+across runs.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, Hashable, Iterable
+
+from missing_file_check.utils.cache import LRUCache
+
+# Default number of entries kept per namespace
+DEFAULT_CAPACITY = 65536
+
+# Default lifetime of an entry, in seconds
+DEFAULT_TTL = 3600
+
+_caches: Dict[Hashable, "AnalyzerCache"] = {}
+_caches_lock = threading.Lock()
+
+
+def _positive_int_env(name: str, default: int) -> int:
+    """
+    Read a positive integer setting from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset
+
+    Returns:
+        Configured value, or default if unset
+
+    Raises:
+        ValueError: If the variable is not a positive integer
+    """
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        raise ValueError(f"{name} must be a positive integer: {value!r}")
+    return number
+
+
+def cache_capacity() -> int:
+    """
+    Read the per-namespace capacity from the environment.
+
+    Returns:
+        MISSING_FILE_ANALYZER_CACHE_SIZE, or DEFAULT_CAPACITY if unset
+
+    Raises:
+        ValueError: If the variable is not a positive integer
+    """
+    return _positive_int_env("MISSING_FILE_ANALYZER_CACHE_SIZE", DEFAULT_CAPACITY)
+
+
+def cache_ttl() -> int:
+    """
+    Read the entry lifetime from the environment.
+
+    Returns:
+        MISSING_FILE_ANALYZER_CACHE_TTL in seconds, or DEFAULT_TTL if unset
+
+    Raises:
+        ValueError: If the variable is not a positive integer
+    """
+    return _positive_int_env("MISSING_FILE_ANALYZER_CACHE_TTL", DEFAULT_TTL)
+
+
+def get_cache(namespace: Hashable) -> "AnalyzerCache":
+    """
+    Get the process-wide cache for a namespace, creating it on first use.
+
+    Args:
+        namespace: Hashable namespace key
+
+    Returns:
+        Shared AnalyzerCache instance
+    """
+    with _caches_lock:
+        cache = _caches.get(namespace)
+        if cache is None:
+            cache = _caches[namespace] = AnalyzerCache(cache_capacity(), cache_ttl())
+        return cache
+
+
+def clear_cache():
+    """Drop all in-memory analyzer caches."""
+    with _caches_lock:
+        _caches.clear()
+
+
+class AnalyzerCache:
+    """In-memory LRU with per-entry expiry for one namespace."""
+
+    def __init__(self, capacity: int, ttl: float):
+        """
+        Initialize an empty cache.
+
+        Args:
+            capacity: Maximum number of entries kept
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self.ttl = ttl
+        # key -> (value, monotonic expiry time)
+        self._entries = LRUCache(capacity)
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, Any]:
+        """
+        Look up several keys at once, dropping expired entries.
+
+        Args:
+            keys: Keys to look up
+
+        Returns:
+            Dictionary with the keys that were found and are still valid
+        """
+        found = {}
+        now = time.monotonic()
+        entries = self._entries
+        for key in keys:
+            entry = entries.get(key)
+            if entry is None:
+                continue
+            if entry[1] <= now:
+                entries.pop(key)
+            else:
+                found[key] = entry[0]
+        return found
+
+    def put_many(self, values: Dict[Hashable, Any]):
+        """
+        Store several entries.
+
+        Args:
+            values: Entries to store
+        """
+        if not values:
+            return
+        expires = time.monotonic() + self.ttl
+        for key, value in values.items():
+            self._entries.put(key, (value, expires))
@@ -5,7 +5,7 @@ Defines the common interface for all analyzers.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Tuple
 
 from missing_file_check.scanner.checker import MissingFile
 
@@ -16,8 +16,17 @@ class Analyzer(ABC):
 
     Analyzers enrich MissingFile objects with additional information
     such as ownership, miss reason, and historical data.
+
+    Analyzers that read fields filled by another analyzer must list that
+    analyzer's name in depends_on; all others may run concurrently.
     """
 
+    # Stateless by default; subclasses declare their own slots
+    __slots__ = ()
+
+    # Names of analyzers that must finish before this one starts
+    depends_on: Tuple[str, ...] = ()
+
     @abstractmethod
     def analyze(self, missing_files: List[MissingFile], context: dict) -> None:
         """
@@ -34,6 +43,21 @@ class Analyzer(ABC):
         """
         pass
 
+    def applicable(self, missing_files: List[MissingFile]) -> bool:
+        """
+        Check whether analyze() would have anything to do.
+
+        The pipeline skips analyzers returning False. Subclasses that never
+        overwrite filled fields should override this with a cheaper check.
+
+        Args:
+            missing_files: List of MissingFile objects to analyze
+
+        Returns:
+            True if the analyzer should run
+        """
+        return bool(missing_files)
+
     @property
     @abstractmethod
     def name(self) -> str:
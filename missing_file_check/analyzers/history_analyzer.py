@@ -4,13 +4,14 @@ History analyzer for tracking first detection timestamps.
 Queries database history to determine when each file was first detected as missing.
 """
 
-from typing import List, Optional
-
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from missing_file_check.analyzers.base import Analyzer
 from missing_file_check.scanner.checker import MissingFile
-from missing_file_check.storage.repository import MissingFileRepository
+
+if TYPE_CHECKING:
+    from missing_file_check.storage.repository import MissingFileRepository
 
 
 class HistoryAnalyzer(Analyzer):
@@ -21,6 +22,8 @@ class HistoryAnalyzer(Analyzer):
     was first detected as missing.
     """
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "HistoryAnalyzer"
@@ -40,30 +43,38 @@ class HistoryAnalyzer(Analyzer):
             # No database session available, skip history analysis
             return
 
+        # Imported here so pipelines without a database never load SQLAlchemy
+        from missing_file_check.storage.repository import MissingFileRepository
+
         task_id = context.get("task_id")
         repository = MissingFileRepository(session)
 
-        for file in missing_files:
-            if not file.first_detected_at:  # Don't overwrite existing timestamp
-                file.first_detected_at = self._get_first_detected_at(
-                    repository, file.path, task_id
-                )
+        # Don't overwrite existing timestamps
+        pending = [file for file in missing_files if not file.first_detected_at]
+        if not pending:
+            return
+
+        first_detected = self._get_first_detected_at(
+            repository, [file.path for file in pending], task_id
+        )
+        for file in pending:
+            file.first_detected_at = first_detected.get(file.path)
 
     def _get_first_detected_at(
         self,
-        repository: MissingFileRepository,
-        file_path: str,
+        repository: "MissingFileRepository",
+        file_paths: List[str],
         task_id: Optional[int],
-    ):
+    ) -> Dict[str, datetime]:
         """
-        Get first detection timestamp for a file.
+        Get first detection timestamps for a batch of files.
 
         Args:
             repository: Repository instance
-            file_path: File path to query
+            file_paths: File paths to query
             task_id: Optional task ID for filtering
 
         Returns:
-            First detection datetime or None
+            Dictionary mapping file_path to first detection datetime
         """
-        return repository.get_first_detected_at(file_path, task_id)
+        return repository.get_first_detected_at_bulk(file_paths, task_id)
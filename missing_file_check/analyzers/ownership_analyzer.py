@@ -6,11 +6,21 @@ Current implementation uses placeholder/configuration values.
 """
 
 import os
-from typing import List
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
 
+from missing_file_check.analyzers._cache import get_cache
 from missing_file_check.analyzers.base import Analyzer
 from missing_file_check.scanner.checker import MissingFile
 
+# Team directory of paths laid out as "src/<team>/..."
+TEAM_PATH_PATTERN = re.compile(r"src/([^/]*)")
+
+# File paths per ownership API request, and concurrent requests
+OWNERSHIP_API_BATCH_SIZE = 500
+OWNERSHIP_API_WORKERS = 8
+
 
 class OwnershipAnalyzer(Analyzer):
     """
@@ -19,13 +29,16 @@ class OwnershipAnalyzer(Analyzer):
     Current implementation:
     1. Uses OWNERSHIP_DEFAULT from environment variable
     2. Can be extended to call internal API for real ownership data
+    3. Looks up all paths in concurrent batches when
+       OWNERSHIP_API_ENDPOINT is set; answers are cached per endpoint
 
     Future enhancement:
     - Call internal API with file paths
     - Map files to teams/owners
-    - Handle batch API calls for performance
     """
 
+    __slots__ = ("default_ownership", "api_endpoint", "api_token")
+
     @property
     def name(self) -> str:
         return "OwnershipAnalyzer"
@@ -39,6 +52,10 @@ class OwnershipAnalyzer(Analyzer):
         self.api_endpoint = os.getenv("OWNERSHIP_API_ENDPOINT")
         self.api_token = os.getenv("OWNERSHIP_API_TOKEN")
 
+    def applicable(self, missing_files: List[MissingFile]) -> bool:
+        """Run only if some file has no ownership yet."""
+        return any(not file.ownership for file in missing_files)
+
     def analyze(self, missing_files: List[MissingFile], context: dict) -> None:
         """
         Analyze file ownership.
@@ -50,14 +67,23 @@ class OwnershipAnalyzer(Analyzer):
         if not missing_files:
             return
 
-        # Current implementation: use default ownership
-        for file in missing_files:
-            if not file.ownership:  # Don't overwrite existing ownership
-                file.ownership = self._get_ownership(file.path)
+        # Don't overwrite existing ownership
+        pending = [file for file in missing_files if not file.ownership]
+        if not pending:
+            return
+
+        # Resolve all paths with a few batched API requests, not one per file
+        owners = {}
+        if self.api_endpoint:
+            owners = self._lookup_ownership([file.path for file in pending])
+
+        # Files unknown to the API fall back to path-derived ownership
+        for file in pending:
+            file.ownership = owners.get(file.path) or self._get_ownership(file.path)
 
     def _get_ownership(self, file_path: str) -> str:
         """
-        Get ownership for a file path.
+        Derive ownership for a file path the API did not answer for.
 
         Args:
             file_path: File path
@@ -65,20 +91,39 @@ class OwnershipAnalyzer(Analyzer):
         Returns:
             Ownership string (team/individual)
         """
-        # TODO: Implement API call to get real ownership
-        # For now, return default or parse from path
-
-        # Example: extract team from path pattern
+        # Extract team from path pattern
         # e.g., "src/team_alpha/module.py" -> "team_alpha"
-        parts = file_path.split("/")
-        if len(parts) >= 2 and parts[0] == "src":
-            return parts[1]  # Use directory name as team
+        m = TEAM_PATH_PATTERN.match(file_path)
+        if m:
+            return m.group(1)  # Use directory name as team
 
         return self.default_ownership
 
-    def _call_ownership_api(self, file_paths: List[str]) -> dict:
+    def _lookup_ownership(self, file_paths: List[str]) -> Dict[str, str]:
         """
-        Call internal API to get ownership information (placeholder).
+        Resolve ownership via the cache, asking the API only for misses.
+
+        Args:
+            file_paths: List of file paths
+
+        Returns:
+            Dictionary mapping file_path to ownership
+        """
+        cache = get_cache((self.name, self.api_endpoint))
+        owners = cache.get_many(file_paths)
+        misses = [path for path in file_paths if path not in owners]
+        if misses:
+            fetched = self._call_ownership_api_batched(misses)
+            cache.put_many(fetched)
+            owners.update(fetched)
+        return owners
+
+    def _call_ownership_api_batched(self, file_paths: List[str]) -> Dict[str, str]:
+        """
+        Resolve ownership for many paths in OWNERSHIP_API_BATCH_SIZE chunks.
+
+        Chunks are requested concurrently, so the whole batch costs about
+        one round trip instead of one per file.
 
         Args:
             file_paths: List of file paths
@@ -86,6 +131,33 @@ class OwnershipAnalyzer(Analyzer):
         Returns:
             Dictionary mapping file_path to ownership
         """
+        unique_paths = list(dict.fromkeys(file_paths))
+        chunks = [
+            unique_paths[start : start + OWNERSHIP_API_BATCH_SIZE]
+            for start in range(0, len(unique_paths), OWNERSHIP_API_BATCH_SIZE)
+        ]
+
+        if len(chunks) <= 1:
+            return self._call_ownership_api(unique_paths) if chunks else {}
+
+        owners = {}
+        workers = min(OWNERSHIP_API_WORKERS, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(self._call_ownership_api, chunks):
+                owners.update(result)
+        return owners
+
+    def _call_ownership_api(self, file_paths: List[str]) -> Dict[str, str]:
+        """
+        Call internal API to get ownership information (placeholder).
+
+        Args:
+            file_paths: List of file paths
+
+        Returns:
+            Dictionary mapping file_path to ownership; paths the API does
+            not know are left out
+        """
         # TODO: Implement actual API call
         # Example:
         # response = requests.post(
@@ -95,4 +167,6 @@ class OwnershipAnalyzer(Analyzer):
         # )
         # return response.json()
 
-        return {path: self.default_ownership for path in file_paths}
+        # Until the API exists no path is known, so callers fall back to
+        # path-derived ownership
+        return {}
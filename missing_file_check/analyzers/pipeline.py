@@ -1,14 +1,19 @@
 """
 Analysis pipeline for coordinating multiple analyzers.
 
-Runs analyzers in sequence to enrich missing file information.
+Runs analyzers in dependency order to enrich missing file information.
+Analyzers without dependencies between them run concurrently.
 """
 
-from typing import List
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 
 from missing_file_check.analyzers.base import Analyzer
 from missing_file_check.scanner.checker import CheckResult
 
+logger = logging.getLogger(__name__)
+
 
 class AnalysisPipeline:
     """
@@ -18,34 +23,60 @@ class AnalysisPipeline:
     Each analyzer enriches the MissingFile objects with additional information.
     """
 
-    def __init__(self, analyzers: List[Analyzer]):
+    def __init__(self, analyzers: List[Analyzer], parallel: bool = True):
         """
         Initialize pipeline with analyzers.
 
         Args:
             analyzers: List of Analyzer instances to run
+            parallel: Run independent analyzers concurrently when True
+
+        Raises:
+            ValueError: If analyzer dependencies form a cycle
         """
         self.analyzers = analyzers
+        self.parallel = parallel
+        self._waves = self._build_waves(analyzers)
 
     def run(self, result: CheckResult, context: dict) -> None:
         """
         Run all analyzers on the check result.
 
-        Analyzers are executed sequentially. Each analyzer modifies
+        A failing analyzer does not stop the others; failures are logged
+        once all analyzers have finished.
+
+        Analyzers are executed in waves: every analyzer in a wave only
+        depends on analyzers from earlier waves, so the analyzers of one
+        wave run concurrently in worker threads. Analyzers whose
+        applicable() returns False are skipped. Each analyzer modifies
         the missing_files in-place.
 
         Args:
             result: CheckResult from scanner
             context: Shared context dictionary for analyzers
         """
-        for analyzer in self.analyzers:
-            try:
-                analyzer.analyze(result.missing_files, context)
-            except Exception as e:
-                # Log error but continue with other analyzers
-                print(f"[WARNING] Analyzer {analyzer.name} failed: {e}")
-                # In production, use proper logging
-                # logger.warning(f"Analyzer {analyzer.name} failed", exc_info=e)
+        failures = []
+        for wave in self._waves:
+            # Checked per wave, after the analyzers it depends on have run
+            wave = [a for a in wave if a.applicable(result.missing_files)]
+            if not self.parallel or len(wave) <= 1:
+                errors = [self._run_analyzer(a, result, context) for a in wave]
+            else:
+                with ThreadPoolExecutor(max_workers=len(wave)) as executor:
+                    errors = list(
+                        executor.map(
+                            lambda a: self._run_analyzer(a, result, context), wave
+                        )
+                    )
+            failures.extend(
+                (analyzer, error) for analyzer, error in zip(wave, errors) if error
+            )
+
+        # Failed analyzers don't stop the others; report them once at the end
+        for analyzer, error in failures:
+            logger.warning(
+                "Analyzer %s failed: %s", analyzer.name, error, exc_info=error
+            )
 
     def add_analyzer(self, analyzer: Analyzer):
         """
@@ -53,8 +84,13 @@ class AnalysisPipeline:
 
         Args:
             analyzer: Analyzer instance
+
+        Raises:
+            ValueError: If the analyzer introduces a dependency cycle
         """
+        waves = self._build_waves(self.analyzers + [analyzer])
         self.analyzers.append(analyzer)
+        self._waves = waves
 
     def remove_analyzer(self, analyzer_name: str) -> bool:
         """
@@ -69,14 +105,69 @@ class AnalysisPipeline:
         for i, analyzer in enumerate(self.analyzers):
             if analyzer.name == analyzer_name:
                 self.analyzers.pop(i)
+                self._waves = self._build_waves(self.analyzers)
                 return True
         return False
 
+    @staticmethod
+    def _run_analyzer(
+        analyzer: Analyzer, result: CheckResult, context: dict
+    ) -> Optional[Exception]:
+        """Run one analyzer, returning its exception instead of raising."""
+        try:
+            analyzer.analyze(result.missing_files, context)
+        except Exception as e:
+            return e
+        return None
+
+    @staticmethod
+    def _build_waves(analyzers: List[Analyzer]) -> List[List[Analyzer]]:
+        """
+        Group analyzers into dependency levels, keeping insertion order.
+
+        Dependencies on analyzers that are not in the pipeline are ignored,
+        so removing an analyzer does not break the ones depending on it.
+
+        Args:
+            analyzers: Analyzers in insertion order
+
+        Returns:
+            Waves of analyzers; each wave only depends on earlier waves
+
+        Raises:
+            ValueError: If analyzer dependencies form a cycle
+        """
+        names = {analyzer.name for analyzer in analyzers}
+        done = set()
+        pending = list(analyzers)
+        waves = []
+
+        while pending:
+            wave = [
+                analyzer
+                for analyzer in pending
+                if all(
+                    dep in done or dep not in names for dep in analyzer.depends_on
+                )
+            ]
+            if not wave:
+                cycle = ", ".join(analyzer.name for analyzer in pending)
+                raise ValueError(f"Circular analyzer dependencies: {cycle}")
+
+            waves.append(wave)
+            done.update(analyzer.name for analyzer in wave)
+            pending = [analyzer for analyzer in pending if analyzer not in wave]
+
+        return waves
+
 
 def create_default_pipeline() -> AnalysisPipeline:
     """
     Create a pipeline with default analyzers.
 
+    The default analyzers fill independent fields, so they all run in a
+    single concurrent wave.
+
     Returns:
         AnalysisPipeline with standard analyzers
     """
@@ -7,11 +7,42 @@ Classifies miss reasons into categories:
 - confirmed: Confirmed missing via cc.json logs (future)
 """
 
-from typing import List
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
 
 from missing_file_check.analyzers.base import Analyzer
 from missing_file_check.scanner.checker import MissingFile
 
+# Reason builders by file status, called with (shielded_remark, remapped_to)
+_STATUS_HANDLERS: Dict[str, Callable[[Optional[str], Optional[str]], str]] = {
+    "failed": lambda remark, remapped_to: "failed_status",
+    "missed": lambda remark, remapped_to: "not_in_list",
+    "shielded": lambda remark, remapped_to: f"shielded: {remark or 'by rule'}",
+    "remapped": lambda remark, remapped_to: f"remapped: {remapped_to}",
+}
+
+
+@lru_cache(maxsize=2048)
+def _classify(
+    status: str, shielded_remark: Optional[str], remapped_to: Optional[str]
+) -> str:
+    """
+    Classify a miss reason from the fields it depends on.
+
+    Most files of a scan share the same combination, so results are cached
+    and repeated reasons reuse one string object.
+
+    Args:
+        status: File status
+        shielded_remark: Remark of the matching shield rule, if any
+        remapped_to: Mapped target path, if any
+
+    Returns:
+        Classified reason string
+    """
+    handler = _STATUS_HANDLERS.get(status)
+    return handler(shielded_remark, remapped_to) if handler else "unknown"
+
 
 class ReasonAnalyzer(Analyzer):
     """
@@ -21,10 +52,16 @@ class ReasonAnalyzer(Analyzer):
     and other available information.
     """
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "ReasonAnalyzer"
 
+    def applicable(self, missing_files: List[MissingFile]) -> bool:
+        """Run only if some file has no reason yet."""
+        return any(not file.miss_reason for file in missing_files)
+
     def analyze(self, missing_files: List[MissingFile], context: dict) -> None:
         """
         Analyze miss reasons.
@@ -33,9 +70,12 @@ class ReasonAnalyzer(Analyzer):
             missing_files: List of files to analyze
             context: Analysis context
         """
+        classify = _classify
         for file in missing_files:
             if not file.miss_reason:  # Don't overwrite existing reason
-                file.miss_reason = self._classify_reason(file)
+                file.miss_reason = classify(
+                    file.status, file.shielded_remark, file.remapped_to
+                )
 
     def _classify_reason(self, file: MissingFile) -> str:
         """
@@ -47,17 +87,7 @@ class ReasonAnalyzer(Analyzer):
         Returns:
             Classified reason string
         """
-        # Status-based classification
-        if file.status == "failed":
-            return "failed_status"
-        elif file.status == "missed":
-            return "not_in_list"
-        elif file.status == "shielded":
-            return f"shielded: {file.shielded_remark or 'by rule'}"
-        elif file.status == "remapped":
-            return f"remapped: {file.remapped_to}"
-        else:
-            return "unknown"
+        return _classify(file.status, file.shielded_remark, file.remapped_to)
 
     def _check_cc_json_logs(self, file_path: str, context: dict) -> bool:
         """
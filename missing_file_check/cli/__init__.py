@@ -9,13 +9,26 @@ import sys
 import click
 from loguru import logger
 
-# Configure loguru
-logger.remove()  # Remove default handler
-logger.add(
-    sys.stderr,
-    format="<level>{level: <8}</level> | <cyan>{message}</cyan>",
-    colorize=True,
-)
+# Log formats: verbose runs show the level, normal runs only the message
+_VERBOSE_FMT = "<level>{level: <8}</level> | <cyan>{message}</cyan>"
+_FMT = "<level>{message}</level>"
+
+
+def _configure_logger(level: str, verbose: bool):
+    """
+    Replace loguru's default handler with a single stderr handler.
+
+    Args:
+        level: Minimum log level
+        verbose: Use the detailed, colorized format
+    """
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        level=level,
+        format=_VERBOSE_FMT if verbose else _FMT,
+        colorize=verbose,
+    )
 
 
 @click.group()
@@ -33,24 +46,8 @@ def cli(ctx, verbose, quiet):
     ctx.obj["quiet"] = quiet
 
     # Configure logging level
-    if verbose:
-        logger.remove()
-        logger.add(
-            sys.stderr,
-            level="DEBUG",
-            format="<level>{level: <8}</level> | <cyan>{message}</cyan>",
-            colorize=True,
-        )
-    elif quiet:
-        logger.remove()
-        logger.add(
-            sys.stderr, level="ERROR", format="<level>{message}</level>", colorize=False
-        )
-    else:
-        logger.remove()
-        logger.add(
-            sys.stderr, level="INFO", format="<level>{message}</level>", colorize=False
-        )
+    level = "DEBUG" if verbose else "ERROR" if quiet else "INFO"
+    _configure_logger(level, verbose)
 
 
 # Import commands
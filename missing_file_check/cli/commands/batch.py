@@ -3,18 +3,38 @@
 import sys
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import click
 from loguru import logger
 
-from missing_file_check.scanner.checker import MissingFileChecker
-from missing_file_check.storage.database import DatabaseManager
-from missing_file_check.storage.models import TaskModel
-from missing_file_check.storage.report_generator import ReportGenerator
-from missing_file_check.storage.repository import MissingFileRepository
+from missing_file_check.cli.utils.display import BANNER_RULE
+
+# Scanner and storage pull in SQLAlchemy and Jinja2; they are imported inside
+# the commands so other CLI commands start quickly
+if TYPE_CHECKING:
+    from missing_file_check.config.models import TaskConfig
+    from missing_file_check.storage.models import TaskModel
+    from missing_file_check.storage.report_generator import ReportGenerator
+    from missing_file_check.storage.repository import MissingFileRepository
+
+
+# Tasks scanned concurrently unless --max-workers is given
+DEFAULT_BATCH_WORKERS = 4
+
+# ResultStatistics fields reported per task
+_STAT_FIELDS = (
+    "missed_count",
+    "failed_count",
+    "passed_count",
+    "shielded_count",
+    "remapped_count",
+    "target_file_count",
+    "baseline_file_count",
+)
 
 
 @dataclass
@@ -24,6 +44,7 @@ class TaskExecutionResult:
     task_id: int
     task_name: str
     success: bool
+    # Monotonic (time.perf_counter) duration, unaffected by clock changes
     duration_seconds: float
     error_message: Optional[str] = None
     error_type: Optional[str] = None
@@ -50,8 +71,27 @@ class TaskExecutionResult:
 )
 @click.option("--output", "-o", type=click.Path(), help="报告输出路径")
 @click.option("--no-parallel", is_flag=True, help="禁用并行处理")
+@click.option(
+    "--only-write-on-issues",
+    is_flag=True,
+    help="无缺失和失败文件的任务只保存统计，不生成报告和明细",
+)
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    help=f"并发执行的任务数，默认为 {DEFAULT_BATCH_WORKERS}",
+)
 @click.pass_context
-def batch(ctx, search_version, group_id, source_type, output, no_parallel):
+def batch(
+    ctx,
+    search_version,
+    group_id,
+    source_type,
+    output,
+    no_parallel,
+    only_write_on_issues,
+    max_workers,
+):
     """
     批量执行文件扫描任务
 
@@ -59,6 +99,9 @@ def batch(ctx, search_version, group_id, source_type, output, no_parallel):
         missing-file-check batch --search-version v1.0 v2.0 --source-type git
         missing-file-check batch --group-id 1 2 --output ./reports
     """
+    from missing_file_check.storage.database import DatabaseManager
+    from missing_file_check.storage.repository import MissingFileRepository
+
     try:
         # Initialize database connection
         db_manager = DatabaseManager()
@@ -71,12 +114,13 @@ def batch(ctx, search_version, group_id, source_type, output, no_parallel):
         group_ids = list(group_id) if group_id else None
         source_types = list(source_type) if source_type else None
 
-        logger.info("=" * 60)
-        logger.info("批量任务执行")
-        logger.info("=" * 60)
-        logger.info(f"搜索版本: {search_versions or '全部'}")
-        logger.info(f"分组ID: {group_ids or '全部'}")
-        logger.info(f"来源类型: {source_types or '全部'}")
+        logger.info(
+            f"{BANNER_RULE}\n批量任务执行\n{BANNER_RULE}\n"
+            "搜索版本: {}\n分组ID: {}\n来源类型: {}",
+            search_versions or "全部",
+            group_ids or "全部",
+            source_types or "全部",
+        )
 
         # Query tasks from database
         tasks = repo.query_tasks(
@@ -90,12 +134,17 @@ def batch(ctx, search_version, group_id, source_type, output, no_parallel):
             logger.warning("未找到符合条件任务")
             return
 
-        logger.info(f"找到 {len(tasks)} 个待执行任务")
-        logger.info("=" * 60)
+        logger.info("找到 {} 个待执行任务\n" + BANNER_RULE, len(tasks))
 
         # Execute tasks and collect results
         task_results = execute_tasks_batch(
-            repo, tasks, output=output, no_parallel=no_parallel, quiet=ctx.obj["quiet"]
+            repo,
+            tasks,
+            output=output,
+            no_parallel=no_parallel,
+            quiet=ctx.obj["quiet"],
+            max_workers=max_workers,
+            only_write_on_issues=only_write_on_issues,
         )
 
         # Display batch summary
@@ -104,7 +153,7 @@ def batch(ctx, search_version, group_id, source_type, output, no_parallel):
         display_batch_summary(task_results)
 
     except Exception as e:
-        logger.error(f"批量执行错误：{e}")
+        logger.error("批量执行错误：{}", e)
         if ctx.obj["verbose"]:
             logger.exception("详细错误信息:")
         sys.exit(1)
@@ -113,24 +162,36 @@ def batch(ctx, search_version, group_id, source_type, output, no_parallel):
             session.close()
 
 
-def build_task_config_from_model(task: TaskModel, session) -> "TaskConfig":
-    """Build TaskConfig from TaskModel database record."""
-    from missing_file_check.config.models import TaskConfig
-    from missing_file_check.storage.repository import MissingFileRepository
-
-    repo = MissingFileRepository(session)
+def build_task_config_from_model(
+    task: "TaskModel", session, prefetched: Optional[Dict[str, dict]] = None
+) -> "TaskConfig":
+    """
+    Build TaskConfig from TaskModel database record.
 
-    # Load project relations
-    project_relations = repo.get_project_relations(task.id)
+    Args:
+        task: Task database record
+        session: Database session, used when nothing is prefetched
+        prefetched: Optional output of prefetch_task_settings() covering
+            this task, so no queries are issued per task
 
-    # Load path prefixes
-    path_prefixes = repo.get_path_prefixes(task.id)
+    Returns:
+        Task configuration
+    """
+    from missing_file_check.config.models import (
+        MappingRule,
+        PathPrefixConfig,
+        ShieldRule,
+        TaskConfig,
+    )
+    from missing_file_check.storage.repository import MissingFileRepository
 
-    # Load shield rules
-    shield_rules = repo.get_shield_rules(task.id, enabled_only=True)
+    if prefetched is None:
+        prefetched = prefetch_task_settings(MissingFileRepository(session), [task])
 
-    # Load mapping rules
-    mapping_rules = repo.get_mapping_rules(task.id, enabled_only=True)
+    project_relations = prefetched["project_relations"].get(task.id, [])
+    path_prefixes = prefetched["path_prefixes"].get(task.id, [])
+    shield_rules = prefetched["shield_rules"].get(task.id, [])
+    mapping_rules = prefetched["mapping_rules"].get(task.id, [])
 
     # Build target projects from project relations
     target_projects = []
@@ -151,29 +212,30 @@ def build_task_config_from_model(task: TaskModel, session) -> "TaskConfig":
         else:
             baseline_projects.append(project_info)
 
-    # Build path prefixes
+    # Prefixes and rules come straight from NOT NULL string columns, so their
+    # models are constructed without validating each row; TaskConfig does
+    # not revalidate model instances
     prefixes = [
-        {"project_id": str(p.project_id), "prefix": p.prefix} for p in path_prefixes
+        PathPrefixConfig.model_construct(project_id=str(p.project_id), prefix=p.prefix)
+        for p in path_prefixes
     ]
 
     # Build shield rules
     shields = [
-        {
-            "id": f"SHIELD-{r.id}",
-            "pattern": r.pattern,
-            "remark": r.remark or "",
-        }
+        ShieldRule.model_construct(
+            id=f"SHIELD-{r.id}", pattern=r.pattern, remark=r.remark or ""
+        )
         for r in shield_rules
     ]
 
     # Build mapping rules
     mappings = [
-        {
-            "id": f"MAP-{r.id}",
-            "source_pattern": r.source_pattern,
-            "target_pattern": r.target_pattern,
-            "remark": r.remark or "",
-        }
+        MappingRule.model_construct(
+            id=f"MAP-{r.id}",
+            source_pattern=r.source_pattern,
+            target_pattern=r.target_pattern,
+            remark=r.remark or "",
+        )
         for r in mapping_rules
     ]
 
@@ -189,100 +251,222 @@ def build_task_config_from_model(task: TaskModel, session) -> "TaskConfig":
     )
 
 
+def prefetch_task_settings(
+    repo: "MissingFileRepository", tasks: List["TaskModel"]
+) -> Dict[str, dict]:
+    """
+    Load relations, prefixes and enabled rules of all tasks in bulk.
+
+    Args:
+        repo: Repository instance for database access
+        tasks: Tasks to load settings for
+
+    Returns:
+        Dictionary with "project_relations", "path_prefixes",
+        "shield_rules" and "mapping_rules", each mapping task ID to rows
+    """
+    task_ids = [task.id for task in tasks]
+    return {
+        "project_relations": repo.get_project_relations_bulk(task_ids),
+        "path_prefixes": repo.get_path_prefixes_bulk(task_ids),
+        "shield_rules": repo.get_shield_rules_bulk(task_ids, enabled_only=True),
+        "mapping_rules": repo.get_mapping_rules_bulk(task_ids, enabled_only=True),
+    }
+
+
 def execute_tasks_batch(
-    repo: MissingFileRepository,
-    tasks: List[TaskModel],
+    repo: "MissingFileRepository",
+    tasks: List["TaskModel"],
     output: Optional[str] = None,
     no_parallel: bool = False,
     quiet: bool = False,
+    max_workers: Optional[int] = None,
+    only_write_on_issues: bool = False,
 ) -> List[TaskExecutionResult]:
     """
     Execute a batch of tasks and collect results.
 
+    Task configs are loaded and results saved on the calling thread, since
+    the database session is not thread-safe; only the scans and report
+    generation run in worker threads.
+
     Args:
         repo: Repository instance for database access
         tasks: List of TaskModel instances to execute
         output: Optional output path for reports
         no_parallel: Disable parallel processing
         quiet: Suppress non-error output
+        max_workers: Maximum concurrent scans (None = DEFAULT_BATCH_WORKERS)
+        only_write_on_issues: For tasks without missed or failed files, skip
+            the report and per-file details and save only the summary
 
     Returns:
-        List of TaskExecutionResult instances
+        List of TaskExecutionResult instances, in task order
     """
-    from missing_file_check.config.models import TaskConfig
-
-    results: List[TaskExecutionResult] = []
-
+    results: Dict[int, TaskExecutionResult] = {}
+    # A task's duration is its config build time plus the time from the
+    # start of its scan until its results are saved
+    build_durations: Dict[int, float] = {}
+    scan_started: Dict[int, float] = {}
+
+    # Build task configs from database models, with four queries in total
+    prefetched = prefetch_task_settings(repo, tasks)
+    configs = []
     for task in tasks:
-        start_time = time.time()
-        error_message = None
-        error_type = None
-        error_traceback = None
-        statistics = None
-
-        logger.info(f"执行任务 [{task.id}]...")
-
+        build_start = time.perf_counter()
         try:
-            # Build task config from database model
-            task_config = build_task_config_from_model(task, repo.session)
-
-            # Execute scan
-            checker = MissingFileChecker(task_config, enable_parallel=not no_parallel)
-            result = checker.check()
-
-            # Save results to database
-            report_url = None
-            if output:
-                generator = ReportGenerator()
-                output_path = Path(output) / f"report_{task.id}.html"
-                generator.generate_html(result, output_path)
-                report_url = str(output_path)
-
-            repo.save_task_and_results(task.id, result, report_url=report_url)
-
-            # Collect statistics
-            statistics = {
-                "missed_count": result.statistics.missed_count,
-                "failed_count": result.statistics.failed_count,
-                "passed_count": result.statistics.passed_count,
-                "shielded_count": result.statistics.shielded_count,
-                "remapped_count": result.statistics.remapped_count,
-                "target_file_count": result.statistics.target_file_count,
-                "baseline_file_count": result.statistics.baseline_file_count,
-            }
-
-            if not quiet:
-                logger.success(f"任务 [{task.id}] 完成")
-
+            task_config = build_task_config_from_model(
+                task, repo.session, prefetched=prefetched
+            )
         except Exception as e:
-            error_type = type(e).__name__
-            error_message = str(e)
-            error_traceback = traceback.format_exc()
+            results[task.id] = _record_task_error(
+                repo, task, e, time.perf_counter() - build_start
+            )
+            continue
+        build_durations[task.id] = time.perf_counter() - build_start
+        configs.append((task, task_config))
+
+    # Resolve and create the report directory once rather than per task
+    output_root = Path(output) if output else None
+    generator = None
+    if output_root is not None and configs:
+        from missing_file_check.storage.report_generator import ReportGenerator
+
+        output_root.mkdir(parents=True, exist_ok=True)
+        # One generator serves every task; rendering does not mutate it
+        generator = ReportGenerator()
+
+    def scan(task, task_config):
+        scan_started[task.id] = time.perf_counter()
+        logger.info("执行任务 [{}]...", task.id)
+        return _scan_task(
+            task,
+            task_config,
+            output_root,
+            no_parallel,
+            only_write_on_issues,
+            generator=generator,
+        )
 
-            logger.error(f"任务 [{task.id}] 失败: [{error_type}] {error_message}")
-            logger.debug(f"堆栈跟踪:\n{error_traceback}")
+    def task_duration(task_id):
+        """Config build time plus time since the task's scan started."""
+        scan_duration = time.perf_counter() - scan_started[task_id]
+        return build_durations[task_id] + scan_duration
 
-            # Save error result to database
+    workers = 1 if no_parallel else max_workers or DEFAULT_BATCH_WORKERS
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(configs)))) as executor:
+        futures = {
+            executor.submit(scan, task, task_config): task
+            for task, task_config in configs
+        }
+        for future in as_completed(futures):
+            task = futures[future]
             try:
-                repo.save_task_error(
-                    task.id, error_type, error_message, error_traceback
+                result, report_url = future.result()
+                write_details = not only_write_on_issues or _has_issues(result)
+                if not write_details:
+                    logger.info("任务 [{}] 无需处理的问题，仅保存统计", task.id)
+
+                # Save results to database
+                repo.save_task_and_results(
+                    task.id,
+                    result,
+                    report_url=report_url,
+                    include_details=write_details,
+                )
+            except Exception as e:
+                results[task.id] = _record_task_error(
+                    repo, task, e, task_duration(task.id)
                 )
-            except Exception as db_error:
-                logger.error(f"保存错误信息到数据库失败: {db_error}")
+                continue
 
-        duration = time.time() - start_time
+            if not quiet:
+                logger.success("任务 [{}] 完成", task.id)
 
-        results.append(
-            TaskExecutionResult(
+            results[task.id] = TaskExecutionResult(
                 task_id=task.id,
                 task_name=f"TASK-{task.id}",
-                success=error_message is None,
-                duration_seconds=duration,
-                error_message=error_message,
-                error_type=error_type,
-                error_traceback=error_traceback,
-                statistics=statistics,
+                success=True,
+                duration_seconds=task_duration(task.id),
+                statistics={
+                    name: getattr(result.statistics, name) for name in _STAT_FIELDS
+                },
             )
-        )
 
-    return results
+    return [results[task.id] for task in tasks]
+
+
+def _scan_task(
+    task: "TaskModel",
+    task_config: "TaskConfig",
+    output_root: Optional[Path],
+    no_parallel: bool,
+    only_write_on_issues: bool = False,
+    generator: Optional["ReportGenerator"] = None,
+):
+    """
+    Run one task's scan and write its report; safe to call from a worker.
+
+    Args:
+        task: Task database record
+        task_config: Task configuration built from the record
+        output_root: Existing report directory, or None to skip the report
+        no_parallel: Disable parallel processing within the scan
+        only_write_on_issues: Skip the report when nothing needs attention
+        generator: Shared report generator; a new one is created if omitted
+
+    Returns:
+        Tuple of (CheckResult, report URL or None)
+    """
+    from missing_file_check.scanner.checker import MissingFileChecker
+
+    checker = MissingFileChecker(task_config, enable_parallel=not no_parallel)
+    result = checker.check()
+
+    report_url = None
+    if output_root is not None and (not only_write_on_issues or _has_issues(result)):
+        if generator is None:
+            from missing_file_check.storage.report_generator import ReportGenerator
+
+            generator = ReportGenerator()
+        output_path = output_root / f"report_{task.id}.html"
+        generator.generate_html_stream(result, output_path)
+        report_url = str(output_path)
+
+    return result, report_url
+
+
+def _has_issues(result) -> bool:
+    """Check whether a result has files that need attention."""
+    return result.statistics.missed_count + result.statistics.failed_count > 0
+
+
+def _record_task_error(
+    repo: "MissingFileRepository",
+    task: "TaskModel",
+    error: Exception,
+    duration_seconds: float,
+) -> TaskExecutionResult:
+    """Log a failed task, save the error to the database and build its result."""
+    error_type = type(error).__name__
+    error_message = str(error)
+    error_traceback = "".join(traceback.format_exception(error))
+
+    logger.error("任务 [{}] 失败: [{}] {}", task.id, error_type, error_message)
+    logger.debug("堆栈跟踪:\n{}", error_traceback)
+
+    # Save error result to database
+    try:
+        repo.save_task_error(task.id, error_type, error_message, error_traceback)
+    except Exception as db_error:
+        logger.error("保存错误信息到数据库失败: {}", db_error)
+
+    return TaskExecutionResult(
+        task_id=task.id,
+        task_name=f"TASK-{task.id}",
+        success=False,
+        duration_seconds=duration_seconds,
+        error_message=error_message,
+        error_type=error_type,
+        error_traceback=error_traceback,
+    )
@@ -1,10 +1,9 @@
 """Init command for creating example configuration files."""
 
-import json
 from pathlib import Path
 
 import click
-import yaml
+import orjson
 from loguru import logger
 
 
@@ -31,21 +30,28 @@ def init(output, format):
         # Create example configuration
         example_config = create_example_config()
 
+        # Serialize to bytes with the C encoders and write once
         if format == "yaml":
-            with open(output_path, "w", encoding="utf-8") as f:
-                yaml.dump(
-                    example_config, f, allow_unicode=True, default_flow_style=False
-                )
+            import yaml
+
+            text = yaml.dump(
+                example_config,
+                allow_unicode=True,
+                default_flow_style=False,
+                Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+            )
+            output_path.write_bytes(text.encode("utf-8"))
         else:
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(example_config, f, indent=2, ensure_ascii=False)
+            output_path.write_bytes(
+                orjson.dumps(example_config, option=orjson.OPT_INDENT_2)
+            )
 
-        logger.success(f"配置文件已创建: {output_path}")
+        logger.success("配置文件已创建: {}", output_path)
         logger.info("编辑配置文件后，使用以下命令执行扫描：")
-        logger.info(f"  missing-file-check scan --config {output_path}")
+        logger.info("  missing-file-check scan --config {}", output_path)
 
     except Exception as e:
-        logger.error(f"错误：{e}")
+        logger.error("错误：{}", e)
         raise SystemExit(1)
 
 
@@ -6,8 +6,6 @@ from pathlib import Path
 import click
 from loguru import logger
 
-from missing_file_check.scanner.checker import MissingFileChecker
-from missing_file_check.storage.report_generator import ReportGenerator
 from missing_file_check.cli.utils.config import load_config_from_file
 
 
@@ -18,8 +16,9 @@ from missing_file_check.cli.utils.config import load_config_from_file
 @click.option("--task-id", "-t", help="任务ID（从数据库加载配置）")
 @click.option("--output", "-o", type=click.Path(), help="报告输出路径")
 @click.option("--no-parallel", is_flag=True, help="禁用并行处理")
+@click.option("--no-config-cache", is_flag=True, help="不使用配置文件解析缓存")
 @click.pass_context
-def scan(ctx, config, task_id, output, no_parallel):
+def scan(ctx, config, task_id, output, no_parallel, no_config_cache):
     """
     执行文件扫描任务
 
@@ -30,7 +29,9 @@ def scan(ctx, config, task_id, output, no_parallel):
     try:
         # Load configuration
         if config:
-            task_config = load_config_from_file(config)
+            task_config = load_config_from_file(
+                config, use_cache=not no_config_cache
+            )
         elif task_id:
             from missing_file_check.cli.utils.config import load_config_from_database
 
@@ -45,7 +46,9 @@ def scan(ctx, config, task_id, output, no_parallel):
 
             display_task_info(task_config)
 
-        # Execute scan
+        # Execute scan; imported here to keep CLI startup fast
+        from missing_file_check.scanner.checker import MissingFileChecker
+
         logger.info("执行扫描...")
         checker = MissingFileChecker(task_config, enable_parallel=not no_parallel)
         result = checker.check()
@@ -59,18 +62,20 @@ def scan(ctx, config, task_id, output, no_parallel):
 
         # Generate report if output specified
         if output:
+            from missing_file_check.storage.report_generator import ReportGenerator
+
             generator = ReportGenerator()
             output_path = Path(output)
 
             if output_path.suffix == ".json":
-                generator.generate_json(result, output_path)
+                generator.generate_json_stream(result, output_path)
             else:
-                generator.generate_html(result, output_path)
+                generator.generate_html_stream(result, output_path)
 
-            logger.success(f"报告已生成: {output_path}")
+            logger.success("报告已生成: {}", output_path)
 
     except Exception as e:
-        logger.error(f"错误：{e}")
+        logger.error("错误：{}", e)
         if ctx.obj["verbose"]:
             logger.exception("详细错误信息:")
         sys.exit(1)
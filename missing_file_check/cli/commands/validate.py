@@ -12,7 +12,8 @@ from missing_file_check.cli.utils.config import load_config_from_file
 @click.option(
     "--config", "-c", type=click.Path(exists=True), required=True, help="配置文件路径"
 )
-def validate(config):
+@click.option("--no-config-cache", is_flag=True, help="不使用配置文件解析缓存")
+def validate(config, no_config_cache):
     """
     验证配置文件
 
@@ -20,16 +21,16 @@ def validate(config):
         missing-file-check validate --config config.yaml
     """
     try:
-        task_config = load_config_from_file(config)
+        task_config = load_config_from_file(config, use_cache=not no_config_cache)
 
         logger.success("配置文件验证通过")
-        logger.info(f"任务ID: {task_config.task_id}")
-        logger.info(f"目标工程: {len(task_config.target_projects)}")
-        logger.info(f"基线工程: {len(task_config.baseline_projects)}")
-        logger.info(f"屏蔽规则: {len(task_config.shield_rules)}")
-        logger.info(f"映射规则: {len(task_config.mapping_rules)}")
+        logger.info("任务ID: {}", task_config.task_id)
+        logger.info("目标工程: {}", len(task_config.target_projects))
+        logger.info("基线工程: {}", len(task_config.baseline_projects))
+        logger.info("屏蔽规则: {}", len(task_config.shield_rules))
+        logger.info("映射规则: {}", len(task_config.mapping_rules))
 
     except Exception as e:
         logger.error("配置文件验证失败")
-        logger.error(f"{e}")
+        logger.error("{}", e)
         sys.exit(1)
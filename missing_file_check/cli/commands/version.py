@@ -26,5 +26,5 @@ def version(format):
     if format == "json":
         print(json.dumps(version_info, indent=2))
     else:
-        logger.info(f"Missing File Check v{version_info['version']}")
-        logger.info(f"Python {version_info['python']} on {version_info['platform']}")
+        logger.info("Missing File Check v{}", version_info["version"])
+        logger.info("Python {} on {}", version_info["python"], version_info["platform"])
@@ -1,32 +1,92 @@
 """Configuration loading utilities for CLI."""
 
-import json
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
-from missing_file_check.config.models import TaskConfig
+import orjson
 
+from missing_file_check import __version__
+from missing_file_check.utils.cache import LRUCache, load_pickle, save_pickle
+
+# pydantic models are imported when a config is actually parsed, so
+# commands like version and --help don't pay for them
+if TYPE_CHECKING:
+    from missing_file_check.config.models import TaskConfig
+
+# Maximum number of parsed configs kept in memory
+CONFIG_CACHE_SIZE = 100
+
+_config_memory = LRUCache(CONFIG_CACHE_SIZE)
+
+
+def load_config_from_file(file_path: str, use_cache: bool = True) -> "TaskConfig":
+    """
+    Load task configuration from YAML or JSON file.
+
+    Validated configs are cached in memory keyed by the file's path, mtime
+    and size. When MISSING_FILE_CACHE_DIR is set they are also pickled
+    there, so repeated runs on an unchanged file skip parsing and
+    validation.
+
+    Args:
+        file_path: Path to a .yaml/.yml or .json file
+        use_cache: Read and write the config caches
+
+    Returns:
+        Validated task configuration; callers may modify it freely
+
+    Raises:
+        ValueError: If the file format is not supported or validation fails
+    """
+    from missing_file_check.config.models import TaskConfig
 
-def load_config_from_file(file_path: str) -> TaskConfig:
-    """Load task configuration from YAML or JSON file."""
     path = Path(file_path)
 
+    key = _config_key(path) if use_cache else None
+    if key is not None:
+        cached = _config_memory.get(key)
+        if cached is None:
+            cached = load_pickle(key, "configs")
+            if isinstance(cached, TaskConfig):
+                _config_memory.put(key, cached)
+            else:
+                cached = None
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
     if path.suffix in [".yaml", ".yml"]:
         import yaml
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        # libyaml's C loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        data = yaml.load(path.read_bytes(), Loader=loader)
     elif path.suffix == ".json":
-        import json
-
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = orjson.loads(path.read_bytes())
     else:
         raise ValueError(f"Unsupported file format: {path.suffix}")
 
-    return TaskConfig(**data)
+    task_config = TaskConfig(**data)
+
+    if key is not None:
+        # Keep a private copy so callers cannot corrupt the cached entry
+        _config_memory.put(key, task_config.model_copy(deep=True))
+        save_pickle(key, task_config, "configs")
 
+    return task_config
 
-def load_config_from_database(task_id: str) -> TaskConfig:
+
+def load_config_from_database(task_id: str) -> "TaskConfig":
     """Load task configuration from database."""
     # TODO: Implement database loading
     raise NotImplementedError("Database loading not yet implemented")
+
+
+def _config_key(path: Path) -> Optional[tuple]:
+    """Build a cache key from the config file's metadata."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    # The package version guards against unpickling stale model layouts
+    return (os.path.abspath(path), st.st_mtime_ns, st.st_size, __version__)
@@ -1,5 +1,6 @@
 """Display utilities for CLI output formatting."""
 
+import sys
 from typing import Any, Dict, List, Optional
 
 from loguru import logger
@@ -8,29 +9,40 @@ from loguru import logger
 def display_task_info(task_config):
     """Display task configuration info."""
     logger.info("任务配置:")
-    logger.info(f"  任务ID: {task_config.task_id}")
-    logger.info(f"  目标工程: {len(task_config.target_projects)}")
-    logger.info(f"  基线工程: {len(task_config.baseline_projects)}")
+    logger.info("  任务ID: {}", task_config.task_id)
+    logger.info("  目标工程: {}", len(task_config.target_projects))
+    logger.info("  基线工程: {}", len(task_config.baseline_projects))
+
+
+# (label, ResultStatistics attribute) rows of the scan summary
+_STAT_ROWS = (
+    ("  真实缺失（需处理）", "missed_count"),
+    ("  扫描失败（需处理）", "failed_count"),
+    ("  已审核通过", "passed_count"),
+    ("    - 已屏蔽", "shielded_count"),
+    ("    - 已映射", "remapped_count"),
+    ("  目标文件总数", "target_file_count"),
+    ("  基线文件总数", "baseline_file_count"),
+)
+_RULE = "=" * 40
+# Separator framing the batch banners, shared with the batch command
+BANNER_RULE = "=" * 60
+
+# Scan summary logged as one multi-line record instead of one per row
+_STATS_TEMPLATE = "\n".join(
+    [_RULE, "扫描统计", _RULE, *(label + ": {}" for label, _ in _STAT_ROWS), _RULE]
+)
 
 
 def display_scan_results(result):
     """Display scan results in a formatted output."""
-    logger.info("=" * 40)
-    logger.info("扫描统计")
-    logger.info("=" * 40)
-    logger.info(f"  真实缺失（需处理）: {result.statistics.missed_count}")
-    logger.info(f"  扫描失败（需处理）: {result.statistics.failed_count}")
-    logger.info(f"  已审核通过: {result.statistics.passed_count}")
-    logger.info(f"    - 已屏蔽: {result.statistics.shielded_count}")
-    logger.info(f"    - 已映射: {result.statistics.remapped_count}")
-    logger.info(f"  目标文件总数: {result.statistics.target_file_count}")
-    logger.info(f"  基线文件总数: {result.statistics.baseline_file_count}")
-    logger.info("=" * 40)
+    stats = result.statistics
+    logger.info(_STATS_TEMPLATE, *(getattr(stats, attr) for _, attr in _STAT_ROWS))
 
     # Issue summary
     issues = result.statistics.missed_count + result.statistics.failed_count
     if issues > 0:
-        logger.warning(f"发现 {issues} 个需要处理的问题")
+        logger.warning("发现 {} 个需要处理的问题", issues)
     else:
         logger.success("未发现需要处理的问题")
 
@@ -39,18 +51,17 @@ def display_batch_summary(results: List["TaskExecutionResult"]):
     """Display batch execution summary with detailed failure information."""
     from missing_file_check.cli.commands.batch import TaskExecutionResult
 
-    logger.info("=" * 60)
-    logger.info("批量执行汇总")
-    logger.info("=" * 60)
-
     total = len(results)
     success_count = sum(1 for r in results if r.success)
     failed_count = total - success_count
 
-    logger.info(f"总执行任务数: {total}")
-    logger.info(f"成功: {success_count}")
-    logger.info(f"失败: {failed_count}")
-    logger.info("=" * 60)
+    logger.info(
+        f"{BANNER_RULE}\n批量执行汇总\n{BANNER_RULE}\n"
+        "总执行任务数: {}\n成功: {}\n失败: {}\n" + BANNER_RULE,
+        total,
+        success_count,
+        failed_count,
+    )
 
     # Print detailed results table
     print_results_table(results)
@@ -72,9 +83,11 @@ def print_results_table(results: List["TaskExecutionResult"]):
     rows = []
     for r in results:
         status = "成功" if r.success else "失败"
-        missed = str(r.statistics.get("missed_count", "-") if r.statistics else "-")
-        failed = str(r.statistics.get("failed_count", "-") if r.statistics else "-")
-        passed = str(r.statistics.get("passed_count", "-") if r.statistics else "-")
+        stats = r.statistics or {}
+        missed, failed, passed = (
+            str(stats.get(name, "-"))
+            for name in ("missed_count", "failed_count", "passed_count")
+        )
         duration = f"{r.duration_seconds:.2f}s"
 
         rows.append([str(r.task_id), status, duration, missed, failed, passed])
@@ -98,46 +111,35 @@ def print_table(
         alignments = ["<"] * len(headers)
 
     # Calculate column widths
-    col_widths = [len(h) for h in headers]
-    for row in rows:
-        for i, cell in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(str(cell)))
-
-    # Build separator line
-    separator = "+"
-    for width in col_widths:
-        separator += "-" * (width + 2 * padding) + "+"
-
-    # Print table
-    print()
-    print(separator)
-    print("|" + " " * padding, end="")
-    for i, header in enumerate(headers):
-        content = (
-            header.ljust(col_widths[i])
-            if alignments[i] == "<"
-            else header.rjust(col_widths[i])
-        )
-        print(content + " " * padding + "|", end="")
-    print()
-    print(separator)
-
-    # Print rows
-    for row in rows:
-        print("|" + " " * padding, end="")
-        for i, cell in enumerate(row):
-            cell_str = str(cell)
-            if alignments[i] == "<":
-                content = cell_str.ljust(col_widths[i])
-            elif alignments[i] == ">":
-                content = cell_str.rjust(col_widths[i])
-            else:
-                content = cell_str.center(col_widths[i])
-            print(content + " " * padding + "|", end="")
-        print()
-
-    print(separator)
-    print()
+    col_widths = [
+        max(len(header), *(len(str(row[i])) for row in rows))
+        for i, header in enumerate(headers)
+    ]
+
+    # One format string per line kind: cells align "<" / ">" and center
+    # anything else, headers are left-aligned for "<" and right-aligned
+    # otherwise
+    pad = " " * padding
+
+    def line_format(specs):
+        cells = "|".join(f"{pad}{{:{a}{w}}}{pad}" for a, w in zip(specs, col_widths))
+        return f"|{cells}|"
+
+    row_fmt = line_format(a if a in ("<", ">") else "^" for a in alignments)
+    header_fmt = line_format("<" if a == "<" else ">" for a in alignments)
+    separator = "+" + "+".join("-" * (w + 2 * padding) for w in col_widths) + "+"
+
+    # Build the whole table and write it at once
+    lines = [
+        "",
+        separator,
+        header_fmt.format(*headers),
+        separator,
+        *(row_fmt.format(*map(str, row)) for row in rows),
+        separator,
+        "",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_failure_details(results: List["TaskExecutionResult"]):
@@ -149,15 +151,13 @@ def print_failure_details(results: List["TaskExecutionResult"]):
     if not failed_tasks:
         return
 
-    logger.warning("=" * 60)
-    logger.warning("失败任务详细清单")
-    logger.warning("=" * 60)
+    logger.warning(f"{BANNER_RULE}\n失败任务详细清单\n{BANNER_RULE}")
 
     for i, result in enumerate(failed_tasks, 1):
         print()
-        logger.error(f"[{i}] 任务 ID: {result.task_id}")
-        logger.error(f"    异常类型: {result.error_type or 'Unknown'}")
-        logger.error(f"    异常信息: {result.error_message or 'No error message'}")
+        logger.error("[{}] 任务 ID: {}", i, result.task_id)
+        logger.error("    异常类型: {}", result.error_type or "Unknown")
+        logger.error("    异常信息: {}", result.error_message or "No error message")
 
         if result.error_traceback:
             # Print first few lines of traceback
@@ -166,9 +166,9 @@ def print_failure_details(results: List["TaskExecutionResult"]):
             if len(traceback_lines) > 10:
                 traceback_lines = traceback_lines[:10] + ["..."]
             logger.debug(
-                f"    堆栈跟踪:\n"
-                + "\n".join(f"        {line}" for line in traceback_lines)
+                "    堆栈跟踪:\n{}",
+                "\n".join(f"        {line}" for line in traceback_lines),
             )
 
     print()
-    logger.warning("=" * 60)
+    logger.warning(BANNER_RULE)
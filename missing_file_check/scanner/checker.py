@@ -4,12 +4,12 @@ Main checker orchestrating the complete file comparison workflow.
 Coordinates all scanning components to produce a comprehensive CheckResult.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from datetime import datetime
 
 from missing_file_check.config.models import TaskConfig
-from missing_file_check.adapters.base import ProjectScanResult
+from missing_file_check.adapters.base import AdapterError, ProjectScanResult
 from missing_file_check.adapters.factory import AdapterFactory
 from missing_file_check.selectors.factory import BaselineSelectorFactory
 from missing_file_check.scanner.merger import FileMerger
@@ -18,7 +18,7 @@ from missing_file_check.scanner.comparator import FileComparator
 from missing_file_check.scanner.rule_engine import RuleEngine
 
 
-@dataclass
+@dataclass(slots=True)
 class MissingFile:
     """Represents a missing or problematic file with categorization."""
 
@@ -73,6 +73,53 @@ class CheckResult:
     # Full project scan results for detailed reporting
     target_projects: Optional[List[ProjectScanResult]] = None
     baseline_projects: Optional[List[ProjectScanResult]] = None
+    _by_status: Optional[Dict[str, List[MissingFile]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def by_status(self) -> Dict[str, List[MissingFile]]:
+        """
+        Group missing files by status in a single pass.
+
+        The grouping is computed on first call and cached on the instance,
+        so it should be requested after missing_files is fully populated.
+
+        Returns:
+            Dictionary mapping status ("missed", "shielded", "remapped",
+            "failed") to the list of files with that status
+        """
+        if self._by_status is None:
+            buckets: Dict[str, List[MissingFile]] = {
+                "missed": [],
+                "shielded": [],
+                "remapped": [],
+                "failed": [],
+            }
+            for file in self.missing_files:
+                buckets.setdefault(file.status, []).append(file)
+            self._by_status = buckets
+        return self._by_status
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Count files whose analysis fields are filled, in a single pass.
+
+        Not cached: analyzers fill these fields after the result is built.
+
+        Returns:
+            Dictionary with "ownership_filled", "reason_filled" and
+            "first_detected_filled" counts
+        """
+        ownership = reason = first_detected = 0
+        for file in self.missing_files:
+            ownership += bool(file.ownership)
+            reason += bool(file.miss_reason)
+            first_detected += file.first_detected_at is not None
+        return {
+            "ownership_filled": ownership,
+            "reason_filled": reason,
+            "first_detected_filled": first_detected,
+        }
 
 
 class MissingFileChecker:
@@ -134,13 +181,12 @@ class MissingFileChecker:
         missing_paths = FileComparator.find_missing_files(baseline_files, target_files)
         failed_files = FileComparator.find_failed_files(baseline_files, target_files)
 
-        # Step 5: Apply rules to categorize
+        # Step 5 + 6: Apply rules and build result objects in one pass, so
+        # the intermediate dictionaries never exist as a full list
         target_paths = set(target_files.keys())
-        categorized = self.rule_engine.categorize_missing_files(
+        categorized = self.rule_engine.iter_categorized_files(
             missing_paths, failed_files, baseline_files, target_paths
         )
-
-        # Step 6: Build result objects
         missing_file_objects = [
             MissingFile(
                 path=item["path"],
@@ -177,29 +223,19 @@ class MissingFileChecker:
         Fetch data from all target projects.
 
         Uses parallel processing if enabled and multiple projects exist.
+
+        Raises:
+            AdapterError: If any target project fails to load
         """
-        if not self.enable_parallel or len(self.config.target_projects) == 1:
-            # Serial execution for single project or when parallel is disabled
-            results = []
-            for project_config in self.config.target_projects:
-                adapter = AdapterFactory.create(project_config)
-                result = adapter.fetch_files()
-                results.append(result)
-            return results
-
-        # Parallel execution for multiple projects
-        from missing_file_check.utils.concurrent import parallel_map
-
-        def fetch_project(project_config):
-            adapter = AdapterFactory.create(project_config)
-            return adapter.fetch_files()
-
-        return parallel_map(
-            fetch_project,
+        results = AdapterFactory.fetch_all(
             self.config.target_projects,
             max_workers=self.max_workers,
-            task_name="target projects",
+            parallel=self.enable_parallel,
         )
+        for result in results:
+            if isinstance(result, AdapterError):
+                raise result
+        return results
 
     def _fetch_baseline_projects(
         self, target_results: List[ProjectScanResult]
@@ -209,6 +245,8 @@ class MissingFileChecker:
             self.config.baseline_selector_strategy,
             self.config.baseline_selector_params,
         )
+        selector.enable_parallel = self.enable_parallel
+        selector.max_workers = self.max_workers
         return selector.select(self.config.baseline_projects, target_results)
 
     def _calculate_statistics(
@@ -28,10 +28,8 @@ class FileComparator:
         Returns:
             Set of file paths present in baseline but missing from target
         """
-        baseline_paths = set(baseline_files.keys())
-        target_paths = set(target_files.keys())
-
-        return baseline_paths - target_paths
+        # Dict key views support set algebra directly, no intermediate sets
+        return baseline_files.keys() - target_files.keys()
 
     @staticmethod
     def find_failed_files(
@@ -50,11 +48,8 @@ class FileComparator:
         Returns:
             List of tuples (path, source_baseline_project) for failed files
         """
-        baseline_paths = set(baseline_files.keys())
-        target_paths = set(target_files.keys())
-
         # Files that exist in both baseline and target
-        common_paths = baseline_paths & target_paths
+        common_paths = baseline_files.keys() & target_files.keys()
 
         failed_files = []
         for path in common_paths:
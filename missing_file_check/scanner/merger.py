@@ -5,6 +5,7 @@ Merges file lists from multiple projects into a unified set while tracking
 the source project for each file.
 """
 
+import sys
 from typing import Dict, List, Tuple
 
 from missing_file_check.adapters.base import FileEntry, ProjectScanResult
@@ -39,10 +40,11 @@ class FileMerger:
         merged: Dict[str, FileEntry] = {}
 
         for result in target_results:
+            normalize = self.path_normalizer.normalizer_for(result.project_id)
             for file in result.files:
-                normalized_path = self.path_normalizer.normalize(
-                    file.path, result.project_id
-                )
+                # Interned so target and baseline keys share one string object
+                # and set/dict probes can short-circuit on identity
+                normalized_path = sys.intern(normalize(file.path))
                 # For target files, we keep the latest occurrence
                 # This handles duplicate files across target projects
                 merged[normalized_path] = file
@@ -65,10 +67,9 @@ class FileMerger:
         merged: Dict[str, Tuple[FileEntry, str]] = {}
 
         for result in baseline_results:
+            normalize = self.path_normalizer.normalizer_for(result.project_id)
             for file in result.files:
-                normalized_path = self.path_normalizer.normalize(
-                    file.path, result.project_id
-                )
+                normalized_path = sys.intern(normalize(file.path))
                 # Only keep first occurrence to track which baseline it came from
                 if normalized_path not in merged:
                     merged[normalized_path] = (file, result.project_id)
@@ -5,7 +5,7 @@ Uses path prefix configuration to strip project-specific prefixes and
 normalize all paths for comparison.
 """
 
-from typing import Dict, List
+from typing import Callable, Dict, List
 
 from missing_file_check.config.models import PathPrefixConfig
 
@@ -36,17 +36,29 @@ class PathNormalizer:
         Returns:
             Normalized relative path with forward slashes
         """
-        # Get prefix for this project (if configured)
-        prefix = self._prefix_map.get(project_id, "")
+        return self.normalizer_for(project_id)(path)
+
+    def normalizer_for(self, project_id: str) -> Callable[[str], str]:
+        """
+        Build a normalize function with the project's prefix already resolved.
 
-        # Normalize path separators to forward slashes
-        normalized = path.replace("\\", "/")
+        Use this when normalizing many paths of one project to avoid the
+        prefix lookup per path.
 
-        # Strip prefix if present
-        if prefix and normalized.startswith(prefix):
-            normalized = normalized[len(prefix) :]
+        Args:
+            project_id: Project ID for prefix lookup
+
+        Returns:
+            Function mapping a raw path to its normalized relative form
+        """
+        # Get prefix for this project (if configured)
+        prefix = self._prefix_map.get(project_id, "")
 
-        # Remove leading slash if present
-        normalized = normalized.lstrip("/")
+        def normalize(path: str) -> str:
+            # Normalize separators, strip prefix, then any leading slash
+            normalized = path.replace("\\", "/")
+            if prefix:
+                normalized = normalized.removeprefix(prefix)
+            return normalized.lstrip("/")
 
-        return normalized
+        return normalize
@@ -7,12 +7,16 @@ Ensures rules are decoupled by processing them in a fixed order:
 """
 
 import re
-from fnmatch import fnmatch
-from typing import Dict, List, Optional, Set, Tuple
+from fnmatch import translate
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from missing_file_check.config.models import ShieldRule, MappingRule
 from missing_file_check.adapters.base import FileEntry
 
+# Group references - backreferences and (?(id)yes|no) conditionals - would
+# be renumbered inside a combined alternation
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
 
 class RuleEngine:
     """Applies shield and mapping rules to categorize missing files."""
@@ -36,10 +40,14 @@ class RuleEngine:
             try:
                 # Try to compile as regex first
                 compiled = re.compile(rule.pattern)
-                self._compiled_shields.append(("regex", compiled, rule))
             except re.error:
-                # Fall back to glob pattern
-                self._compiled_shields.append(("glob", rule.pattern, rule))
+                # Fall back to glob pattern, translated to regex once up front
+                # so matching doesn't go through fnmatch on every path
+                compiled = re.compile(translate(rule.pattern))
+            self._compiled_shields.append((compiled, rule))
+        self._shield_prefilter = self._combine_patterns(
+            [compiled for compiled, _ in self._compiled_shields]
+        )
 
         # Compile mapping rules
         self._mapping_rules = mapping_rules
@@ -63,15 +71,43 @@ class RuleEngine:
         Returns:
             Tuple of (rule_id, remark) if matched, None otherwise
         """
-        for match_type, pattern, rule in self._compiled_shields:
-            if match_type == "regex":
-                if pattern.match(path):
-                    return (rule.id, rule.remark)
-            else:  # glob
-                if fnmatch(path, pattern):
-                    return (rule.id, rule.remark)
+        # Most paths match no rule; one combined match rejects them at once
+        if self._shield_prefilter and not self._shield_prefilter.match(path):
+            return None
+
+        for pattern, rule in self._compiled_shields:
+            if pattern.match(path):
+                return (rule.id, rule.remark)
         return None
 
+    @staticmethod
+    def _combine_patterns(patterns: List[re.Pattern]) -> Optional[re.Pattern]:
+        """
+        Combine compiled patterns into a single alternation.
+
+        Args:
+            patterns: Compiled patterns, in rule order
+
+        Returns:
+            Pattern matching wherever any input pattern matches, or None if
+            there are fewer than two patterns or they cannot be combined
+            (backreferences, mixed flags, inline global flags)
+        """
+        if len(patterns) < 2:
+            return None
+        flags = {pattern.flags for pattern in patterns}
+        if len(flags) > 1 or any(
+            _BACKREFERENCE.search(pattern.pattern) for pattern in patterns
+        ):
+            return None
+        try:
+            return re.compile(
+                "|".join(f"(?:{pattern.pattern})" for pattern in patterns),
+                flags.pop(),
+            )
+        except re.error:
+            return None
+
     def apply_mapping_rules(
         self, path: str, target_paths: Set[str]
     ) -> Optional[Tuple[str, str, str]]:
@@ -128,8 +164,34 @@ class RuleEngine:
             - "missed": not matched by any rule
             - "failed": file exists but has failed status
         """
-        results = []
+        return list(
+            self.iter_categorized_files(
+                missing_paths, failed_files, baseline_files, target_paths
+            )
+        )
+
+    def iter_categorized_files(
+        self,
+        missing_paths: Set[str],
+        failed_files: List[Tuple[str, str]],
+        baseline_files: Dict[str, Tuple[FileEntry, str]],
+        target_paths: Set[str],
+    ) -> Iterator[Dict]:
+        """
+        Lazily categorize missing and failed files.
+
+        Same as categorize_missing_files(), but yields one dictionary at a
+        time so callers converting the results never hold the whole list.
+
+        Args:
+            missing_paths: Set of paths in baseline but not in target
+            failed_files: List of (path, source_project) for failed files
+            baseline_files: Dict mapping path to (FileEntry, source_project)
+            target_paths: Set of all target file paths
 
+        Yields:
+            Categorized missing file dictionaries
+        """
         # Process missing files (baseline - target)
         for path in missing_paths:
             _, source_project = baseline_files[path]
@@ -138,62 +200,53 @@ class RuleEngine:
             shield_match = self.apply_shield_rules(path)
             if shield_match:
                 rule_id, remark = shield_match
-                results.append(
-                    {
-                        "path": path,
-                        "status": "shielded",
-                        "source_baseline_project": source_project,
-                        "shielded_by": rule_id,
-                        "shielded_remark": remark,
-                        "remapped_by": None,
-                        "remapped_to": None,
-                    }
-                )
+                yield {
+                    "path": path,
+                    "status": "shielded",
+                    "source_baseline_project": source_project,
+                    "shielded_by": rule_id,
+                    "shielded_remark": remark,
+                    "remapped_by": None,
+                    "remapped_to": None,
+                }
                 continue
 
             # 2. Check mapping rules
             mapping_match = self.apply_mapping_rules(path, target_paths)
             if mapping_match:
                 mapped_path, rule_id, remark = mapping_match
-                results.append(
-                    {
-                        "path": path,
-                        "status": "remapped",
-                        "source_baseline_project": source_project,
-                        "shielded_by": None,
-                        "shielded_remark": None,
-                        "remapped_by": rule_id,
-                        "remapped_to": mapped_path,
-                        "remapped_remark": remark,
-                    }
-                )
-                continue
-
-            # 3. No rules matched - truly missed
-            results.append(
-                {
+                yield {
                     "path": path,
-                    "status": "missed",
+                    "status": "remapped",
                     "source_baseline_project": source_project,
                     "shielded_by": None,
                     "shielded_remark": None,
-                    "remapped_by": None,
-                    "remapped_to": None,
+                    "remapped_by": rule_id,
+                    "remapped_to": mapped_path,
+                    "remapped_remark": remark,
                 }
-            )
+                continue
+
+            # 3. No rules matched - truly missed
+            yield {
+                "path": path,
+                "status": "missed",
+                "source_baseline_project": source_project,
+                "shielded_by": None,
+                "shielded_remark": None,
+                "remapped_by": None,
+                "remapped_to": None,
+            }
 
         # Process failed files (exist in target but failed)
         for path, source_project in failed_files:
-            results.append(
-                {
-                    "path": path,
-                    "status": "failed",
-                    "source_baseline_project": source_project,
-                    "shielded_by": None,
-                    "shielded_remark": None,
-                    "remapped_by": None,
-                    "remapped_to": None,
-                }
-            )
+            yield {
+                "path": path,
+                "status": "failed",
+                "source_baseline_project": source_project,
+                "shielded_by": None,
+                "shielded_remark": None,
+                "remapped_by": None,
+                "remapped_to": None,
+            }
 
-        return results
@@ -6,7 +6,8 @@ based on various matching criteria.
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
 
 from missing_file_check.config.models import ProjectConfig
 from missing_file_check.adapters.base import ProjectScanResult
@@ -23,6 +24,10 @@ class BaselineSelector(ABC):
     - Specific project and target combinations
     """
 
+    # Parallel fetching across baseline projects (set by MissingFileChecker)
+    enable_parallel: bool = True
+    max_workers: Optional[int] = None
+
     @abstractmethod
     def select(
         self,
@@ -44,6 +49,34 @@ class BaselineSelector(ABC):
         """
         pass
 
+    def _fetch_each(
+        self,
+        baseline_configs: List[ProjectConfig],
+        fetch: Callable[[ProjectConfig], Optional[ProjectScanResult]],
+    ) -> List[ProjectScanResult]:
+        """
+        Run fetch for every baseline config, concurrently when enabled.
+
+        Fetching is I/O-bound (API, FTP, local files), so configs are spread
+        over a thread pool. Result order follows baseline_configs and configs
+        for which fetch returns None are dropped.
+
+        Args:
+            baseline_configs: Baseline project configurations
+            fetch: Function fetching one project, returning None to skip it
+
+        Returns:
+            List of fetched baseline project scan results
+        """
+        if not self.enable_parallel or len(baseline_configs) <= 1:
+            results = [fetch(config) for config in baseline_configs]
+        else:
+            max_workers = self.max_workers or min(32, len(baseline_configs))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(fetch, baseline_configs))
+
+        return [result for result in results if result is not None]
+
 
 class SelectorError(Exception):
     """Base exception for selector-related errors."""
@@ -34,8 +34,7 @@ class LatestSuccessWithCommitIdMatcher(BaselineSelector):
         """Select baselines with matching commit_ids."""
         target_commit_ids = {r.build_info.commit_id for r in target_results}
 
-        baseline_results = []
-        for config in baseline_configs:
+        def fetch(config: ProjectConfig) -> Optional[ProjectScanResult]:
             adapter = AdapterFactory.create(config)
 
             # Try each target commit_id until we find a matching baseline build
@@ -43,10 +42,12 @@ class LatestSuccessWithCommitIdMatcher(BaselineSelector):
                 try:
                     result = adapter.fetch_files(commit_id=commit_id)
                     if result.build_info.build_status == "success":
-                        baseline_results.append(result)
-                        break
+                        return result
                 except Exception:
                     continue
+            return None
+
+        baseline_results = self._fetch_each(baseline_configs, fetch)
 
         if not baseline_results:
             raise SelectorError(
@@ -73,8 +74,7 @@ class LatestSuccessWithVersionMatcher(BaselineSelector):
         """Select baselines with matching versions."""
         target_versions = {r.build_info.b_version for r in target_results}
 
-        baseline_results = []
-        for config in baseline_configs:
+        def fetch(config: ProjectConfig) -> Optional[ProjectScanResult]:
             adapter = AdapterFactory.create(config)
 
             # Try each target version until we find a matching baseline build
@@ -82,10 +82,12 @@ class LatestSuccessWithVersionMatcher(BaselineSelector):
                 try:
                     result = adapter.fetch_files(b_version=b_version)
                     if result.build_info.build_status == "success":
-                        baseline_results.append(result)
-                        break
+                        return result
                 except Exception:
                     continue
+            return None
+
+        baseline_results = self._fetch_each(baseline_configs, fetch)
 
         if not baseline_results:
             raise SelectorError(
@@ -230,16 +232,19 @@ class LatestSuccessMatcher(BaselineSelector):
         target_results: List[ProjectScanResult],
     ) -> List[ProjectScanResult]:
         """Select latest successful build for all baselines."""
-        baseline_results = []
-        for config in baseline_configs:
+
+        def fetch(config: ProjectConfig) -> Optional[ProjectScanResult]:
             adapter = AdapterFactory.create(config)
             try:
                 result = adapter.fetch_files()  # No filters
                 if result.build_info.build_status == "success":
-                    baseline_results.append(result)
+                    return result
             except Exception:
                 # Skip this baseline if fetch fails
-                continue
+                pass
+            return None
+
+        baseline_results = self._fetch_each(baseline_configs, fetch)
 
         if not baseline_results:
             raise SelectorError("No successful baseline builds found")
@@ -261,15 +266,16 @@ class NoRestrictionSelector(BaselineSelector):
         target_results: List[ProjectScanResult],
     ) -> List[ProjectScanResult]:
         """Fetch all baseline projects without restrictions."""
-        baseline_results = []
-        for config in baseline_configs:
+
+        def fetch(config: ProjectConfig) -> Optional[ProjectScanResult]:
             adapter = AdapterFactory.create(config)
             try:
-                result = adapter.fetch_files()
-                baseline_results.append(result)
+                return adapter.fetch_files()
             except Exception:
                 # Skip this baseline if fetch fails
-                continue
+                return None
+
+        baseline_results = self._fetch_each(baseline_configs, fetch)
 
         if not baseline_results:
             raise SelectorError("Failed to fetch any baseline projects")
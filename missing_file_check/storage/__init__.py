@@ -1,47 +1,47 @@
-"""Storage module for persistence and report generation."""
-
-from missing_file_check.storage.models import (
-    Base,
-    TaskModel,
-    ProjectRelationModel,
-    PathPrefixModel,
-    ShieldRuleModel,
-    MappingRuleModel,
-    ScanResultModel,
-    MissingFileDetailModel,
-)
-from missing_file_check.storage.database import (
-    DatabaseManager,
-    get_db_manager,
-    init_db,
-    get_session,
-    session_scope,
-)
-from missing_file_check.storage.repository import MissingFileRepository
-from missing_file_check.storage.report_generator import ReportGenerator
-from missing_file_check.storage.object_storage import (
-    ObjectStorage,
-    ObjectStorageError,
-    PlaceholderObjectStorage,
-)
-
-__all__ = [
-    "Base",
-    "TaskModel",
-    "ProjectRelationModel",
-    "PathPrefixModel",
-    "ShieldRuleModel",
-    "MappingRuleModel",
-    "ScanResultModel",
-    "MissingFileDetailModel",
-    "DatabaseManager",
-    "get_db_manager",
-    "init_db",
-    "get_session",
-    "session_scope",
-    "MissingFileRepository",
-    "ReportGenerator",
-    "ObjectStorage",
-    "ObjectStorageError",
-    "PlaceholderObjectStorage",
-]
+"""Storage module for persistence and report generation.
+
+Submodules are imported on first attribute access so that report generation
+and object storage can be used without loading SQLAlchemy and the database
+driver.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "Base": "models",
+    "TaskModel": "models",
+    "ProjectRelationModel": "models",
+    "PathPrefixModel": "models",
+    "ShieldRuleModel": "models",
+    "MappingRuleModel": "models",
+    "ScanResultModel": "models",
+    "MissingFileDetailModel": "models",
+    "DatabaseManager": "database",
+    "get_db_manager": "database",
+    "init_db": "database",
+    "get_session": "database",
+    "session_scope": "database",
+    "MissingFileRepository": "repository",
+    "ReportGenerator": "report_generator",
+    "ObjectStorage": "object_storage",
+    "ObjectStorageError": "object_storage",
+    "PlaceholderObjectStorage": "object_storage",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import the submodule that defines ``name`` on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
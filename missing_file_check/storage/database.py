@@ -30,6 +30,7 @@ class DatabaseManager:
     - DB_CHARSET: Character set (default utf8mb4)
     - DB_POOL_SIZE: Connection pool size (default 5)
     - DB_MAX_OVERFLOW: Max overflow connections (default 10)
+    - DB_INSERT_PAGE_SIZE: Rows per batched INSERT statement (default 10000)
     """
 
     def __init__(self, connection_url: Optional[str] = None):
@@ -88,6 +89,7 @@ class DatabaseManager:
 
         pool_size = int(os.getenv("DB_POOL_SIZE", "5"))
         max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+        insert_page_size = int(os.getenv("DB_INSERT_PAGE_SIZE", "10000"))
 
         # Create engine with connection pool
         self.engine = create_engine(
@@ -96,6 +98,7 @@ class DatabaseManager:
             max_overflow=max_overflow,
             pool_pre_ping=True,  # Verify connections before using
             pool_recycle=3600,  # Recycle connections after 1 hour
+            insertmanyvalues_page_size=insert_page_size,  # Bulk insert batching
             echo=os.getenv("DB_ECHO", "false").lower() == "true",
         )
 
@@ -44,6 +44,17 @@ class TaskModel(Base):
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
     is_active = Column(Boolean, default=True)
 
+    # Covers the batch filters of MissingFileRepository.query_tasks()
+    __table_args__ = (
+        Index(
+            "idx_active_group_source_version",
+            "is_active",
+            "group_id",
+            "source_type",
+            "search_version",
+        ),
+    )
+
     def get_selector_params(self) -> Optional[dict]:
         """Parse JSON params."""
         if self.baseline_selector_params:
@@ -5,14 +5,15 @@ Generates comprehensive reports from CheckResult data.
 Supports uploading detailed file lists to object storage.
 """
 
-import json
 import os
 import tempfile
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
-from jinja2 import Template
+import orjson
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 
 from missing_file_check.scanner.checker import CheckResult
 from missing_file_check.storage.object_storage import (
@@ -21,9 +22,37 @@ from missing_file_check.storage.object_storage import (
 )
 
 
+@lru_cache(maxsize=None)
+def _template_environment(template_dir: str) -> Environment:
+    """
+    Get the shared Jinja environment for a template directory.
+
+    Compiled templates are kept in memory for the life of the process and
+    persisted as bytecode in the user's temp directory, so neither repeated
+    ReportGenerator construction nor a new process re-parses the template.
+
+    Args:
+        template_dir: Directory containing the template
+
+    Returns:
+        Environment loading templates from that directory
+    """
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        bytecode_cache=FileSystemBytecodeCache(),
+        auto_reload=False,
+    )
+
+
 class ReportGenerator:
     """Generator for HTML and JSON reports."""
 
+    # Number of rendered chunks / file entries buffered per disk write
+    STREAM_BUFFER_SIZE = 500
+
+    # Size of the file buffer used by the streaming writers (bytes)
+    WRITE_BUFFER_SIZE = 1 << 20
+
     def __init__(
         self,
         template_path: Optional[Path] = None,
@@ -51,8 +80,8 @@ class ReportGenerator:
                 )
 
         if template_path and template_path.exists():
-            with open(template_path, "r", encoding="utf-8") as f:
-                self.html_template = Template(f.read())
+            env = _template_environment(str(template_path.resolve().parent))
+            self.html_template: Template = env.get_template(template_path.name)
         else:
             raise FileNotFoundError(
                 f"Template file not found: {template_path}. "
@@ -74,6 +103,46 @@ class ReportGenerator:
         if hasattr(self, "temp_dir") and self.temp_dir.exists():
             shutil.rmtree(self.temp_dir, ignore_errors=True)
 
+    @staticmethod
+    def _file_to_dict(file) -> dict:
+        """Convert a MissingFile to a JSON-serializable dict."""
+        return {
+            "path": file.path,
+            "status": file.status,
+            "source_baseline_project": file.source_baseline_project,
+            "shielded_by": file.shielded_by,
+            "shielded_remark": file.shielded_remark,
+            "remapped_by": file.remapped_by,
+            "remapped_to": file.remapped_to,
+            "remapped_remark": file.remapped_remark,
+            "ownership": file.ownership,
+            "miss_reason": file.miss_reason,
+            "first_detected_at": file.first_detected_at.isoformat()
+            if file.first_detected_at
+            else None,
+        }
+
+    @staticmethod
+    def _report_header(result: CheckResult) -> dict:
+        """Build the JSON report fields that precede the missing file list."""
+        return {
+            "task_id": result.task_id,
+            "timestamp": result.timestamp.isoformat(),
+            "statistics": {
+                "missed_count": result.statistics.missed_count,
+                "failed_count": result.statistics.failed_count,
+                "passed_count": result.statistics.passed_count,
+                "shielded_count": result.statistics.shielded_count,
+                "remapped_count": result.statistics.remapped_count,
+                "target_file_count": result.statistics.target_file_count,
+                "baseline_file_count": result.statistics.baseline_file_count,
+                "target_project_count": result.statistics.target_project_count,
+                "baseline_project_count": result.statistics.baseline_project_count,
+            },
+            "target_projects": result.target_project_ids,
+            "baseline_projects": result.baseline_project_ids,
+        }
+
     def _create_detail_file(
         self, result: CheckResult, status: str
     ) -> tuple[Path, list[dict]]:
@@ -87,45 +156,28 @@ class ReportGenerator:
         Returns:
             Tuple of (file_path, file_data_list)
         """
-        # Filter files by status
-        files = [f for f in result.missing_files if f.status == status]
+        # Filter files by status (grouped once per result)
+        files = result.by_status().get(status, [])
 
         # Convert to serializable format
-        file_data = [
-            {
-                "path": file.path,
-                "status": file.status,
-                "source_baseline_project": file.source_baseline_project,
-                "shielded_by": file.shielded_by,
-                "shielded_remark": file.shielded_remark,
-                "remapped_by": file.remapped_by,
-                "remapped_to": file.remapped_to,
-                "remapped_remark": file.remapped_remark,
-                "ownership": file.ownership,
-                "miss_reason": file.miss_reason,
-                "first_detected_at": file.first_detected_at.isoformat()
-                if file.first_detected_at
-                else None,
-            }
-            for file in files
-        ]
+        file_data = [self._file_to_dict(file) for file in files]
 
         # Create file path
         file_path = self.temp_dir / f"{result.task_id}_{status}_detail.json"
 
         # Write to file
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(
-                {
-                    "task_id": result.task_id,
-                    "status": status,
-                    "count": len(files),
-                    "generated_at": datetime.now().isoformat(),
-                    "files": file_data,
-                },
-                f,
-                ensure_ascii=False,
-                indent=2,
+        with open(file_path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    {
+                        "task_id": result.task_id,
+                        "status": status,
+                        "count": len(files),
+                        "generated_at": datetime.now().isoformat(),
+                        "files": file_data,
+                    },
+                    option=orjson.OPT_INDENT_2,
+                )
             )
 
         return file_path, files
@@ -210,8 +262,7 @@ class ReportGenerator:
 
         if output_path:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(html_content)
+            output_path.write_bytes(html_content.encode("utf-8"))
 
         return html_content
 
@@ -229,50 +280,109 @@ class ReportGenerator:
             Generated JSON content
         """
         # Convert CheckResult to JSON-serializable dict
-        report_data = {
-            "task_id": result.task_id,
-            "timestamp": result.timestamp.isoformat(),
-            "statistics": {
-                "missed_count": result.statistics.missed_count,
-                "failed_count": result.statistics.failed_count,
-                "passed_count": result.statistics.passed_count,
-                "shielded_count": result.statistics.shielded_count,
-                "remapped_count": result.statistics.remapped_count,
-                "target_file_count": result.statistics.target_file_count,
-                "baseline_file_count": result.statistics.baseline_file_count,
-                "target_project_count": result.statistics.target_project_count,
-                "baseline_project_count": result.statistics.baseline_project_count,
-            },
-            "target_projects": result.target_project_ids,
-            "baseline_projects": result.baseline_project_ids,
-            "missing_files": [
-                {
-                    "path": file.path,
-                    "status": file.status,
-                    "source_baseline_project": file.source_baseline_project,
-                    "shielded_by": file.shielded_by,
-                    "shielded_remark": file.shielded_remark,
-                    "remapped_by": file.remapped_by,
-                    "remapped_to": file.remapped_to,
-                    "remapped_remark": file.remapped_remark,
-                    "ownership": file.ownership,
-                    "miss_reason": file.miss_reason,
-                    "first_detected_at": file.first_detected_at.isoformat()
-                    if file.first_detected_at
-                    else None,
-                }
-                for file in result.missing_files
-            ],
-        }
+        report_data = self._report_header(result)
+        report_data["missing_files"] = [
+            self._file_to_dict(file) for file in result.missing_files
+        ]
 
-        json_content = json.dumps(report_data, ensure_ascii=False, indent=2)
+        json_bytes = orjson.dumps(report_data, option=orjson.OPT_INDENT_2)
 
         if output_path:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(json_content)
+            output_path.write_bytes(json_bytes)
+
+        return json_bytes.decode("utf-8")
+
+    def generate_html_stream(
+        self,
+        result: CheckResult,
+        output_path: Path,
+        upload_to_storage: bool = False,
+    ) -> int:
+        """
+        Render HTML report directly to disk.
+
+        The template is rendered incrementally and written in buffered
+        chunks, so the full document is never held in memory.
+
+        Args:
+            result: CheckResult from scanner
+            output_path: Path to save HTML file
+            upload_to_storage: If True, upload detail files to object storage
+
+        Returns:
+            Size of the written file in bytes
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "wb", buffering=self.WRITE_BUFFER_SIZE) as f:
+            self.generate_html_to(result, f, upload_to_storage=upload_to_storage)
+
+        return output_path.stat().st_size
+
+    def generate_html_to(
+        self,
+        result: CheckResult,
+        fp: BinaryIO,
+        upload_to_storage: bool = False,
+    ):
+        """
+        Render HTML report incrementally into an open binary file.
+
+        Args:
+            result: CheckResult from scanner
+            fp: Binary file object to write the UTF-8 encoded report to
+            upload_to_storage: If True, upload detail files to object storage
+        """
+        download_links = None
+        if upload_to_storage:
+            download_links = self._generate_download_links(result)
+
+        stream = self.html_template.stream(
+            result=result,
+            datetime=datetime,
+            download_links=download_links,
+        )
+        stream.enable_buffering(self.STREAM_BUFFER_SIZE)
+        stream.dump(fp, encoding="utf-8")
+
+    def generate_json_stream(self, result: CheckResult, output_path: Path) -> int:
+        """
+        Write JSON report directly to disk one file entry at a time.
+
+        Produces the same document as generate_json without building the
+        complete report string in memory.
+
+        Args:
+            result: CheckResult from scanner
+            output_path: Path to save JSON file
+
+        Returns:
+            Size of the written file in bytes
+        """
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        header = orjson.dumps(self._report_header(result), option=orjson.OPT_INDENT_2)
+
+        with open(output_path, "wb", buffering=self.WRITE_BUFFER_SIZE) as f:
+            # Reopen the header object (drop trailing "\n}") to append the list
+            f.write(header[:-2])
+            f.write(b',\n  "missing_files": [')
+
+            buffer = []
+            for i, file in enumerate(result.missing_files):
+                item = orjson.dumps(
+                    self._file_to_dict(file), option=orjson.OPT_INDENT_2
+                )
+                separator = b",\n    " if i else b"\n    "
+                buffer.append(separator + item.replace(b"\n", b"\n    "))
+                if len(buffer) >= self.STREAM_BUFFER_SIZE:
+                    f.write(b"".join(buffer))
+                    buffer.clear()
+            f.write(b"".join(buffer))
+
+            f.write(b"\n  ]\n}" if result.missing_files else b"]\n}")
 
-        return json_content
+        return output_path.stat().st_size
 
     def generate_both(
         self,
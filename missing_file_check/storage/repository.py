@@ -5,9 +5,11 @@ Provides high-level data access methods for task configuration,
 scan results, and missing file details.
 """
 
+import json
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Type
 
+from sqlalchemy import func, insert, select
 from sqlalchemy.orm import Session
 
 from missing_file_check.storage.models import (
@@ -48,28 +50,35 @@ class MissingFileRepository:
         Returns:
             Created ScanResultModel instance
         """
-        scan_result = ScanResultModel(
-            task_id=task_id,
-            status="completed",
-            missed_count=result.statistics.missed_count,
-            failed_count=result.statistics.failed_count,
-            passed_count=result.statistics.passed_count,
-            shielded_count=result.statistics.shielded_count,
-            remapped_count=result.statistics.remapped_count,
-            target_file_count=result.statistics.target_file_count,
-            baseline_file_count=result.statistics.baseline_file_count,
-            target_project_count=result.statistics.target_project_count,
-            baseline_project_count=result.statistics.baseline_project_count,
-            report_url=report_url,
-            report_generated_at=datetime.now() if report_url else None,
-            started_at=result.timestamp,
-            completed_at=datetime.now(),
-        )
-
-        # Set project IDs
-        scan_result.set_target_project_ids(result.target_project_ids)
-        scan_result.set_baseline_project_ids(result.baseline_project_ids)
-
+        now = datetime.now()
+        values = {
+            "task_id": task_id,
+            "status": "completed",
+            "missed_count": result.statistics.missed_count,
+            "failed_count": result.statistics.failed_count,
+            "passed_count": result.statistics.passed_count,
+            "shielded_count": result.statistics.shielded_count,
+            "remapped_count": result.statistics.remapped_count,
+            "target_file_count": result.statistics.target_file_count,
+            "baseline_file_count": result.statistics.baseline_file_count,
+            "target_project_count": result.statistics.target_project_count,
+            "baseline_project_count": result.statistics.baseline_project_count,
+            "target_project_ids": json.dumps(result.target_project_ids),
+            "baseline_project_ids": json.dumps(result.baseline_project_ids),
+            "report_url": report_url,
+            "report_generated_at": now if report_url else None,
+            "started_at": result.timestamp,
+            "completed_at": now,
+        }
+
+        if self.session.get_bind().dialect.insert_returning:
+            # INSERT ... RETURNING yields the row (and its ID) in one round-trip
+            return self.session.scalars(
+                insert(ScanResultModel).returning(ScanResultModel), [values]
+            ).one()
+
+        # Dialects without RETURNING (e.g. MySQL): fall back to add + flush
+        scan_result = ScanResultModel(**values)
         self.session.add(scan_result)
         self.session.flush()  # Get ID without committing
 
@@ -88,29 +97,30 @@ class MissingFileRepository:
         Returns:
             Number of records inserted
         """
-        details = []
-        for file in missing_files:
-            detail = MissingFileDetailModel(
-                scan_result_id=scan_result_id,
-                file_path=file.path,
-                status=file.status,
-                source_baseline_project=file.source_baseline_project,
-                shielded_by=file.shielded_by,
-                shielded_remark=file.shielded_remark,
-                remapped_by=file.remapped_by,
-                remapped_to=file.remapped_to,
-                remapped_remark=file.remapped_remark,
-                ownership=file.ownership,
-                miss_reason=file.miss_reason,
-                first_detected_at=file.first_detected_at,
-            )
-            details.append(detail)
-
-        # Bulk insert
-        if details:
-            self.session.bulk_save_objects(details)
-
-        return len(details)
+        rows = [
+            {
+                "scan_result_id": scan_result_id,
+                "file_path": file.path,
+                "status": file.status,
+                "source_baseline_project": file.source_baseline_project,
+                "shielded_by": file.shielded_by,
+                "shielded_remark": file.shielded_remark,
+                "remapped_by": file.remapped_by,
+                "remapped_to": file.remapped_to,
+                "remapped_remark": file.remapped_remark,
+                "ownership": file.ownership,
+                "miss_reason": file.miss_reason,
+                "first_detected_at": file.first_detected_at,
+            }
+            for file in missing_files
+        ]
+
+        # Single executemany through SQLAlchemy Core (batched by the engine's
+        # insertmanyvalues_page_size) instead of per-object ORM bookkeeping
+        if rows:
+            self.session.execute(insert(MissingFileDetailModel), rows)
+
+        return len(rows)
 
     def save_task_and_results(
         self,
@@ -118,6 +128,7 @@ class MissingFileRepository:
         result: CheckResult,
         report_url: Optional[str] = None,
         commit: bool = True,
+        include_details: bool = True,
     ) -> ScanResultModel:
         """
         Save complete scan results (summary + details).
@@ -127,6 +138,8 @@ class MissingFileRepository:
             result: CheckResult from scanner
             report_url: Optional report URL
             commit: Whether to commit transaction
+            include_details: Whether to save per-file details; when False
+                only the summary row is written
 
         Returns:
             Created ScanResultModel instance
@@ -135,7 +148,8 @@ class MissingFileRepository:
         scan_result = self.save_scan_result(task_id, result, report_url)
 
         # Save details
-        self.save_missing_files(scan_result.id, result.missing_files)
+        if include_details:
+            self.save_missing_files(scan_result.id, result.missing_files)
 
         if commit:
             self.session.commit()
@@ -200,6 +214,52 @@ class MissingFileRepository:
 
         return result[0] if result else None
 
+    def get_first_detected_at_bulk(
+        self,
+        file_paths: Sequence[str],
+        task_id: Optional[int] = None,
+        chunk_size: int = 1000,
+    ) -> Dict[str, datetime]:
+        """
+        Get the first detection timestamps for many files at once.
+
+        Issues one grouped MIN(created_at) query per chunk of paths instead
+        of one query per file.
+
+        Args:
+            file_paths: File paths to query
+            task_id: Optional task ID filter
+            chunk_size: Maximum number of paths bound into one IN (...) clause
+
+        Returns:
+            Dictionary mapping file_path to first detection datetime;
+            paths never detected before are absent
+        """
+        first_detected = {}
+        unique_paths = list(dict.fromkeys(file_paths))
+
+        for start in range(0, len(unique_paths), chunk_size):
+            chunk = unique_paths[start : start + chunk_size]
+            stmt = (
+                select(
+                    MissingFileDetailModel.file_path,
+                    func.min(MissingFileDetailModel.created_at),
+                )
+                .where(MissingFileDetailModel.file_path.in_(chunk))
+                .group_by(MissingFileDetailModel.file_path)
+            )
+
+            if task_id:
+                # No foreign key is declared, so spell out the join condition
+                stmt = stmt.join(
+                    ScanResultModel,
+                    MissingFileDetailModel.scan_result_id == ScanResultModel.id,
+                ).where(ScanResultModel.task_id == task_id)
+
+            first_detected.update(self.session.execute(stmt).tuples().all())
+
+        return first_detected
+
     def get_task_config(self, task_id: int) -> Optional[TaskModel]:
         """
         Get task configuration by ID.
@@ -288,6 +348,101 @@ class MissingFileRepository:
 
         return query.all()
 
+    def get_project_relations_bulk(
+        self, task_ids: Sequence[int]
+    ) -> Dict[int, List[ProjectRelationModel]]:
+        """
+        Get project relations for many tasks with one query per chunk.
+
+        Args:
+            task_ids: Task IDs
+
+        Returns:
+            Dictionary mapping task ID to its ProjectRelationModel instances;
+            tasks without relations are absent
+        """
+        return self._query_by_task_ids(ProjectRelationModel, task_ids)
+
+    def get_path_prefixes_bulk(
+        self, task_ids: Sequence[int]
+    ) -> Dict[int, List[PathPrefixModel]]:
+        """
+        Get path prefix configurations for many tasks.
+
+        Args:
+            task_ids: Task IDs
+
+        Returns:
+            Dictionary mapping task ID to its PathPrefixModel instances
+        """
+        return self._query_by_task_ids(PathPrefixModel, task_ids)
+
+    def get_shield_rules_bulk(
+        self, task_ids: Sequence[int], enabled_only: bool = True
+    ) -> Dict[int, List[ShieldRuleModel]]:
+        """
+        Get shield rules for many tasks.
+
+        Args:
+            task_ids: Task IDs
+            enabled_only: If True, only return enabled rules
+
+        Returns:
+            Dictionary mapping task ID to its ShieldRuleModel instances
+        """
+        return self._query_by_task_ids(ShieldRuleModel, task_ids, enabled_only)
+
+    def get_mapping_rules_bulk(
+        self, task_ids: Sequence[int], enabled_only: bool = True
+    ) -> Dict[int, List[MappingRuleModel]]:
+        """
+        Get mapping rules for many tasks.
+
+        Args:
+            task_ids: Task IDs
+            enabled_only: If True, only return enabled rules
+
+        Returns:
+            Dictionary mapping task ID to its MappingRuleModel instances
+        """
+        return self._query_by_task_ids(MappingRuleModel, task_ids, enabled_only)
+
+    def _query_by_task_ids(
+        self,
+        model: Type,
+        task_ids: Sequence[int],
+        enabled_only: bool = False,
+        chunk_size: int = 1000,
+    ) -> Dict[int, list]:
+        """
+        Load rows of a per-task table for many tasks, grouped by task ID.
+
+        Rows are ordered by ID, so rule order matches insertion order.
+
+        Args:
+            model: Model class with task_id (and enabled, if filtered) columns
+            task_ids: Task IDs
+            enabled_only: If True, only return rows with enabled set
+            chunk_size: Maximum number of IDs bound into one IN (...) clause
+
+        Returns:
+            Dictionary mapping task ID to its rows
+        """
+        grouped: Dict[int, list] = {}
+        unique_ids = list(dict.fromkeys(task_ids))
+
+        for start in range(0, len(unique_ids), chunk_size):
+            stmt = select(model).where(
+                model.task_id.in_(unique_ids[start : start + chunk_size])
+            )
+            if enabled_only:
+                stmt = stmt.where(model.enabled == True)
+
+            for row in self.session.scalars(stmt.order_by(model.id)):
+                grouped.setdefault(row.task_id, []).append(row)
+
+        return grouped
+
     def get_scan_results(
         self,
         task_id: Optional[int] = None,
@@ -0,0 +1,148 @@
+"""
+Cache building blocks shared by the adapter, analyzer and config caches.
+
+Provides a thread-safe in-memory LRU and helpers that pickle values under
+MISSING_FILE_CACHE_DIR. Disk entries store their key next to the value,
+so a hash collision or a file from another layout counts as a miss.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """Thread-safe in-memory mapping that evicts least recently used keys."""
+
+    def __init__(self, capacity: int):
+        """
+        Initialize an empty cache.
+
+        Args:
+            capacity: Maximum number of entries kept
+        """
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up a key, marking it as recently used.
+
+        Args:
+            key: Key to look up
+
+        Returns:
+            Stored value, or None on a miss
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """
+        Store a value, evicting the oldest entry above capacity.
+
+        Args:
+            key: Key to store under
+            value: Value to store; None cannot be told apart from a miss
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable):
+        """Remove a key if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def disk_cache_path(key: Hashable, subdir: str = "") -> Optional[Path]:
+    """
+    Return the on-disk location for a key.
+
+    Args:
+        key: Hashable, repr-stable key
+        subdir: Directory below MISSING_FILE_CACHE_DIR
+
+    Returns:
+        Path of the pickle file, or None if the disk cache is off
+    """
+    cache_dir = os.getenv("MISSING_FILE_CACHE_DIR")
+    if not cache_dir:
+        return None
+    digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+    return Path(cache_dir).expanduser() / subdir / f"{digest}.pkl"
+
+
+def load_pickle(key: Hashable, subdir: str = "") -> Optional[Any]:
+    """
+    Read a value stored by save_pickle().
+
+    Args:
+        key: Key the value was stored under
+        subdir: Directory below MISSING_FILE_CACHE_DIR
+
+    Returns:
+        Stored value, or None if the disk cache is off, the file is
+        missing or unreadable, or it was stored under a different key
+    """
+    path = disk_cache_path(key, subdir)
+    if path is None or not path.exists():
+        return None
+
+    try:
+        with open(path, "rb") as f:
+            stored_key, value = pickle.load(f)
+    except Exception:
+        return None
+
+    return value if stored_key == key else None
+
+
+def save_pickle(key: Hashable, value: Any, subdir: str = ""):
+    """
+    Pickle a value atomically; failures only disable caching.
+
+    The value is written to a uniquely named temporary file in the target
+    directory and renamed into place, so concurrent writers from any
+    thread or process never interleave.
+
+    Args:
+        key: Key to store the value under
+        value: Picklable value
+        subdir: Directory below MISSING_FILE_CACHE_DIR
+    """
+    path = disk_cache_path(key, subdir)
+    if path is None:
+        return
+
+    tmp_path = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=path.stem, suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = f.name
+            pickle.dump((key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except (OSError, pickle.PicklingError):
+        if tmp_path is not None:
+            Path(tmp_path).unlink(missing_ok=True)
@@ -0,0 +1,59 @@
+"""
+Database migration script to add the batch filter index on tasks.
+
+Tables created before the index was declared on TaskModel do not get it
+from create_tables.py, since create_all() never alters existing tables.
+This script creates idx_active_group_source_version if it is missing.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+
+from missing_file_check.storage.database import DatabaseManager
+from missing_file_check.storage.models import TaskModel
+
+# Load environment variables
+load_dotenv()
+
+INDEX_NAME = "idx_active_group_source_version"
+
+
+def migrate_database() -> bool:
+    """Create the task filter index if it does not exist yet."""
+    print("=" * 70)
+    print("Database Migration: Add Task Filter Index")
+    print("=" * 70)
+
+    try:
+        db_manager = DatabaseManager()
+        db_manager.initialize()
+
+        index = next(i for i in TaskModel.__table__.indexes if i.name == INDEX_NAME)
+        # checkfirst skips creation when the index already exists
+        index.create(db_manager.engine, checkfirst=True)
+    except Exception as e:
+        print(f"\n❌ Migration failed: {e}")
+        return False
+
+    print(f"\n✅ Index {INDEX_NAME} is in place on missing_file_tasks")
+    return True
+
+
+def main():
+    """Main entry point."""
+    if not os.getenv("DB_HOST"):
+        print("⚠️  Warning: DB_HOST not set in environment")
+        print("   Please configure .env file or set environment variables")
+        return 1
+
+    return 0 if migrate_database() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
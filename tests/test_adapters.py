@@ -7,6 +7,7 @@ Tests API, FTP, and Local file adapters with mock data and servers.
 import json
 import os
 import pytest
+from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
 
 from missing_file_check.config.models import ProjectConfig, ProjectType
@@ -14,6 +15,7 @@ from missing_file_check.adapters.api_adapter import APIProjectAdapter
 from missing_file_check.adapters.local_adapter import LocalProjectAdapter
 from missing_file_check.adapters.ftp_adapter import FTPProjectAdapter
 from missing_file_check.adapters.factory import AdapterFactory
+from missing_file_check.adapters.base import AdapterError, parse_datetime
 
 
 class TestLocalAdapter:
@@ -85,6 +87,56 @@ class TestLocalAdapter:
 
         assert result.build_info.b_version == "1.0.0"
 
+    def test_commit_filter_searches_older_scan_files(self, tmp_path):
+        """Test filters select the matching file, not just the newest."""
+        old_scan = tmp_path / "scan_old.json"
+        old_scan.write_text(
+            json.dumps({"build_info": {"commit_id": "old"}, "files": ["/a.py"]})
+        )
+        new_scan = tmp_path / "scan_new.json"
+        new_scan.write_text(json.dumps({"build_info": {"commit_id": "new"}}))
+        os.utime(old_scan, (1_000_000, 1_000_000))
+
+        config = ProjectConfig(
+            project_id="local-search",
+            project_name="Local Search Project",
+            project_type=ProjectType.LOCAL,
+            connection={"base_path": str(tmp_path), "file_pattern": "scan_*.json"},
+        )
+        adapter = LocalProjectAdapter(config)
+
+        assert adapter.fetch_files().build_info.commit_id == "new"
+        result = adapter.fetch_files(commit_id="old")
+        assert [f.path for f in result.files] == ["/a.py"]
+        with pytest.raises(AdapterError, match="does not match"):
+            adapter.fetch_files(commit_id="missing")
+
+    def test_file_pattern_placeholders_narrow_search(self, tmp_path):
+        """Test {commit_id} in file_pattern avoids reading other scan files."""
+        (tmp_path / "scan_abc_1.json").write_text(
+            json.dumps({"build_info": {"commit_id": "abc"}})
+        )
+        (tmp_path / "scan_def_1.json").write_text("not json")
+
+        config = ProjectConfig(
+            project_id="local-template",
+            project_name="Local Template Project",
+            project_type=ProjectType.LOCAL,
+            connection={
+                "base_path": str(tmp_path),
+                "file_pattern": "scan_{commit_id}_*.json",
+            },
+        )
+        adapter = LocalProjectAdapter(config)
+
+        with patch.object(
+            adapter, "_read_build_data", wraps=adapter._read_build_data
+        ) as read:
+            result = adapter.fetch_files(commit_id="abc")
+
+        assert result.build_info.commit_id == "abc"
+        assert [c.args[0].name for c in read.call_args_list] == ["scan_abc_1.json"]
+
     def test_file_not_found(self):
         """Test error handling when file doesn't exist."""
         config = ProjectConfig(
@@ -105,38 +157,42 @@ class TestLocalAdapter:
 class TestAPIAdapter:
     """Test API adapter with mocked requests."""
 
-    @patch("missing_file_check.adapters.api_adapter.requests.request")
+    @patch("missing_file_check.adapters.api_adapter.requests.Session.request")
     def test_fetch_files_from_api(self, mock_request):
         """Test fetching files from API with mocked responses."""
         # Mock build info response
         build_response = Mock()
         build_response.status_code = 200
-        build_response.json.return_value = {
-            "data": [
-                {
-                    "build_no": "BUILD-API-001",
-                    "build_status": "success",
-                    "branch": "main",
-                    "commit_id": "xyz789",
-                    "b_version": "2.0.0",
-                    "build_url": "https://example.com/build/001",
-                    "start_time": "2026-01-27T10:00:00Z",
-                    "end_time": "2026-01-27T10:30:00Z",
-                }
-            ]
-        }
+        build_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "build_no": "BUILD-API-001",
+                        "build_status": "success",
+                        "branch": "main",
+                        "commit_id": "xyz789",
+                        "b_version": "2.0.0",
+                        "build_url": "https://example.com/build/001",
+                        "start_time": "2026-01-27T10:00:00Z",
+                        "end_time": "2026-01-27T10:30:00Z",
+                    }
+                ]
+            }
+        ).encode("utf-8")
 
         # Mock file list response
         files_response = Mock()
         files_response.status_code = 200
-        files_response.json.return_value = {
-            "data": [
-                {"file_path": "/api/src/main.py", "status": "success"},
-                {"file_path": "/api/src/utils.py", "status": "success"},
-                {"file_path": "/api/src/config.py", "status": "failed"},
-            ],
-            "pagination": {"total_pages": 1},
-        }
+        files_response.content = json.dumps(
+            {
+                "data": [
+                    {"file_path": "/api/src/main.py", "status": "success"},
+                    {"file_path": "/api/src/utils.py", "status": "success"},
+                    {"file_path": "/api/src/config.py", "status": "failed"},
+                ],
+                "pagination": {"total_pages": 1},
+            }
+        ).encode("utf-8")
 
         # Configure mock to return different responses
         mock_request.side_effect = [build_response, files_response]
@@ -166,32 +222,36 @@ class TestAPIAdapter:
         assert len(failed_files) == 1
         assert failed_files[0].path == "/api/src/config.py"
 
-    @patch("missing_file_check.adapters.api_adapter.requests.request")
+    @patch("missing_file_check.adapters.api_adapter.requests.Session.request")
     def test_fetch_with_filters(self, mock_request):
         """Test API fetch with commit_id filter."""
         build_response = Mock()
         build_response.status_code = 200
-        build_response.json.return_value = {
-            "data": [
-                {
-                    "build_no": "BUILD-002",
-                    "build_status": "success",
-                    "branch": "feature",
-                    "commit_id": "filtered123",
-                    "b_version": "2.1.0",
-                    "build_url": "https://example.com/build/002",
-                    "start_time": "2026-01-27T11:00:00Z",
-                    "end_time": "2026-01-27T11:30:00Z",
-                }
-            ]
-        }
+        build_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "build_no": "BUILD-002",
+                        "build_status": "success",
+                        "branch": "feature",
+                        "commit_id": "filtered123",
+                        "b_version": "2.1.0",
+                        "build_url": "https://example.com/build/002",
+                        "start_time": "2026-01-27T11:00:00Z",
+                        "end_time": "2026-01-27T11:30:00Z",
+                    }
+                ]
+            }
+        ).encode("utf-8")
 
         files_response = Mock()
         files_response.status_code = 200
-        files_response.json.return_value = {
-            "data": [{"file_path": "/api/test.py", "status": "success"}],
-            "pagination": {"total_pages": 1},
-        }
+        files_response.content = json.dumps(
+            {
+                "data": [{"file_path": "/api/test.py", "status": "success"}],
+                "pagination": {"total_pages": 1},
+            }
+        ).encode("utf-8")
 
         mock_request.side_effect = [build_response, files_response]
 
@@ -212,45 +272,51 @@ class TestAPIAdapter:
         assert result.build_info.commit_id == "filtered123"
         assert len(result.files) == 1
 
-    @patch("missing_file_check.adapters.api_adapter.requests.request")
+    @patch("missing_file_check.adapters.api_adapter.requests.Session.request")
     def test_pagination_handling(self, mock_request):
         """Test API adapter handles pagination correctly."""
         build_response = Mock()
         build_response.status_code = 200
-        build_response.json.return_value = {
-            "data": [
-                {
-                    "build_no": "BUILD-003",
-                    "build_status": "success",
-                    "branch": "main",
-                    "commit_id": "page123",
-                    "b_version": "3.0.0",
-                    "build_url": "https://example.com/build/003",
-                    "start_time": "2026-01-27T12:00:00Z",
-                    "end_time": "2026-01-27T12:30:00Z",
-                }
-            ]
-        }
+        build_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "build_no": "BUILD-003",
+                        "build_status": "success",
+                        "branch": "main",
+                        "commit_id": "page123",
+                        "b_version": "3.0.0",
+                        "build_url": "https://example.com/build/003",
+                        "start_time": "2026-01-27T12:00:00Z",
+                        "end_time": "2026-01-27T12:30:00Z",
+                    }
+                ]
+            }
+        ).encode("utf-8")
 
         # Mock paginated file responses
         page1_response = Mock()
         page1_response.status_code = 200
-        page1_response.json.return_value = {
-            "data": [
-                {"file_path": "/api/file1.py", "status": "success"},
-                {"file_path": "/api/file2.py", "status": "success"},
-            ],
-            "pagination": {"total_pages": 2},
-        }
+        page1_response.content = json.dumps(
+            {
+                "data": [
+                    {"file_path": "/api/file1.py", "status": "success"},
+                    {"file_path": "/api/file2.py", "status": "success"},
+                ],
+                "pagination": {"total_pages": 2},
+            }
+        ).encode("utf-8")
 
         page2_response = Mock()
         page2_response.status_code = 200
-        page2_response.json.return_value = {
-            "data": [
-                {"file_path": "/api/file3.py", "status": "success"},
-            ],
-            "pagination": {"total_pages": 2},
-        }
+        page2_response.content = json.dumps(
+            {
+                "data": [
+                    {"file_path": "/api/file3.py", "status": "success"},
+                ],
+                "pagination": {"total_pages": 2},
+            }
+        ).encode("utf-8")
 
         mock_request.side_effect = [build_response, page1_response, page2_response]
 
@@ -271,6 +337,103 @@ class TestAPIAdapter:
         # Should have collected files from both pages
         assert len(result.files) == 3
 
+    def test_retry_policy_mounted_on_session(self):
+        """Test max_retries attempts map onto the session's urllib3 policy."""
+        config = ProjectConfig(
+            project_id="api-retry",
+            project_name="Retry API Project",
+            project_type=ProjectType.TARGET_PROJECT_API,
+            connection={
+                "api_endpoint": "https://api.example.com",
+                "token": "retry-token",
+                "project_key": "API-RETRY",
+                "max_retries": 4,
+            },
+        )
+
+        adapter = APIProjectAdapter(config)
+        retry = adapter.session.get_adapter("https://api.example.com").max_retries
+
+        assert retry.total == 3
+        assert 503 in retry.status_forcelist
+        assert 404 not in retry.status_forcelist
+        assert retry.respect_retry_after_header
+
+    @patch("missing_file_check.adapters.api_adapter.requests.Session.request")
+    def test_include_files_skips_first_page_request(self, mock_request):
+        """Test embedded first page is used instead of a separate request."""
+        build_response = Mock()
+        build_response.status_code = 200
+        build_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "build_no": "BUILD-INC",
+                        "build_status": "success",
+                        "branch": "main",
+                        "commit_id": "inc123",
+                        "start_time": "2026-01-27T12:00:00Z",
+                        "end_time": "2026-01-27T12:30:00Z",
+                        "files": {
+                            "data": [{"file_path": "/api/file1.py"}],
+                            "pagination": {"total_pages": 1},
+                        },
+                    }
+                ]
+            }
+        ).encode("utf-8")
+        mock_request.return_value = build_response
+
+        config = ProjectConfig(
+            project_id="api-include",
+            project_name="Include API Project",
+            project_type=ProjectType.TARGET_PROJECT_API,
+            connection={
+                "api_endpoint": "https://api.example.com",
+                "token": "include-token",
+                "project_key": "API-INC",
+                "supports_include_files": True,
+            },
+        )
+
+        result = APIProjectAdapter(config).fetch_files()
+
+        assert [f.path for f in result.files] == ["/api/file1.py"]
+        assert mock_request.call_count == 1
+        assert mock_request.call_args.kwargs["params"]["include"] == "files"
+
+    @patch("missing_file_check.adapters.api_adapter.requests.Session.request")
+    def test_not_modified_response_served_from_cache(self, mock_request):
+        """Test conditional GET reuses the cached body on 304."""
+        fresh = Mock()
+        fresh.status_code = 200
+        fresh.headers = {"ETag": '"v1"'}
+        fresh.content = json.dumps({"data": [{"file_path": "/a.py"}]}).encode("utf-8")
+
+        not_modified = Mock()
+        not_modified.status_code = 304
+        not_modified.headers = {}
+
+        mock_request.side_effect = [fresh, not_modified]
+
+        config = ProjectConfig(
+            project_id="api-etag",
+            project_name="ETag API Project",
+            project_type=ProjectType.TARGET_PROJECT_API,
+            connection={
+                "api_endpoint": "https://api.example.com",
+                "token": "etag-token",
+                "project_key": "API-ETAG",
+            },
+        )
+        adapter = APIProjectAdapter(config)
+
+        first = adapter._make_request("GET", "https://api.example.com/x")
+        second = adapter._make_request("GET", "https://api.example.com/x")
+
+        assert second == first
+        assert mock_request.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
 
 class TestFTPAdapter:
     """Test FTP adapter with mocked FTP server."""
@@ -335,6 +498,197 @@ class TestFTPAdapter:
         mock_ftp.login.assert_called_once_with("user", "pass")
         mock_ftp.cwd.assert_called_once_with("/scans")
 
+    @patch("missing_file_check.adapters.ftp_adapter.FTP")
+    def test_latest_file_found_via_mlsd(self, mock_ftp_class):
+        """Test newest scan file is picked from one MLSD listing."""
+        mock_ftp = MagicMock()
+        mock_ftp_class.return_value = mock_ftp
+        mock_ftp.mlsd.return_value = [
+            ("old.json", {"type": "file", "modify": "20260101000000"}),
+            ("new.json", {"type": "file", "modify": "20260127080000"}),
+            ("notes.txt", {"type": "file", "modify": "20260201000000"}),
+            ("archive", {"type": "dir", "modify": "20260301000000"}),
+        ]
+        downloaded = []
+
+        def mock_retrbinary(cmd, callback):
+            downloaded.append(cmd)
+            callback(json.dumps({"build_info": {}, "files": []}).encode("utf-8"))
+
+        mock_ftp.retrbinary.side_effect = mock_retrbinary
+
+        config = ProjectConfig(
+            project_id="ftp-mlsd",
+            project_name="FTP MLSD Project",
+            project_type=ProjectType.FTP,
+            connection={
+                "host": "ftp.example.com",
+                "username": "user",
+                "password": "pass",
+                "base_path": "/scans",
+            },
+        )
+
+        FTPProjectAdapter(config).fetch_files()
+
+        assert downloaded == ["RETR new.json"]
+        mock_ftp.nlst.assert_not_called()
+        mock_ftp.sendcmd.assert_not_called()
+
+    @patch("missing_file_check.adapters.ftp_adapter.FTP")
+    def test_latest_file_skips_index_file(self, mock_ftp_class):
+        """Test the index is never picked as the newest scan file."""
+        from ftplib import error_perm
+
+        mock_ftp = MagicMock()
+        mock_ftp_class.return_value = mock_ftp
+        listing = [
+            ("scan.json", {"type": "file", "modify": "20260101000000"}),
+            ("index.json", {"type": "file", "modify": "20260201000000"}),
+        ]
+        mock_ftp.nlst.return_value = [name for name, _ in listing]
+        mock_ftp.sendcmd.side_effect = lambda cmd: "213 " + dict(listing)[
+            cmd.split()[1]
+        ]["modify"]
+        downloaded = []
+
+        def mock_retrbinary(cmd, callback):
+            downloaded.append(cmd)
+            callback(json.dumps({"build_info": {}, "files": []}).encode("utf-8"))
+
+        mock_ftp.retrbinary.side_effect = mock_retrbinary
+
+        config = ProjectConfig(
+            project_id="ftp-index-newest",
+            project_name="FTP Index Newest Project",
+            project_type=ProjectType.FTP,
+            connection={
+                "host": "ftp.example.com",
+                "username": "user",
+                "password": "pass",
+                "base_path": "/scans",
+            },
+        )
+
+        # MLSD listing
+        mock_ftp.mlsd.return_value = listing
+        FTPProjectAdapter(config).fetch_files()
+        # NLST + MDTM fallback when MLSD is not supported
+        mock_ftp.mlsd.side_effect = error_perm("500 Unknown command")
+        FTPProjectAdapter(config).fetch_files()
+
+        assert downloaded == ["RETR scan.json", "RETR scan.json"]
+
+    @patch("missing_file_check.adapters.ftp_adapter.FTP")
+    def test_filter_search_uses_index_file(self, mock_ftp_class):
+        """Test commit_id lookup downloads only the index and the match."""
+        from ftplib import error_perm
+
+        mock_ftp = MagicMock()
+        mock_ftp_class.return_value = mock_ftp
+        mock_ftp.nlst.return_value = ["a.json", "b.json", "index.json"]
+
+        contents = {
+            "index.json": [{"filename": "b.json", "commit_id": "c2"}],
+            "b.json": {"build_info": {"commit_id": "c2"}, "files": ["/src/b.py"]},
+        }
+
+        def mock_retrbinary(cmd, callback):
+            name = cmd.split()[1]
+            if name not in contents:
+                raise error_perm("550 unexpected download")
+            callback(json.dumps(contents[name]).encode("utf-8"))
+
+        mock_ftp.retrbinary.side_effect = mock_retrbinary
+
+        config = ProjectConfig(
+            project_id="ftp-index",
+            project_name="FTP Index Project",
+            project_type=ProjectType.FTP,
+            connection={
+                "host": "ftp.example.com",
+                "username": "user",
+                "password": "pass",
+                "base_path": "/scans",
+            },
+        )
+
+        result = FTPProjectAdapter(config).fetch_files(commit_id="c2")
+
+        assert [f.path for f in result.files] == ["/src/b.py"]
+        downloaded = [c.args[0] for c in mock_ftp.retrbinary.call_args_list]
+        assert downloaded == ["RETR index.json", "RETR b.json"]
+
+    @pytest.mark.parametrize(
+        "index, listing",
+        [
+            ([{"filename": "gone.json", "commit_id": "c2"}], ["a.json", "b.json"]),
+            ([{"filename": "gone.json", "commit_id": "c2"}], ["gone.json", "b.json"]),
+            (5, ["a.json", "b.json"]),
+            ({"scans": None}, ["a.json", "b.json"]),
+        ],
+    )
+    @patch("missing_file_check.adapters.ftp_adapter.FTP")
+    def test_filter_search_survives_bad_index(self, mock_ftp_class, index, listing):
+        """Test stale or malformed index entries fall back to the listing."""
+        from ftplib import error_perm
+
+        mock_ftp = MagicMock()
+        mock_ftp_class.return_value = mock_ftp
+        mock_ftp.nlst.return_value = listing + ["index.json"]
+
+        contents = {
+            "index.json": index,
+            "a.json": {"build_info": {"commit_id": "c1"}, "files": []},
+            "b.json": {"build_info": {"commit_id": "c2"}, "files": ["/src/b.py"]},
+        }
+
+        def mock_retrbinary(cmd, callback):
+            name = cmd.split()[1]
+            if name not in contents:
+                raise error_perm("550 No such file")
+            callback(json.dumps(contents[name]).encode("utf-8"))
+
+        mock_ftp.retrbinary.side_effect = mock_retrbinary
+
+        config = ProjectConfig(
+            project_id="ftp-index",
+            project_name="FTP Index Project",
+            project_type=ProjectType.FTP,
+            connection={
+                "host": "ftp.example.com",
+                "username": "user",
+                "password": "pass",
+                "base_path": "/scans",
+            },
+        )
+
+        result = FTPProjectAdapter(config).fetch_files(commit_id="c2")
+
+        assert [f.path for f in result.files] == ["/src/b.py"]
+
+
+class TestParseDatetime:
+    """Test the shared adapter datetime parser."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("2026-01-27T10:00:00Z", datetime(2026, 1, 27, 10, 0)),
+            ("2026-01-27T10:00:00.250Z", datetime(2026, 1, 27, 10, 0, 0, 250000)),
+            ("2026-01-27 10:00:00", datetime(2026, 1, 27, 10, 0)),
+            ("2026-01-27T18:00:00+08:00", datetime(2026, 1, 27, 10, 0)),
+        ],
+    )
+    def test_parses_to_naive_utc(self, value, expected):
+        """Test supported layouts all yield naive datetimes."""
+        assert parse_datetime(value) == expected
+
+    def test_rejects_unknown_format(self):
+        """Test unparseable strings raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_datetime("27/01/2026")
+
 
 class TestAdapterFactory:
     """Test adapter factory registration and creation."""
@@ -380,6 +734,49 @@ class TestAdapterFactory:
         ftp_adapter = AdapterFactory.create(ftp_config)
         assert isinstance(ftp_adapter, FTPProjectAdapter)
 
+    def test_factory_caches_adapters_by_config_content(self):
+        """Test that equal configs reuse one adapter instance."""
+        AdapterFactory.clear_cache()
+
+        def make_config(base_path):
+            return ProjectConfig(
+                project_id="test-local",
+                project_name="Test Local",
+                project_type=ProjectType.LOCAL,
+                connection={"base_path": base_path},
+            )
+
+        first = AdapterFactory.create(make_config("/test"))
+        again = AdapterFactory.create(make_config("/test"))
+        other = AdapterFactory.create(make_config("/other"))
+
+        assert first is again
+        assert other is not first
+
+    def test_fetch_all_isolates_failures(self):
+        """Test that one failing project does not cancel the others."""
+        good = ProjectConfig(
+            project_id="good",
+            project_name="Good",
+            project_type=ProjectType.LOCAL,
+            connection={
+                "base_path": "test_data",
+                "file_pattern": "target_scan_result.json",
+            },
+        )
+        bad = ProjectConfig(
+            project_id="bad",
+            project_name="Bad",
+            project_type=ProjectType.LOCAL,
+            connection={"base_path": "/nonexistent"},
+        )
+
+        results = AdapterFactory.fetch_all([bad, good, bad])
+
+        assert isinstance(results[0], AdapterError)
+        assert results[1].files
+        assert isinstance(results[2], AdapterError)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -20,6 +20,11 @@ from missing_file_check.scanner.normalizer import PathNormalizer
 from missing_file_check.scanner.merger import FileMerger
 from missing_file_check.scanner.comparator import FileComparator
 from missing_file_check.scanner.rule_engine import RuleEngine
+from missing_file_check.scanner.checker import (
+    CheckResult,
+    MissingFile,
+    ResultStatistics,
+)
 
 
 class TestPathNormalizer:
@@ -176,6 +181,39 @@ class TestRuleEngine:
         assert result is not None
         assert result[0] == "S1"
 
+    def test_shield_rule_with_glob_fallback(self):
+        """Test shield pattern that is not a valid regex falls back to glob."""
+        rules = [ShieldRule(id="S1", pattern="*.log", remark="Log files")]
+        engine = RuleEngine(rules, [])
+
+        assert engine.apply_shield_rules("logs/app.log") == ("S1", "Log files")
+        assert engine.apply_shield_rules("src/app.py") is None
+
+    def test_shield_rules_combined_keep_rule_order(self):
+        """Test the combined shield prefilter keeps first-match semantics."""
+        rules = [
+            ShieldRule(id="S1", pattern=r"build/.*", remark="Build"),
+            ShieldRule(id="S2", pattern="*.log", remark="Log files"),
+            ShieldRule(id="S3", pattern=r".*", remark="Everything"),
+        ]
+        engine = RuleEngine(rules, [])
+
+        assert engine._shield_prefilter is not None
+        assert engine.apply_shield_rules("build/app.log") == ("S1", "Build")
+        assert engine.apply_shield_rules("app.log") == ("S2", "Log files")
+        assert engine.apply_shield_rules("src/app.py") == ("S3", "Everything")
+
+    def test_shield_rules_with_conditional_group_not_combined(self):
+        """Test conditional group references bypass the combined prefilter."""
+        rules = [
+            ShieldRule(id="S1", pattern=r"(a)?b", remark="First"),
+            ShieldRule(id="S2", pattern=r"(x)?(?(1)y|zz)", remark="Conditional"),
+        ]
+        engine = RuleEngine(rules, [])
+
+        assert engine._shield_prefilter is None
+        assert engine.apply_shield_rules("xy") == ("S2", "Conditional")
+
     def test_mapping_rule(self):
         """Test path mapping rule."""
         rules = [
@@ -272,5 +310,54 @@ class TestConfigValidation:
             )
 
 
+class TestCheckResult:
+    """Test CheckResult helpers."""
+
+    def test_by_status_groups_files(self):
+        """Test files are grouped by status in one cached pass."""
+        files = [
+            MissingFile(path="a.py", status="missed"),
+            MissingFile(path="b.py", status="failed"),
+            MissingFile(path="c.py", status="missed"),
+        ]
+        result = CheckResult(
+            task_id="T1",
+            target_project_ids=["target1"],
+            baseline_project_ids=["baseline1"],
+            missing_files=files,
+            statistics=ResultStatistics(2, 1, 0, 0, 0, 3, 3, 1, 1),
+            timestamp=datetime.now(),
+        )
+
+        buckets = result.by_status()
+
+        assert [f.path for f in buckets["missed"]] == ["a.py", "c.py"]
+        assert [f.path for f in buckets["failed"]] == ["b.py"]
+        assert buckets["shielded"] == []
+        assert result.by_status() is buckets
+
+    def test_counts_filled_analysis_fields(self):
+        """Test analysis field counts reflect later updates."""
+        files = [
+            MissingFile(path="a.py", status="missed", ownership="team-a"),
+            MissingFile(path="b.py", status="failed", miss_reason="build error"),
+        ]
+        result = CheckResult(
+            task_id="T1",
+            target_project_ids=["target1"],
+            baseline_project_ids=["baseline1"],
+            missing_files=files,
+            statistics=ResultStatistics(1, 1, 0, 0, 0, 2, 2, 1, 1),
+            timestamp=datetime.now(),
+        )
+
+        assert result.counts()["ownership_filled"] == 1
+        assert result.counts()["reason_filled"] == 1
+
+        files[1].ownership = "team-b"
+        assert result.counts()["ownership_filled"] == 2
+        assert result.counts()["first_detected_filled"] == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
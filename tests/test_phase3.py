@@ -7,10 +7,16 @@ Tests storage layer, analyzers, and report generation.
 import json
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
 from datetime import datetime
 
 from missing_file_check.scanner.checker import CheckResult, MissingFile, ResultStatistics
-from missing_file_check.analyzers.pipeline import create_default_pipeline
+from missing_file_check.analyzers.pipeline import (
+    AnalysisPipeline,
+    create_default_pipeline,
+)
+from missing_file_check.analyzers import _cache as analyzer_cache
+from missing_file_check.analyzers._cache import clear_cache
 from missing_file_check.analyzers.ownership_analyzer import OwnershipAnalyzer
 from missing_file_check.analyzers.reason_analyzer import ReasonAnalyzer
 from missing_file_check.storage.report_generator import ReportGenerator
@@ -35,6 +41,41 @@ class TestAnalyzers:
         assert files[0].ownership == "team_alpha"
         assert files[1].ownership == "team_beta"
 
+    def test_ownership_api_answers_are_cached(self, monkeypatch):
+        """Test repeated paths are not sent to the ownership API again."""
+        clear_cache()
+        monkeypatch.setenv("OWNERSHIP_API_ENDPOINT", "http://owners.test")
+        requested = []
+
+        def fake_api(self, file_paths):
+            requested.extend(file_paths)
+            return {path: "team_api" for path in file_paths}
+
+        monkeypatch.setattr(OwnershipAnalyzer, "_call_ownership_api", fake_api)
+
+        OwnershipAnalyzer().analyze([MissingFile(path="a.py", status="missed")], {})
+        files = [
+            MissingFile(path="a.py", status="missed"),
+            MissingFile(path="b.py", status="missed"),
+        ]
+        OwnershipAnalyzer().analyze(files, {})
+
+        assert requested == ["a.py", "b.py"]
+        assert [f.ownership for f in files] == ["team_api", "team_api"]
+        clear_cache()
+
+    def test_analyzer_cache_entries_expire(self, monkeypatch):
+        """Test cached answers are dropped once their TTL has passed."""
+        now = [1000.0]
+        monkeypatch.setattr(analyzer_cache.time, "monotonic", lambda: now[0])
+        cache = analyzer_cache.AnalyzerCache(capacity=10, ttl=60)
+
+        cache.put_many({"a.py": "team_a"})
+        assert cache.get_many(["a.py", "b.py"]) == {"a.py": "team_a"}
+
+        now[0] += 61
+        assert cache.get_many(["a.py"]) == {}
+
     def test_reason_analyzer(self):
         """Test reason analyzer classifies miss reasons."""
         analyzer = ReasonAnalyzer()
@@ -85,6 +126,55 @@ class TestAnalyzers:
         assert files[0].ownership is not None
         assert files[0].miss_reason is not None
 
+    def test_pipeline_respects_dependencies(self, caplog):
+        """Test analyzers run after the analyzers they depend on."""
+        order = []
+
+        class Recorder(ReasonAnalyzer):
+            def __init__(self, name, depends_on=()):
+                self._name = name
+                self.depends_on = depends_on
+
+            @property
+            def name(self):
+                return self._name
+
+            def analyze(self, missing_files, context):
+                order.append(self._name)
+
+        pipeline = AnalysisPipeline(
+            [Recorder("late", ("early",)), Recorder("early"), Recorder("other")]
+        )
+        assert [[a.name for a in wave] for wave in pipeline._waves] == [
+            ["early", "other"],
+            ["late"],
+        ]
+
+        result = SimpleNamespace(missing_files=[MissingFile("a.py", "missed")])
+        pipeline.run(result, {})
+        assert sorted(order[:2]) == ["early", "other"]
+        assert order[2] == "late"
+
+        # A failing analyzer is logged without stopping the others
+        class Failing(Recorder):
+            def analyze(self, missing_files, context):
+                raise RuntimeError("boom")
+
+        order.clear()
+        pipeline.add_analyzer(Failing("failing"))
+        with caplog.at_level("WARNING"):
+            pipeline.run(result, {})
+        assert sorted(order) == ["early", "late", "other"]
+        assert "Analyzer failing failed: boom" in caplog.text
+
+        # Nothing to analyze: every analyzer is skipped
+        order.clear()
+        pipeline.run(SimpleNamespace(missing_files=[]), {})
+        assert order == []
+
+        with pytest.raises(ValueError, match="Circular"):
+            AnalysisPipeline([Recorder("a", ("b",)), Recorder("b", ("a",))])
+
 
 class TestReportGenerator:
     """Test report generation."""
@@ -183,6 +273,41 @@ class TestReportGenerator:
         assert len(data["missing_files"]) == 1
         assert data["missing_files"][0]["path"] == "test.py"
 
+    def test_generate_json_stream_matches_in_memory(self, tmp_path):
+        """Test streamed JSON report is identical to the in-memory one."""
+        generator = ReportGenerator()
+
+        files = [
+            MissingFile(path="a.py", status="missed", first_detected_at=datetime.now()),
+            MissingFile(path="文档/b.md", status="shielded", shielded_remark="文档"),
+        ]
+
+        result = CheckResult(
+            task_id="TEST-STREAM",
+            target_project_ids=["t1"],
+            baseline_project_ids=["b1"],
+            missing_files=files,
+            statistics=ResultStatistics(
+                missed_count=1,
+                failed_count=0,
+                passed_count=1,
+                shielded_count=1,
+                remapped_count=0,
+                target_file_count=10,
+                baseline_file_count=12,
+                target_project_count=1,
+                baseline_project_count=1,
+            ),
+            timestamp=datetime.now(),
+        )
+
+        json_content = generator.generate_json(result)
+        json_path = tmp_path / "report.json"
+        size = generator.generate_json_stream(result, json_path)
+
+        assert json_path.read_text(encoding="utf-8") == json_content
+        assert size == json_path.stat().st_size
+
     def test_generate_both(self, tmp_path):
         """Test generating both HTML and JSON reports."""
         generator = ReportGenerator()
@@ -90,6 +90,33 @@ class TestSimplifiedLocalAdapter:
         with pytest.raises(AdapterError, match="does not match"):
             adapter.fetch_files(commit_id="wrong_commit_id")
 
+    def test_rejected_build_skips_file_list(self, tmp_path, monkeypatch):
+        """Test a filter mismatch fails before the file list is read."""
+        build_info = tmp_path / "build.json"
+        build_info.write_text(
+            '{"project_id": "test", "build_info": {"commit_id": "abc"}}'
+        )
+        file_list = tmp_path / "files.json"
+        file_list.write_text('["/src/a.py"]')
+
+        config = ProjectConfig(
+            project_id="test",
+            project_name="Test",
+            project_type=ProjectType.LOCAL,
+            connection={
+                "build_info_file": str(build_info),
+                "file_list_file": str(file_list),
+            },
+        )
+        adapter = LocalProjectAdapter(config)
+
+        loads = []
+        monkeypatch.setattr(adapter, "_load_file_list", lambda: loads.append(1))
+
+        with pytest.raises(AdapterError, match="does not match"):
+            adapter.fetch_files(commit_id="other")
+        assert loads == []
+
     def test_version_filter(self):
         """Test b_version filter validation."""
         config = ProjectConfig(
@@ -170,6 +197,139 @@ class TestSimplifiedLocalAdapter:
         with pytest.raises(AdapterError, match="Unsupported file format"):
             adapter.fetch_files()
 
+    def test_csv_arrow_fast_path_matches_stdlib(self, tmp_path, monkeypatch):
+        """Test pyarrow CSV parsing yields the same entries as csv module."""
+        pytest.importorskip("pyarrow")
+        from missing_file_check.adapters import local_adapter
+
+        build_info = tmp_path / "build.json"
+        build_info.write_text('{"project_id": "test", "build_info": {}}')
+
+        file_list = tmp_path / "files.csv"
+        file_list.write_text(
+            "path,Status,file_path\n"
+            "/src/a.py,failed,\n"
+            ", ,\n"
+            ",,/src/c.py\n"
+            " /src/d.py ,,\n"
+        )
+
+        config = ProjectConfig(
+            project_id="test",
+            project_name="Test",
+            project_type=ProjectType.LOCAL,
+            connection={
+                "build_info_file": str(build_info),
+                "file_list_file": str(file_list),
+            },
+        )
+        adapter = LocalProjectAdapter(config)
+
+        stdlib_files = adapter._load_file_list_csv()
+        monkeypatch.setattr(local_adapter, "CSV_FAST_PATH_MIN_BYTES", 0)
+        arrow_files = adapter._load_file_list_csv()
+
+        monkeypatch.setenv("MISSING_FILE_CSV_ENGINE", "stdlib")
+        assert not adapter._use_arrow_csv()
+
+        assert arrow_files == stdlib_files
+        assert [f.path for f in arrow_files] == ["/src/a.py", "/src/c.py", "/src/d.py"]
+        assert [f.status for f in arrow_files] == ["failed", "success", "success"]
+
+    def test_fetch_reuses_cache_until_files_change(self, tmp_path):
+        """Test unchanged files are served from cache and edits invalidate it."""
+        build_info = tmp_path / "build.json"
+        build_info.write_text('{"project_id": "test", "build_info": {}}')
+        file_list = tmp_path / "files.json"
+        file_list.write_text('["/src/a.py"]')
+
+        config = ProjectConfig(
+            project_id="test",
+            project_name="Test",
+            project_type=ProjectType.LOCAL,
+            connection={
+                "build_info_file": str(build_info),
+                "file_list_file": str(file_list),
+            },
+        )
+        adapter = LocalProjectAdapter(config)
+
+        first = adapter.fetch_files()
+        first.files.clear()
+        second = adapter.fetch_files()
+        assert [f.path for f in second.files] == ["/src/a.py"]
+
+        file_list.write_text('["/src/a.py", "/src/b.py"]')
+        third = adapter.fetch_files()
+        assert [f.path for f in third.files] == ["/src/a.py", "/src/b.py"]
+
+    def test_fetch_reuses_disk_cache_across_processes(self, tmp_path, monkeypatch):
+        """Test a pickled scan result is served once memory is cleared."""
+        from missing_file_check.adapters._cache import clear_cache
+
+        monkeypatch.setenv("MISSING_FILE_CACHE_DIR", str(tmp_path / "cache"))
+        build_info = tmp_path / "build.json"
+        build_info.write_text('{"project_id": "test", "build_info": {}}')
+        file_list = tmp_path / "files.json"
+        file_list.write_text('["/src/a.py"]')
+
+        config = ProjectConfig(
+            project_id="test",
+            project_name="Test",
+            project_type=ProjectType.LOCAL,
+            connection={
+                "build_info_file": str(build_info),
+                "file_list_file": str(file_list),
+            },
+        )
+        LocalProjectAdapter(config).fetch_files()
+        clear_cache()
+
+        adapter = LocalProjectAdapter(config)
+        monkeypatch.setattr(adapter, "_load_file_list", lambda: [])
+        result = adapter.fetch_files()
+
+        assert [f.path for f in result.files] == ["/src/a.py"]
+        assert not list((tmp_path / "cache").glob("*.tmp"))
+        clear_cache()
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            '[{"path": "/src/a.py", "status": "failed"}, "/src/b.py", {}]',
+            '  {"files": [{"file_path": "/src/a.py", "status": "failed"}, '
+            '"/src/b.py"]}',
+        ],
+    )
+    def test_json_stream_path_matches_full_parse(self, tmp_path, monkeypatch, content):
+        """Test ijson streaming yields the same entries for both layouts."""
+        pytest.importorskip("ijson")
+        from missing_file_check.adapters import local_adapter
+
+        build_info = tmp_path / "build.json"
+        build_info.write_text('{"project_id": "test", "build_info": {}}')
+        file_list = tmp_path / "files.json"
+        file_list.write_text(content)
+
+        config = ProjectConfig(
+            project_id="test",
+            project_name="Test",
+            project_type=ProjectType.LOCAL,
+            connection={
+                "build_info_file": str(build_info),
+                "file_list_file": str(file_list),
+            },
+        )
+        adapter = LocalProjectAdapter(config)
+
+        full_files = adapter._load_file_list_json()
+        monkeypatch.setattr(local_adapter, "JSON_STREAM_MIN_BYTES", 0)
+        stream_files = adapter._load_file_list_json()
+
+        assert stream_files == full_files
+        assert [f.path for f in stream_files] == ["/src/a.py", "/src/b.py"]
+        assert [f.status for f in stream_files] == ["failed", "success"]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])